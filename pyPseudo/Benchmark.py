@@ -0,0 +1,80 @@
+import sys as System
+import tracemalloc as MemoryTracer
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.parser.Parser import Parser
+from pyPseudo.parser.Expression import Expression
+from pyPseudo.parser.Statement import Statement
+from pyPseudo.interpreter.Environment import Environment
+from pyPseudo.Utilities import readFile
+
+ENVIRONMENTS = 100000
+
+class Benchmark:
+
+    def __init__(self, args):
+        if len(args) == 0 or len(args) > 2 or (len(args) == 2 and not args[1].isdigit()):
+            print("Usage: python -m pyPseudo.Benchmark file [copies]")
+            return
+
+        copies = int(args[1]) if len(args) == 2 else 1
+        self._run("\n".join([readFile(args[0])] * copies), args[0])
+
+    def _run(self, source, path):
+        MemoryTracer.start()
+
+        start = self._allocated()
+        lexer = Lexer(source, path)
+        tokens = lexer.scanTokens()
+        tokenBytes = self._allocated() - start
+
+        start = self._allocated()
+        parser = Parser(tokens)
+        statements = parser.parse()
+        nodeBytes = self._allocated() - start
+
+        errors = lexer.getErrors() + parser.getErrors()
+        if len(errors) > 0:
+            MemoryTracer.stop()
+            for error in errors:
+                print(error.report())
+            return
+
+        #The program is never run, so this sizes a fixed chain of two slot environments rather than the program's own
+        start = self._allocated()
+        environment = None
+        for i in range(0, ENVIRONMENTS):
+            environment = Environment(environment)
+            environment.define("a", None)
+            environment.define("b", None)
+        environmentBytes = self._allocated() - start
+
+        MemoryTracer.stop()
+
+        nodes = self._countNodes(statements)
+        self._report("Tokens", len(tokens), tokenBytes)
+        self._report("AST nodes", nodes, nodeBytes)
+        self._report("Environments (synthetic)", ENVIRONMENTS, environmentBytes)
+
+    def _allocated(self):
+        return MemoryTracer.get_traced_memory()[0]
+
+    def _countNodes(self, value):
+        if isinstance(value, list):
+            return sum(self._countNodes(element) for element in value)
+
+        if isinstance(value, (Expression, Statement)):
+            return 1 + sum(self._countNodes(getattr(value, slot)) for slot in type(value).__slots__)
+
+        return 0
+
+    def _report(self, name, count, size):
+        perItem = size / count if count > 0 else 0
+        print("{0}: {1} ({2} bytes, {3:.1f} bytes each)".format(name, count, size, perItem))
+
+def main(arguments):
+    del arguments[0]
+    Benchmark(arguments)
+
+if __name__ == "__main__":
+    main(System.argv)
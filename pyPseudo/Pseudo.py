@@ -2,25 +2,54 @@ import sys as System
 import traceback as Traceback
 
 from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.lexer.RegexLexer import RegexLexer, crossCheck
+from pyPseudo.lexer.StreamingLexer import StreamingLexer
 from pyPseudo.parser.Parser import Parser
+from pyPseudo.parser.ModuleCache import ModuleCache
 from pyPseudo.resolver.Resolver import Resolver
+from pyPseudo.resolver.Resolution import Resolution
+from pyPseudo.cache.ProgramCache import ProgramCache
+from pyPseudo.optimiser.Optimiser import Optimiser
 from pyPseudo.interpreter.Interpreter import Interpreter
-from pyPseudo.Utilities import readFile
+from pyPseudo.compiler.ClosureInterpreter import ClosureInterpreter
+from pyPseudo.transpiler.TranspilingInterpreter import TranspilingInterpreter
+from pyPseudo.vm.VirtualMachine import VirtualMachine
+from pyPseudo.Utilities import readFile, openFile
 
 class Pseudo:
 
     def __init__(self, args):
-        self._interpreter = Interpreter()
-
-        if len(args) > 1:
-            print("Usage: python pseudo.py file")
+        flags = [arg for arg in args if arg.startswith("--")]
+        args = [arg for arg in args if not arg.startswith("--")]
+
+        interpreters = {
+            "--closures": ClosureInterpreter,
+            "--transpile": TranspilingInterpreter,
+            "--vm": VirtualMachine,
+            "--disassemble": lambda: VirtualMachine(True)
+        }
+        options = ["--optimise", "--regex-lexer", "--check-lexer", "--stream", "--cache"]
+        modes = [flag for flag in flags if flag in interpreters]
+        self._interpreter = interpreters[modes[-1]]() if len(modes) > 0 else Interpreter()
+        self._optimise = "--optimise" in flags
+        self._regexLexer = "--regex-lexer" in flags
+        self._checkLexer = "--check-lexer" in flags
+        self._stream = "--stream" in flags
+        self._cache = "--cache" in flags
+
+        if len(args) > 1 or any(flag not in interpreters and flag not in options for flag in flags):
+            print("Usage: python pseudo.py [--closures | --transpile | --vm | --disassemble] [--optimise] [--regex-lexer | --check-lexer | --stream] [--cache] file")
         elif len(args) == 1:
             self._runFile(args[0])
         else:
             self._runPrompt()
 
     def _runFile(self, path):
-        errors, runtimeErrors = self._run(readFile(path), path)
+        if self._stream:
+            with openFile(path) as file:
+                errors, runtimeErrors = self._run(file, path)
+        else:
+            errors, runtimeErrors = self._run(readFile(path), path)
 
         if errors:
             System.exit(65)
@@ -35,28 +64,58 @@ class Pseudo:
     def _run(self, source, path):
         lexerErrors, parserErrors, resolverErrors, interpreterErrors = [], [], [], []
 
-        lexer = Lexer(source, path)
-        tokens = lexer.scanTokens()
+        cache = ProgramCache(path) if self._cache and isinstance(source, str) and path != "INTERPRETER" else None
+        program = cache.load(source) if cache != None else None
+
+        if program != None:
+            statements, resolution = program
+        else:
+            if isinstance(source, str):
+                if self._checkLexer:
+                    mismatch = crossCheck(source, path)
+                    if mismatch != None:
+                        print(mismatch, file = System.stderr)
+
+                lexer = RegexLexer(source, path) if self._regexLexer or self._checkLexer else Lexer(source, path)
+                tokens = lexer.scanTokens()
+            else:
+                lexer = StreamingLexer(source, path, self._printError)
+                tokens = lexer.streamTokens()
+
+            #The program itself counts as linked, so a module importing it back is a no-op
+            modules = ModuleCache()
+            modules.add(path, None)
 
+            parser = Parser(tokens, self._printError if isinstance(lexer, StreamingLexer) else None, modules)
+            statements = parser.parse()
 
-        parser = Parser(tokens)
-        statements = parser.parse()
-        
-        lexerErrors, parserErrors = lexer.getErrors(), parser.getErrors()
-        self._printErrors(lexerErrors + parserErrors)
+            lexerErrors, parserErrors = lexer.getErrors(), parser.getErrors()
+            if not isinstance(lexer, StreamingLexer):
+                self._printErrors(lexerErrors + parserErrors)
 
-        if len(lexerErrors + parserErrors) > 0:
-            return lexerErrors + parserErrors + resolverErrors, interpreterErrors
+            if len(lexerErrors + parserErrors) > 0:
+                return lexerErrors + parserErrors + resolverErrors, interpreterErrors
 
 
-        resolver = Resolver(self._interpreter)
-        resolver.resolveSource(statements)
+            resolution = Resolution()
+            resolver = Resolver(resolution)
+            resolver.resolveSource(statements)
 
-        resolverErrors = resolver.getErrors()
-        self._printErrors(resolverErrors)
+            resolverErrors = resolver.getErrors()
+            self._printErrors(resolverErrors)
 
-        if len(resolverErrors) > 0:
-            return lexerErrors + parserErrors + resolverErrors, interpreterErrors
+            if len(resolverErrors) > 0:
+                return lexerErrors + parserErrors + resolverErrors, interpreterErrors
+
+            if cache != None:
+                cache.store(source, modules, statements, resolution)
+
+        resolution.resolveInto(self._interpreter)
+
+        if self._optimise:
+            optimiser = Optimiser(self._interpreter)
+            statements = optimiser.optimise(statements)
+            print("Optimiser rewrote {0} nodes.".format(optimiser.getRewrites()), file = System.stderr)
 
         self._interpreter.interpret(statements)
         interpreterErrors = self._interpreter.getErrors()
@@ -67,10 +126,13 @@ class Pseudo:
 
     def _printErrors(self, errors):
         for error in errors:
-            if hasattr(error, "report"):
-                print(error.report())
-            else:
-                print("Python Error: {0}".format(error))
+            self._printError(error)
+
+    def _printError(self, error):
+        if hasattr(error, "report"):
+            print(error.report())
+        else:
+            print("Python Error: {0}".format(error))
 
 def main(arguments):
     del arguments[0]
@@ -1,3 +1,15 @@
+from io import StringIO
+
+def openFile(path):
+    try:
+        return open(path, "r")
+    except:
+        print(
+            "{Error: Failed to load file. File doesn't exist or invalid file path, "
+            + "Message: Please check arguments or import strings.}"
+        )
+        return StringIO("")
+
 def readFile(path):
     try:
         with open(path, "r") as file:
@@ -0,0 +1,97 @@
+import gc as GarbageCollector
+import hashlib as HashLib
+import os as OS
+import pickle as Pickle
+import sys as System
+
+CACHE_DIRECTORY = "__pseudocache__"
+
+#Everything a cached program depends on, a change to any of these files invalidates every cache entry
+frontEnd = ["lexer", "parser", "resolver", OS.path.join("callable", "PseudoFunctions.py")]
+
+_version = None
+
+def version():
+    global _version
+    if _version == None:
+        digest = HashLib.sha256(System.version.encode())
+        package = OS.path.dirname(OS.path.dirname(OS.path.abspath(__file__)))
+        for entry in frontEnd:
+            path = OS.path.join(package, entry)
+            files = [OS.path.join(path, name) for name in sorted(OS.listdir(path)) if name.endswith(".py")] if OS.path.isdir(path) else [path]
+            for file in files:
+                with open(file, "rb") as source:
+                    digest.update(source.read())
+        _version = digest.hexdigest()
+
+    return _version
+
+def sourceKey(source):
+    return HashLib.sha256((version() + source).encode()).hexdigest()
+
+def fileKey(path):
+    try:
+        with open(path, "r") as file:
+            return sourceKey(file.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+class ProgramCache:
+    def __init__(self, path):
+        self._sourcePath = OS.path.abspath(path)
+        directory, name = OS.path.split(self._sourcePath)
+        self._path = OS.path.join(directory, CACHE_DIRECTORY, name + ".pickle")
+
+    def getPath(self):
+        return self._path
+
+    def load(self, source):
+        try:
+            with open(self._path, "rb") as file:
+                #The header is unpickled on its own so a stale entry never pays for loading the program
+                key, imports, dependencies = Pickle.load(file)
+                if key != sourceKey(source):
+                    return None
+
+                #Imports resolve against the working directory, so the same program run from elsewhere may link other files
+                for path, absolutePath in imports:
+                    if OS.path.abspath(path) != absolutePath:
+                        return None
+
+                for path, dependencyKey in dependencies:
+                    if fileKey(path) != dependencyKey:
+                        return None
+
+                #Unpickling allocates the whole tree at once, so the collector is paused rather than rescanning it on every threshold
+                collecting = GarbageCollector.isenabled()
+                GarbageCollector.disable()
+                try:
+                    return Pickle.load(file)
+                finally:
+                    if collecting:
+                        GarbageCollector.enable()
+        except Exception:
+            return None
+
+    def store(self, source, modules, statements, resolution):
+        dependencies = []
+        for path in modules.getPaths():
+            if path != self._sourcePath:
+                dependencyKey = fileKey(path)
+                if dependencyKey == None:
+                    return False
+                dependencies.append((path, dependencyKey))
+
+        #Write to a private file first so concurrent runs never read a half written entry
+        temporary = "{0}.{1}".format(self._path, OS.getpid())
+        try:
+            OS.makedirs(OS.path.dirname(self._path), exist_ok = True)
+            with open(temporary, "wb") as file:
+                Pickle.dump((sourceKey(source), modules.getImports(), dependencies), file, Pickle.HIGHEST_PROTOCOL)
+                Pickle.dump((statements, resolution), file, Pickle.HIGHEST_PROTOCOL)
+            OS.replace(temporary, self._path)
+            return True
+        except (OSError, Pickle.PicklingError, RecursionError):
+            if OS.path.exists(temporary):
+                OS.remove(temporary)
+            return False
@@ -0,0 +1,31 @@
+from pyPseudo.interpreter.Environment import Environment
+from pyPseudo.callable.PseudoFunction import PseudoFunction
+
+class CompiledFunction(PseudoFunction):
+    __slots__ = ("_body", "_arity")
+
+    def __init__(self, declaration, body, closure, isConstructor):
+        super().__init__(declaration, closure, isConstructor)
+        self._body = body
+        self._arity = len(declaration.getParameters())
+
+    def arity(self):
+        return self._arity
+
+    def _execute(self, interpreter, closure, arguments):
+        environment = Environment(closure)
+        environment.getValues().extend(arguments)
+
+        completion = self._body(environment)
+        if completion != None:
+            return completion.getValue()
+
+        if self._isConstructor:
+            return closure.getAt(0, 0)
+
+        return None
+
+    def bind(self, instance):
+        environment = Environment(self._closure)
+        environment.define("THIS", instance)
+        return CompiledFunction(self._declaration, self._body, environment, self._isConstructor)
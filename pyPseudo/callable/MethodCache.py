@@ -0,0 +1,25 @@
+from pyPseudo.callable.PseudoInstance import PseudoInstance
+
+class MethodCache:
+    def __init__(self, identifier):
+        self._identifier = identifier
+        self._lexeme = identifier.getLexeme()
+        self._shape = None
+        self._method = None
+
+    def getIdentifier(self):
+        return self._identifier
+
+    def lookUp(self, object):
+        if not isinstance(object, PseudoInstance):
+            return None
+
+        shape = object.getShape()
+        if shape is not self._shape:
+            self._shape = shape
+            if shape.lookUp(self._lexeme) != None:
+                self._method = None
+            else:
+                self._method = object.getPseudoClass().lookUpMethod(self._lexeme)
+
+        return self._method
@@ -0,0 +1,35 @@
+class PropertyCache:
+    __slots__ = ("_identifier", "_lexeme", "_shape", "_slot", "_next")
+
+    def __init__(self, identifier):
+        self._identifier = identifier
+        self._lexeme = identifier.getLexeme()
+        self._shape = None
+        self._slot = None
+        self._next = None
+
+    def getIdentifier(self):
+        return self._identifier
+
+    def get(self, instance):
+        if instance.getShape() is not self._shape:
+            self._cache(instance.getShape())
+
+        if self._slot == None:
+            return instance.get(self._identifier)
+
+        return instance.getValues()[self._slot]
+
+    def set(self, instance, value):
+        if instance.getShape() is not self._shape:
+            self._cache(instance.getShape())
+
+        if self._slot == None:
+            instance.extend(self._next, value)
+        else:
+            instance.getValues()[self._slot] = value
+
+    def _cache(self, shape):
+        self._shape = shape
+        self._slot = shape.lookUp(self._lexeme)
+        self._next = shape.transition(self._lexeme) if self._slot == None else None
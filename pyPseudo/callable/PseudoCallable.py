@@ -1,6 +1,8 @@
 from abc import ABC as Abstract, abstractmethod
 
 class PseudoCallable(Abstract):
+    __slots__ = ()
+
     @abstractmethod
     def arity(self):
         pass
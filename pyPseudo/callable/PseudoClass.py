@@ -1,5 +1,6 @@
 from pyPseudo.callable.PseudoCallable import PseudoCallable
 from pyPseudo.callable.PseudoInstance import PseudoInstance
+from pyPseudo.callable.Shape import Shape
 
 class PseudoClass(PseudoCallable):
 
@@ -7,30 +8,44 @@ class PseudoClass(PseudoCallable):
         self._identifier = identifier
         self._superClass = superClass
         self._methods = methods
+        self._shape = Shape()
 
     def getIdentifier(self):
         return self._identifier
 
+    def getShape(self):
+        return self._shape
+
     def findMethod(self, instance, identifier):
+        method = self.lookUpMethod(identifier)
+        if method != None:
+            return method.bind(instance)
+
+        return None
+
+    def lookUpMethod(self, identifier):
         if identifier in self._methods:
-            return self._methods[identifier].bind(instance)
+            return self._methods[identifier]
 
         if self._superClass != None:
-            return self._superClass.findMethod(instance, identifier)
+            return self._superClass.lookUpMethod(identifier)
 
         return None
 
+    def getConstructor(self):
+        return self._methods.get(self._identifier, None)
+
     def arity(self):
-        constructor = self._methods.get(self._identifier, None)
+        constructor = self.getConstructor()
         if constructor == None:
             return 0
         return constructor.arity()
 
     def call(self, interpreter, arguments, parentheses):
         instance = PseudoInstance(self)
-        constructor = self._methods.get(self._identifier, None)
+        constructor = self.getConstructor()
         if constructor != None:
-            constructor.bind(instance).call(interpreter, arguments, parentheses)
+            constructor.callMethod(interpreter, instance, arguments, parentheses)
         return instance
 
     def __str__(self):
@@ -1,8 +1,9 @@
-from pyPseudo.error.Return import Return
 from pyPseudo.interpreter.Environment import Environment
 from pyPseudo.callable.PseudoCallable import PseudoCallable
 
 class PseudoFunction(PseudoCallable):
+    __slots__ = ("_declaration", "_closure", "_isConstructor")
+
     def __init__(self, declaration, closure, isConstructor):
         self._declaration = declaration
         self._closure = closure
@@ -16,16 +17,30 @@ class PseudoFunction(PseudoCallable):
 
     def call(self, interpreter, arguments, parentheses):
         environment = Environment(self._closure)
-        for i in range(self.arity()):
-            environment.define(self._declaration.getParameters()[i].getLexeme(), arguments[i])
+        environment.getValues().extend(arguments)
+
+        completion = interpreter.executeBody(self._declaration.getBody(), environment)
+        if completion != None:
+            return completion.getValue()
+
+        if self._isConstructor:
+            return self._closure.getAt(0, 0)
+
+        return None
+
+    def callMethod(self, interpreter, instance, arguments, parentheses):
+        #Mirrors call rather than sharing a helper, so a method call costs no more frames than a function call
+        closure = Environment(self._closure)
+        closure.define("THIS", instance)
+        environment = Environment(closure)
+        environment.getValues().extend(arguments)
 
-        try:
-            interpreter.executeBody(self._declaration.getBody(), environment)
-        except Return as returnValue:
-            return returnValue.getValue()
+        completion = interpreter.executeBody(self._declaration.getBody(), environment)
+        if completion != None:
+            return completion.getValue()
 
         if self._isConstructor:
-            return self._closure.getAt(0, "THIS")
+            return instance
 
         return None
 
@@ -1,6 +1,11 @@
-from copy import deepcopy as DeepCopy
+from array import array as Array
+from bisect import bisect_left as bisectLeft
 
 from pyPseudo.interpreter.PseudoList import PseudoList
+from pyPseudo.interpreter.PseudoArray import PseudoArray
+from pyPseudo.interpreter.PseudoMap import PseudoMap
+from pyPseudo.interpreter.Rope import Rope
+from pyPseudo.interpreter.Number import isNumber
 from pyPseudo.error.RuntimeError import RuntimeError
 from pyPseudo.callable.PseudoCallable import PseudoCallable
 
@@ -9,9 +14,9 @@ class ROUND(PseudoCallable):
         return 1
 
     def call(self, interpreter, arguments, parentheses):
-        if not isinstance(arguments[0], float):
+        if not isNumber(arguments[0]):
             raise RuntimeError(parentheses, "Can only round numbers.")
-        return round(float(arguments[0]), 0)
+        return round(arguments[0])
 
 class STR(PseudoCallable):
     def arity(self):
@@ -42,10 +47,7 @@ class APPEND(PseudoCallable):
         if not isinstance(arguments[0], PseudoList):
             raise RuntimeError(parentheses, "Can only append to a list.")
 
-        pseudoList = DeepCopy(arguments[0]) #Deep copy is inefficient
-        pseudoList.getValues().append(arguments[1])
-
-        return PseudoList(pseudoList.getValues())
+        return arguments[0].append(arguments[1])
 
 class REMOVE(PseudoCallable):
     def arity(self):
@@ -55,11 +57,7 @@ class REMOVE(PseudoCallable):
         if not isinstance(arguments[0], PseudoList):
             raise RuntimeError(parentheses, "Can only remove elements from a list.")
 
-        pseudoList = DeepCopy(arguments[0])
-        pseudoList._checkIndex(parentheses, arguments[1]) #bad, using a private method but CBA
-        del pseudoList.getValues()[int(arguments[1])]
-
-        return PseudoList(pseudoList.getValues())
+        return arguments[0].remove(parentheses, arguments[1])
 
 
 class LENGTH(PseudoCallable):
@@ -67,9 +65,9 @@ class LENGTH(PseudoCallable):
         return 1
 
     def call(self, interpreter, arguments, parentheses):
-        if not isinstance(arguments[0], PseudoList) and not isinstance(arguments[0], str):
-            raise RuntimeError(parentheses, "Can only get length of a list or string.")
-        return float(len(arguments[0]))
+        if not isinstance(arguments[0], (PseudoList, PseudoArray, PseudoMap, str, Rope)):
+            raise RuntimeError(parentheses, "Can only get length of a list, array, map or string.")
+        return len(arguments[0])
 
 class SLICE(PseudoCallable):
     def arity(self):
@@ -79,15 +77,10 @@ class SLICE(PseudoCallable):
         if not isinstance(arguments[0], PseudoList):
             raise RuntimeError(parentheses, "Can only slice a list.")
 
-        if not isinstance(arguments[1], float) and not isinstance(arguments[2], float):
+        if not isNumber(arguments[1]) and not isNumber(arguments[2]):
             raise RuntimeError(parentheses, "Start and End indices must be numbers.")
 
-        pseudoList = DeepCopy(arguments[0])
-
-        pseudoList._checkIndex(parentheses, arguments[1])
-        pseudoList._checkIndex(parentheses, arguments[2])
-
-        return PseudoList(pseudoList.getValues()[int(arguments[1]) : int(arguments[2])])
+        return arguments[0].slice(parentheses, arguments[1], arguments[2])
 
 
 class INPUT(PseudoCallable):
@@ -95,10 +88,229 @@ class INPUT(PseudoCallable):
         return 1
 
     def call(self, interpreter, arguments, parentheses):
-        if not isinstance(arguments[0], str):
+        if not isinstance(arguments[0], (str, Rope)):
             raise RuntimeError(parentheses, "Input prompt must be a string.")
 
-        return input(arguments[0])
+        return input(str(arguments[0]))
+
+def filledArray(shape, fill, parentheses):
+    size = 1
+    for length in shape:
+        if not isNumber(length) or length < 0 or not length == int(length):
+            raise RuntimeError(parentheses, "Array dimensions must be non-negative integers.")
+        size *= int(length)
+
+    if not isNumber(fill):
+        raise RuntimeError(parentheses, "Array fill value must be a number.")
+
+    return PseudoArray(Array("d", [fill]) * size, tuple(int(length) for length in shape))
+
+class ARRAY(PseudoCallable):
+    def arity(self):
+        return 2
+
+    def call(self, interpreter, arguments, parentheses):
+        if isinstance(arguments[0], PseudoList):
+            if len(arguments[0]) == 0:
+                raise RuntimeError(parentheses, "Array dimensions must be non-negative integers.")
+            return filledArray(arguments[0].getValues(), arguments[1], parentheses)
+
+        return filledArray([arguments[0]], arguments[1], parentheses)
+
+class MATRIX(PseudoCallable):
+    def arity(self):
+        return 3
+
+    def call(self, interpreter, arguments, parentheses):
+        return filledArray(arguments[0 : 2], arguments[2], parentheses)
+
+def numbers(values, parentheses, name):
+    if isinstance(values, PseudoArray):
+        return values.getValues()
+
+    if isinstance(values, PseudoList) and all(isNumber(value) for value in values.getValues()):
+        return values.getValues()
+
+    raise RuntimeError(parentheses, "Can only {0} an array or a list of numbers.".format(name))
+
+class SUM(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        return sum(numbers(arguments[0], parentheses, "sum"))
+
+def ordered(values, parentheses, name):
+    #NULL orders before every other value, so it is split off and counted rather than compared
+    if isinstance(values, PseudoArray):
+        return 0, values.getValues(), None
+
+    if not isinstance(values, PseudoList):
+        raise RuntimeError(parentheses, "Can only {0} an array, a list of numbers or a list of strings.".format(name))
+
+    rest = [value for value in values.getValues() if value is not None]
+    nulls = len(values) - len(rest)
+
+    if all(isNumber(value) for value in rest):
+        return nulls, rest, None
+
+    if all(type(value) is str or type(value) is Rope for value in rest):
+        return nulls, rest, str
+
+    raise RuntimeError(parentheses, "Can only {0} an array, a list of numbers or a list of strings.".format(name))
+
+def oneDimensional(values, parentheses, name):
+    if isinstance(values, PseudoArray) and len(values.getShape()) != 1:
+        raise RuntimeError(parentheses, "Can only {0} a one-dimensional array.".format(name))
+
+class MIN(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        nulls, values, key = ordered(arguments[0], parentheses, "find the minimum of")
+        if nulls > 0:
+            return None
+        if len(values) == 0:
+            raise RuntimeError(parentheses, "Cannot find the minimum of an empty array.")
+        return min(values, key=key)
+
+class MAX(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        nulls, values, key = ordered(arguments[0], parentheses, "find the maximum of")
+        if len(values) == 0:
+            if nulls > 0:
+                return None
+            raise RuntimeError(parentheses, "Cannot find the maximum of an empty array.")
+        return max(values, key=key)
+
+class MEAN(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        values = numbers(arguments[0], parentheses, "find the mean of")
+        if len(values) == 0:
+            raise RuntimeError(parentheses, "Cannot find the mean of an empty array.")
+        return sum(values) / len(values)
+
+class SORT(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        oneDimensional(arguments[0], parentheses, "sort")
+        nulls, values, key = ordered(arguments[0], parentheses, "sort")
+
+        if isinstance(arguments[0], PseudoArray):
+            return PseudoArray(Array("d", sorted(values)))
+
+        return PseudoList([None] * nulls + sorted(values, key=key))
+
+class SEARCH(PseudoCallable):
+    def arity(self):
+        return 2
+
+    def call(self, interpreter, arguments, parentheses):
+        oneDimensional(arguments[0], parentheses, "search")
+        nulls, values, key = ordered(arguments[0], parentheses, "search")
+        target = arguments[1]
+
+        if target is None:
+            return 0 if nulls > 0 else -1
+
+        if key == str:
+            if not (type(target) is str or type(target) is Rope):
+                return -1
+            target = str(target)
+        elif not isNumber(target):
+            return -1
+
+        position = bisectLeft(values, target, key=key)
+        if position < len(values) and (values[position] if key == None else key(values[position])) == target:
+            return nulls + position
+
+        return -1
+
+class REVERSE(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        if isinstance(arguments[0], PseudoArray):
+            oneDimensional(arguments[0], parentheses, "reverse")
+            return PseudoArray(Array("d", reversed(arguments[0].getValues())))
+
+        if not isinstance(arguments[0], PseudoList):
+            raise RuntimeError(parentheses, "Can only reverse a list or an array.")
+
+        return arguments[0].reverse()
+
+class FILL(PseudoCallable):
+    def arity(self):
+        return 2
+
+    def call(self, interpreter, arguments, parentheses):
+        size = arguments[0]
+        if not isNumber(size) or size < 0 or not size == int(size):
+            raise RuntimeError(parentheses, "List size must be a non-negative integer.")
+
+        value = arguments[1]
+        if isinstance(value, (PseudoList, PseudoArray, PseudoMap)):
+            return PseudoList([value.copy() for i in range(int(size))])
+
+        return PseudoList([value] * int(size))
+
+class MAP(PseudoCallable):
+    def arity(self):
+        return 0
+
+    def call(self, interpreter, arguments, parentheses):
+        return PseudoMap()
+
+class GET(PseudoCallable):
+    def arity(self):
+        return 2
+
+    def call(self, interpreter, arguments, parentheses):
+        if not isinstance(arguments[0], PseudoMap):
+            raise RuntimeError(parentheses, "Can only get values from a map.")
+
+        return arguments[0].get(parentheses, arguments[1])
+
+class PUT(PseudoCallable):
+    def arity(self):
+        return 3
+
+    def call(self, interpreter, arguments, parentheses):
+        if not isinstance(arguments[0], PseudoMap):
+            raise RuntimeError(parentheses, "Can only put values into a map.")
+
+        arguments[0].put(parentheses, arguments[1], arguments[2])
+        return arguments[0]
+
+class HAS(PseudoCallable):
+    def arity(self):
+        return 2
+
+    def call(self, interpreter, arguments, parentheses):
+        if not isinstance(arguments[0], PseudoMap):
+            raise RuntimeError(parentheses, "Can only look up keys in a map.")
+
+        return arguments[0].has(parentheses, arguments[1])
+
+class KEYS(PseudoCallable):
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments, parentheses):
+        if not isinstance(arguments[0], PseudoMap):
+            raise RuntimeError(parentheses, "Can only get the keys of a map.")
+
+        return PseudoList(list(arguments[0].getValues().keys()))
 
 functions = {
     "ROUND": ROUND(),
@@ -107,5 +319,20 @@ functions = {
     "REMOVE": REMOVE(),
     "LENGTH": LENGTH(),
     "SLICE": SLICE(),
-    "INPUT": INPUT()
+    "INPUT": INPUT(),
+    "ARRAY": ARRAY(),
+    "MATRIX": MATRIX(),
+    "SUM": SUM(),
+    "MIN": MIN(),
+    "MAX": MAX(),
+    "MEAN": MEAN(),
+    "SORT": SORT(),
+    "SEARCH": SEARCH(),
+    "REVERSE": REVERSE(),
+    "FILL": FILL(),
+    "MAP": MAP(),
+    "GET": GET(),
+    "PUT": PUT(),
+    "HAS": HAS(),
+    "KEYS": KEYS()
 }
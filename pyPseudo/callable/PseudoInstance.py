@@ -1,14 +1,24 @@
 class PseudoInstance:
+    __slots__ = ("_pseudoClass", "_shape", "_values")
+
     def __init__(self, pseudoClass):
         self._pseudoClass = pseudoClass
-        self._properties = {}
+        self._shape = pseudoClass.getShape()
+        self._values = []
 
     def getPseudoClass(self):
         return self._pseudoClass
 
+    def getShape(self):
+        return self._shape
+
+    def getValues(self):
+        return self._values
+
     def get(self, identifier):
-        if identifier.getLexeme() in self._properties:
-            return self._properties[identifier.getLexeme()]
+        slot = self._shape.lookUp(identifier.getLexeme())
+        if slot != None:
+            return self._values[slot]
 
         method = self._pseudoClass.findMethod(self, identifier.getLexeme())
         if method != None:
@@ -17,7 +27,15 @@ class PseudoInstance:
         raise RuntimeError(identifier, "Undefined property '{0}'.".format(identifier.getLexeme()))
 
     def set(self, identifier, value):
-        self._properties[identifier.getLexeme()] = value
+        slot = self._shape.lookUp(identifier.getLexeme())
+        if slot != None:
+            self._values[slot] = value
+        else:
+            self.extend(self._shape.transition(identifier.getLexeme()), value)
+
+    def extend(self, shape, value):
+        self._shape = shape
+        self._values.append(value)
 
     def __str__(self):
         return str(self._pseudoClass) + " instance."
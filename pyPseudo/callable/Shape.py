@@ -0,0 +1,22 @@
+class Shape:
+    __slots__ = ("_slots", "_transitions")
+
+    def __init__(self, slots=None):
+        self._slots = slots if slots != None else {}
+        self._transitions = {}
+
+    def getSlots(self):
+        return self._slots
+
+    def lookUp(self, lexeme):
+        return self._slots.get(lexeme, None)
+
+    def transition(self, lexeme):
+        shape = self._transitions.get(lexeme, None)
+        if shape == None:
+            slots = dict(self._slots)
+            slots[lexeme] = len(slots)
+            shape = Shape(slots)
+            self._transitions[lexeme] = shape
+
+        return shape
@@ -0,0 +1,27 @@
+from functools import partial as Partial
+
+from pyPseudo.callable.PseudoCallable import PseudoCallable
+
+class TranspiledFunction(PseudoCallable):
+    __slots__ = ("_function", "_identifier", "_arity", "_isConstructor")
+
+    def __init__(self, function, identifier, arity, isConstructor):
+        self._function = function
+        self._identifier = identifier
+        self._arity = arity
+        self._isConstructor = isConstructor
+
+    def arity(self):
+        return self._arity
+
+    def call(self, interpreter, arguments, parentheses):
+        return self._function(*arguments)
+
+    def callMethod(self, interpreter, instance, arguments, parentheses):
+        return self._function(instance, *arguments)
+
+    def bind(self, instance):
+        return TranspiledFunction(Partial(self._function, instance), self._identifier, self._arity, self._isConstructor)
+
+    def __str__(self):
+        return "<FUNCTION  {0}>".format(self._identifier)
@@ -0,0 +1,569 @@
+import operator as Operator
+
+from pyPseudo.callable.PseudoCallable import PseudoCallable
+from pyPseudo.callable.PseudoInstance import PseudoInstance
+from pyPseudo.callable.PseudoClass import PseudoClass
+from pyPseudo.callable.CompiledFunction import CompiledFunction
+from pyPseudo.callable.MethodCache import MethodCache
+from pyPseudo.callable.PropertyCache import PropertyCache
+
+from pyPseudo.error.RuntimeError import RuntimeError
+from pyPseudo.interpreter.Return import Return
+
+from pyPseudo.lexer.TokenType import TokenType
+
+from pyPseudo.parser.Expression import ExpressionVisitor
+from pyPseudo.parser.Statement import StatementVisitor
+import pyPseudo.parser.Expression as Expression
+import pyPseudo.parser.Statement as Statement
+
+from pyPseudo.interpreter.Environment import Environment
+from pyPseudo.interpreter.PseudoList import PseudoList
+from pyPseudo.interpreter.Number import divide
+from pyPseudo.interpreter.Operators import binaryOperations, negate as negateOperation, loopBound, loopStep, loopConditions, loopSteps, indexableTypes
+
+from pyPseudo.resolver.ScopeType import ScopeType
+
+integerOperators = {
+    TokenType.PLUS: Operator.add,
+    TokenType.GREATER: Operator.gt,
+    TokenType.GREATER_EQUAL: Operator.ge,
+    TokenType.LESS: Operator.lt,
+    TokenType.LESS_EQUAL: Operator.le,
+    TokenType.MINUS: Operator.sub,
+    TokenType.SLASH: divide,
+    TokenType.STAR: Operator.mul
+}
+
+def isTruthy(object):
+    return object is not None and object is not False
+
+class ClosureCompiler(ExpressionVisitor, StatementVisitor):
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+
+    def compileProgram(self, statements):
+        return self._compileBody(statements)
+
+    def visitAssignExpression(self, expression):
+        value = self._compileExpression(expression.getValue())
+        identifier = expression.getIdentifier()
+        location = self._interpreter.getLocation(expression)
+
+        if location == None:
+            globals = self._interpreter.globals
+
+            def assignGlobal(environment):
+                result = value(environment)
+                globals.assign(identifier, result)
+                return result
+            return assignGlobal
+
+        distance, slot = location
+
+        if distance == 0:
+            def assignLocal(environment):
+                result = value(environment)
+                environment.getValues()[slot] = result
+                return result
+            return assignLocal
+
+        def assignAt(environment):
+            result = value(environment)
+            environment.assignAt(distance, slot, result)
+            return result
+        return assignAt
+
+    def visitVariableExpression(self, expression):
+        return self._compileLookUp(expression, expression.getIdentifier())
+
+    def visitGroupingExpression(self, expression):
+        return self._compileExpression(expression.getExpression())
+
+    def visitSetExpression(self, expression):
+        object = self._compileExpression(expression.getObject())
+        value = self._compileExpression(expression.getValue())
+        identifier = expression.getIdentifier()
+        cache = PropertyCache(identifier)
+
+        def setProperty(environment):
+            instance = object(environment)
+            if not isinstance(instance, PseudoInstance):
+                raise RuntimeError(identifier, "(Set) Only instances have properties.")
+
+            result = value(environment)
+            cache.set(instance, result)
+            return result
+        return setProperty
+
+    def visitLiteralExpression(self, expression):
+        value = expression.getValue()
+
+        def literal(environment):
+            return value
+        return literal
+
+    def visitLogicalExpression(self, expression):
+        left = self._compileExpression(expression.getLeft())
+        right = self._compileExpression(expression.getRight())
+
+        if expression.getOperator().getType() == TokenType.OR:
+            def logicalOr(environment):
+                result = left(environment)
+                if isTruthy(result):
+                    return result
+                return right(environment)
+            return logicalOr
+
+        def logicalAnd(environment):
+            result = left(environment)
+            if not isTruthy(result):
+                return result
+            return right(environment)
+        return logicalAnd
+
+    def visitBinaryExpression(self, expression):
+        left = self._compileExpression(expression.getLeft())
+        right = self._compileExpression(expression.getRight())
+        operator = expression.getOperator()
+        tokenType = operator.getType()
+        operation = binaryOperations[tokenType]
+
+        if tokenType == TokenType.EQUAL:
+            def equal(environment):
+                return left(environment) == right(environment)
+            return equal
+
+        if tokenType == TokenType.NOT_EQUAL:
+            def notEqual(environment):
+                return not left(environment) == right(environment)
+            return notEqual
+
+        fastOperation = integerOperators[tokenType]
+
+        def binary(environment):
+            leftValue = left(environment)
+            rightValue = right(environment)
+            if type(leftValue) is int and type(rightValue) is int:
+                return fastOperation(leftValue, rightValue)
+            return operation(leftValue, rightValue, operator)
+        return binary
+
+    def visitUnaryExpression(self, expression):
+        right = self._compileExpression(expression.getRight())
+        operator = expression.getOperator()
+
+        if operator.getType() == TokenType.MINUS:
+            def negate(environment):
+                value = right(environment)
+                if type(value) is int:
+                    return - value
+                return negateOperation(value, operator)
+            return negate
+
+        def logicalNot(environment):
+            return not isTruthy(right(environment))
+        return logicalNot
+
+    def visitCallExpression(self, expression):
+        if isinstance(expression.getCaller(), Expression.Get):
+            return self._compileInvoke(expression)
+
+        caller = self._compileExpression(expression.getCaller())
+        arguments = [self._compileExpression(argument) for argument in expression.getArguments()]
+        parentheses = expression.getParentheses()
+        interpreter = self._interpreter
+
+        def call(environment):
+            callee = caller(environment)
+            values = [argument(environment) for argument in arguments]
+
+            if not isinstance(callee, PseudoCallable):
+                raise RuntimeError(parentheses, "Can only call function and classes.")
+
+            if len(values) != callee.arity():
+                raise RuntimeError(parentheses, "Expected {0} arguments, but got {1} arguments".format(callee.arity(), len(values)))
+
+            return callee.call(interpreter, values, parentheses)
+        return call
+
+    def visitGetExpression(self, expression):
+        object = self._compileExpression(expression.getObject())
+        identifier = expression.getIdentifier()
+        cache = PropertyCache(identifier)
+
+        def get(environment):
+            instance = object(environment)
+            if isinstance(instance, PseudoInstance):
+                return cache.get(instance)
+
+            raise RuntimeError(identifier, "(Get) Only instances have properties.")
+        return get
+
+    def visitThisExpression(self, expression):
+        return self._compileLookUp(expression, expression.getKeyword())
+
+    def visitSuperExpression(self, expression):
+        distance = self._interpreter.getLocation(expression)[0]
+        method = expression.getMethod()
+
+        def superMethod(environment):
+            superClass = environment.getAt(distance, 0)
+            object = environment.getAt(distance - 1, 0)
+
+            function = superClass.findMethod(object, method.getLexeme())
+            if function == None:
+                raise RuntimeError(method, "Undefined property '{0}'.".format(method.getLexeme()))
+
+            return function
+        return superMethod
+
+    def visitGetIndexExpression(self, expression):
+        object = self._compileExpression(expression.getObject())
+        indices = [self._compileExpression(index) for index in expression.getIndices()]
+        brackets = expression.getBrackets()
+
+        def getIndex(environment):
+            pseudoList = object(environment)
+            if not isinstance(pseudoList, indexableTypes):
+                raise RuntimeError(brackets, "(Get) Only lists can be indexed.")
+
+            return pseudoList.index(brackets, [index(environment) for index in indices])
+        return getIndex
+
+    def visitListExpression(self, expression):
+        values = [self._compileExpression(value) for value in expression.getValues()]
+
+        def makeList(environment):
+            return PseudoList([value(environment) for value in values])
+        return makeList
+
+    def visitSetIndexExpression(self, expression):
+        object = self._compileExpression(expression.getObject())
+        indices = [self._compileExpression(index) for index in expression.getIndices()]
+        value = self._compileExpression(expression.getValue())
+        brackets = expression.getBrackets()
+
+        def setIndex(environment):
+            pseudoList = object(environment)
+            if not isinstance(pseudoList, indexableTypes):
+                raise RuntimeError(brackets, "(Set) Only lists can be indexed.")
+
+            positions = [index(environment) for index in indices]
+            pseudoList.set(brackets, positions, value(environment))
+        return setIndex
+
+    def visitClassStatement(self, statement):
+        identifier = statement.getIdentifier()
+        name = identifier.getLexeme()
+        superClassExpression = statement.getSuperClass()
+        superClass = None if superClassExpression == None else self._compileExpression(superClassExpression)
+        methods = [(method, self._compileFunctionBody(method)) for method in statement.getMethods()]
+        location = self._interpreter.getLocation(statement)
+
+        def defineClass(environment):
+            environment.define(name, None)
+            parent = None
+            scope = environment
+            if superClass != None:
+                parent = superClass(environment)
+                if not isinstance(parent, PseudoClass):
+                    raise RuntimeError(superClassExpression.getIdentifier(), "Super class must be a class.")
+                scope = Environment(environment)
+                scope.define("SUPER", parent)
+
+            functions = {}
+            for method, body in methods:
+                methodName = method.getIdentifier().getLexeme()
+                functions[methodName] = CompiledFunction(method, body, scope, methodName == name)
+
+            pseudoClass = PseudoClass(name, parent, functions)
+            if location != None:
+                environment.getValues()[location[1]] = pseudoClass
+            else:
+                environment.assign(identifier, pseudoClass)
+        return defineClass
+
+    def visitFunctionStatement(self, statement):
+        name = statement.getIdentifier().getLexeme()
+        body = self._compileFunctionBody(statement)
+
+        def defineFunction(environment):
+            environment.define(name, CompiledFunction(statement, body, environment, False))
+        return defineFunction
+
+    def visitReturnStatement(self, statement):
+        if statement.getValue() == None:
+            def returnNothing(environment):
+                return Return(None)
+            return returnNothing
+
+        value = self._compileExpression(statement.getValue())
+
+        def returnValue(environment):
+            return Return(value(environment))
+        return returnValue
+
+    def visitExpressionStatement(self, statement):
+        # Results are discarded by _compileBody, so the expression closure
+        # can stand in for the statement directly.
+        return self._compileExpression(statement.getExpression())
+
+    def visitVariableStatement(self, statement):
+        name = statement.getIdentifier().getLexeme()
+
+        if statement.getInitializer() == None:
+            def declare(environment):
+                environment.define(name, None)
+            return declare
+
+        initializer = self._compileExpression(statement.getInitializer())
+
+        def define(environment):
+            environment.define(name, initializer(environment))
+        return define
+
+    def visitIfStatement(self, statement):
+        if not isinstance(statement.getCondition(), Expression.Logical):
+            def invalidCondition(environment):
+                raise RuntimeError(statement.getCondition(), "Expect logical expression as operator")
+            return invalidCondition
+
+        condition = self._compileExpression(statement.getCondition())
+        scopeTypes = self._interpreter.getScopeTypes(statement)
+        thenBranch = self._compileScope(statement.getThenBranch(), scopeTypes[0])
+
+        if statement.getElseBranch() == None:
+            def ifThen(environment):
+                if isTruthy(condition(environment)):
+                    return thenBranch(environment)
+            return ifThen
+
+        elseBranch = self._compileScope(statement.getElseBranch(), scopeTypes[1])
+
+        def ifThenElse(environment):
+            if isTruthy(condition(environment)):
+                return thenBranch(environment)
+            return elseBranch(environment)
+        return ifThenElse
+
+    def visitWhileStatement(self, statement):
+        return self._compileLoop(statement.getCondition(), statement.getBody(), self._interpreter.getScopeTypes(statement)[0])
+
+    def visitForStatement(self, statement):
+        initializer = self._compileStatement(statement.getInitializer())
+        identifier = statement.getInitializer().getIdentifier()
+        lookUp = self._compileLookUp(statement, identifier)
+        store = self._compileStore(statement, identifier)
+        boundValue = self._compileExpression(statement.getBound())
+        stepValue = self._compileExpression(statement.getStep()) if statement.getStep() != None else None
+        body = self._compileBody(statement.getBody())
+        scopeType = self._interpreter.getScopeTypes(statement)[0]
+
+        direction = statement.getDirection()
+        compare = loopConditions[direction.getType()]
+        increment = loopSteps[direction.getType()]
+        fastCompare = Operator.le if direction.getType() == TokenType.TO else Operator.ge
+        fastIncrement = Operator.add if direction.getType() == TokenType.TO else Operator.sub
+
+        def countedLoop(environment):
+            initializer(environment)
+            bound = loopBound(boundValue(environment), direction)
+            step = loopStep(stepValue(environment), direction) if stepValue != None else 1
+            integral = type(bound) is int and type(step) is int
+            shared = Environment(environment) if scopeType == ScopeType.SHARED else None
+
+            while True:
+                counter = lookUp(environment)
+                if integral and type(counter) is int:
+                    if not fastCompare(counter, bound):
+                        return
+                elif not compare(counter, bound, direction):
+                    return
+
+                if scopeType == ScopeType.NONE:
+                    completion = body(environment)
+                elif shared != None:
+                    shared.getValues().clear()
+                    completion = body(shared)
+                else:
+                    completion = body(Environment(environment))
+                if completion != None:
+                    return completion
+
+                counter = lookUp(environment)
+                if integral and type(counter) is int:
+                    store(environment, fastIncrement(counter, step))
+                else:
+                    store(environment, increment(counter, step, direction))
+        return countedLoop
+
+    def visitOutputStatement(self, statement):
+        value = self._compileExpression(statement.getExpression())
+        stringify = self._interpreter.stringify
+
+        def output(environment):
+            print(stringify(value(environment)))
+        return output
+
+    def _compileExpression(self, expression):
+        return expression.accept(self)
+
+    def _compileStatement(self, statement):
+        return statement.accept(self)
+
+    def _compileFunctionBody(self, declaration):
+        return self._compileBody(declaration.getBody())
+
+    def _compileBody(self, statements):
+        compiled = [(self._compileStatement(statement), self._canReturn(statement)) for statement in statements]
+
+        if not any(canReturn for _, canReturn in compiled):
+            closures = [closure for closure, _ in compiled]
+
+            def body(environment):
+                for closure in closures:
+                    closure(environment)
+            return body
+
+        def returningBody(environment):
+            for closure, canReturn in compiled:
+                if canReturn:
+                    completion = closure(environment)
+                    if completion != None:
+                        return completion
+                else:
+                    closure(environment)
+        return returningBody
+
+    def _compileScope(self, statements, scopeType):
+        body = self._compileBody(statements)
+        if scopeType == ScopeType.NONE:
+            return body
+
+        def scoped(environment):
+            return body(Environment(environment))
+        return scoped
+
+    def _compileLoop(self, condition, statements, scopeType):
+        condition = self._compileExpression(condition)
+        body = self._compileBody(statements)
+
+        if scopeType == ScopeType.NONE:
+            def loop(environment):
+                while isTruthy(condition(environment)):
+                    completion = body(environment)
+                    if completion != None:
+                        return completion
+            return loop
+
+        if scopeType == ScopeType.SHARED:
+            def sharedLoop(environment):
+                scope = Environment(environment)
+                values = scope.getValues()
+                while isTruthy(condition(environment)):
+                    values.clear()
+                    completion = body(scope)
+                    if completion != None:
+                        return completion
+            return sharedLoop
+
+        def freshLoop(environment):
+            while isTruthy(condition(environment)):
+                completion = body(Environment(environment))
+                if completion != None:
+                    return completion
+        return freshLoop
+
+    def _compileInvoke(self, expression):
+        object = self._compileExpression(expression.getCaller().getObject())
+        identifier = expression.getCaller().getIdentifier()
+        arguments = [self._compileExpression(argument) for argument in expression.getArguments()]
+        parentheses = expression.getParentheses()
+        interpreter = self._interpreter
+        cache = MethodCache(identifier)
+
+        def invoke(environment):
+            receiver = object(environment)
+            method = cache.lookUp(receiver)
+
+            if method == None:
+                if not isinstance(receiver, PseudoInstance):
+                    raise RuntimeError(identifier, "(Get) Only instances have properties.")
+                callee = receiver.get(identifier)
+                values = [argument(environment) for argument in arguments]
+
+                if not isinstance(callee, PseudoCallable):
+                    raise RuntimeError(parentheses, "Can only call function and classes.")
+
+                if len(values) != callee.arity():
+                    raise RuntimeError(parentheses, "Expected {0} arguments, but got {1} arguments".format(callee.arity(), len(values)))
+
+                return callee.call(interpreter, values, parentheses)
+
+            values = [argument(environment) for argument in arguments]
+            if len(values) != method.arity():
+                raise RuntimeError(parentheses, "Expected {0} arguments, but got {1} arguments".format(method.arity(), len(values)))
+
+            return method.callMethod(interpreter, receiver, values, parentheses)
+        return invoke
+
+    def _canReturn(self, statement):
+        if isinstance(statement, Statement.Return):
+            return True
+
+        if isinstance(statement, Statement.If):
+            branches = statement.getThenBranch() + (statement.getElseBranch() or [])
+            return any(self._canReturn(branch) for branch in branches)
+
+        if isinstance(statement, (Statement.While, Statement.For)):
+            return any(self._canReturn(branch) for branch in statement.getBody())
+
+        return False
+
+    def _compileStore(self, expression, identifier):
+        location = self._interpreter.getLocation(expression)
+
+        if location == None:
+            globals = self._interpreter.globals
+
+            def storeGlobal(environment, value):
+                globals.assign(identifier, value)
+            return storeGlobal
+
+        distance, slot = location
+
+        if distance == 0:
+            def storeLocal(environment, value):
+                environment.getValues()[slot] = value
+            return storeLocal
+
+        def storeAt(environment, value):
+            environment.assignAt(distance, slot, value)
+        return storeAt
+
+    def _compileLookUp(self, expression, identifier):
+        location = self._interpreter.getLocation(expression)
+
+        if location == None:
+            globals = self._interpreter.globals
+
+            def lookUpGlobal(environment):
+                return globals.get(identifier)
+            return lookUpGlobal
+
+        distance, slot = location
+
+        if distance == 0:
+            def lookUpLocal(environment):
+                return environment.getValues()[slot]
+            return lookUpLocal
+
+        if distance == 1:
+            def lookUpEnclosing(environment):
+                return environment.getEnclosing().getValues()[slot]
+            return lookUpEnclosing
+
+        def lookUpAt(environment):
+            return environment.getAt(distance, slot)
+        return lookUpAt
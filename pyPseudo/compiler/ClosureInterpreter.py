@@ -0,0 +1,16 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.interpreter.Interpreter import Interpreter
+from pyPseudo.compiler.ClosureCompiler import ClosureCompiler
+
+class ClosureInterpreter(Interpreter):
+    def __init__(self):
+        super().__init__()
+        self._compiler = ClosureCompiler(self)
+
+    def interpret(self, statements):
+        try:
+            program = self._compiler.compileProgram(statements)
+            program(self._environment)
+        except (RuntimeError, Exception) as error:
+            self._error(error)
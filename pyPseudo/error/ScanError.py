@@ -5,4 +5,4 @@ class ScanError(Exception):
         self._message = message
 
     def report(self):
-        return "File: {0}, Line: {1},  Message: {3}.".format(self._path, self._line, self._message)
+        return "File: {0}, Line: {1},  Message: {2}.".format(self._path, self._line, self._message)
@@ -0,0 +1,6 @@
+class TranspileError(Exception):
+    def __init__(self, message):
+        self._message = message
+
+    def getMessage(self):
+        return self._message
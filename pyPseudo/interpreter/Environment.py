@@ -1,10 +1,9 @@
-from pyPseudo.error.RuntimeError import RuntimeError
-
 class Environment:
+    __slots__ = ("_enclosing", "_values")
 
     def __init__(self, enclosing=None):
         self._enclosing = enclosing
-        self._values = {}
+        self._values = []
 
     def getValues(self):
         return self._values
@@ -12,38 +11,18 @@ class Environment:
     def getEnclosing(self):
         return self._enclosing
 
-    def get(self, identifier):
-        if identifier.getLexeme() in self._values:
-            return self._values[identifier.getLexeme()]
-
-        if self._enclosing != None:
-            return self._enclosing.get(identifier)
-
-        raise RuntimeError(identifier, "Undefined vairable '{0}'.".format(identifier.getLexeme()))
-
-    def assign(self, identifier, value):
-        if identifier.getLexeme() in self._values:
-            self._values[identifier.getLexeme()] = value
-            return
-
-        if self._enclosing != None:
-            self._enclosing.assign(identifier, value)
-            return
-
-        raise RuntimeError(identifier, "Undefined vairable '{0}'.".format(identifier.getLexeme()))
-
     def define(self, identifier, value):
-        self._values[identifier] = value
+        self._values.append(value)
 
-    def getAt(self, distance, identifier):
-        return self._ancestor(distance).getValues()[identifier]
+    def getAt(self, distance, slot):
+        return self._ancestor(distance)._values[slot]
 
     def _ancestor(self, distance):
         environment = self
         for i in range(0, distance):
-            environment = environment.getEnclosing()
+            environment = environment._enclosing
 
         return environment
 
-    def assignAt(self, distance, identifier, value):
-        self._ancestor(distance).getValues()[identifier.getLexeme()] = value
+    def assignAt(self, distance, slot, value):
+        self._ancestor(distance)._values[slot] = value
@@ -0,0 +1,29 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+
+class GlobalEnvironment:
+    __slots__ = ("_values",)
+
+    def __init__(self):
+        self._values = {}
+
+    def getValues(self):
+        return self._values
+
+    def getEnclosing(self):
+        return None
+
+    def get(self, identifier):
+        if identifier.getLexeme() in self._values:
+            return self._values[identifier.getLexeme()]
+
+        raise RuntimeError(identifier, "Undefined vairable '{0}'.".format(identifier.getLexeme()))
+
+    def assign(self, identifier, value):
+        if identifier.getLexeme() in self._values:
+            self._values[identifier.getLexeme()] = value
+            return
+
+        raise RuntimeError(identifier, "Undefined vairable '{0}'.".format(identifier.getLexeme()))
+
+    def define(self, identifier, value):
+        self._values[identifier] = value
@@ -3,9 +3,11 @@ from pyPseudo.callable.PseudoInstance import PseudoInstance
 from pyPseudo.callable.PseudoClass import PseudoClass
 from pyPseudo.callable.PseudoFunction import PseudoFunction
 from pyPseudo.callable.PseudoFunctions import functions
+from pyPseudo.callable.MethodCache import MethodCache
+from pyPseudo.callable.PropertyCache import PropertyCache
 
 from pyPseudo.error.RuntimeError import RuntimeError
-from pyPseudo.error.Return import Return
+from pyPseudo.interpreter.Return import Return
 
 from pyPseudo.lexer.TokenType import TokenType
 
@@ -14,13 +16,20 @@ from pyPseudo.parser.Statement import StatementVisitor
 import pyPseudo.parser.Expression as Expression
 
 from pyPseudo.interpreter.Environment import Environment
+from pyPseudo.interpreter.GlobalEnvironment import GlobalEnvironment
 from pyPseudo.interpreter.PseudoList import PseudoList
+from pyPseudo.interpreter.Operators import binaryOperations, unaryOperations, loopBound, loopStep, loopConditions, loopSteps, indexableTypes
+
+from pyPseudo.resolver.ScopeType import ScopeType
 
 class Interpreter(ExpressionVisitor, StatementVisitor):
     def __init__(self):
-        self.globals = Environment()
+        self.globals = GlobalEnvironment()
         self._environment = self.globals
         self._locals = {}
+        self._scopeTypes = {}
+        self._methodCaches = {}
+        self._propertyCaches = {}
         self._errors = []
 
         for function in functions.keys():
@@ -39,13 +48,7 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
 
     def visitAssignExpression(self, expression):
         value = self._evaluateExpression(expression.getValue())
-        distance = self._locals.get(expression, None)
-
-        if distance != None:
-            self._environment.assignAt(distance, expression.getIdentifier(), value)
-        else:
-            self.globals.assign(expression.getIdentifier(), value)
-
+        self._assignVariable(expression, expression.getIdentifier(), value)
         return value
 
     def visitVariableExpression(self, expression):
@@ -61,7 +64,7 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
             raise RuntimeError(expression.getIdentifer(), "(Set) Only instances have properties.")
 
         value = self._evaluateExpression(expression.getValue())
-        object.set(expression.getIdentifier(), value)
+        self._propertyCache(expression).set(object, value)
         return value
 
     def visitLiteralExpression(self, expression):
@@ -82,61 +85,36 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
     def visitBinaryExpression(self, expression):
         left = self._evaluateExpression(expression.getLeft())
         right = self._evaluateExpression(expression.getRight())
-        type = expression.getOperator().getType()
-
-        if type == TokenType.GREATER:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) > float(right)
-        elif type == TokenType.GREATER_EQUAL:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) >= float(right)
-        elif type == TokenType.LESS:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) < float(right)
-        elif type == TokenType.LESS_EQUAL:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) <= float(right)
-        elif type == TokenType.NOT_EQUAL:
-            return not self._isEqual(left, right)
-        elif type == TokenType.EQUAL:
-            return self._isEqual(left, right)
-        elif type == TokenType.MINUS:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) - float(right)
-        elif type == TokenType.SLASH:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) / float(right)
-        elif type == TokenType.STAR:
-            self._checkNumberOperands(expression.getOperator(), left, right)
-            return float(left) * float(right)
-        elif type == TokenType.PLUS:
-            if isinstance(left, float) and isinstance(right, float):
-                return float(left) + float(right)
-
-            if isinstance(left, str) and isinstance(right, str):
-                return str(left) + str(right)
-
-            if isinstance(left, PseudoList) and isinstance(right, PseudoList):
-                return PseudoList(left.getValues() + right.getValues())
-
-            raise RuntimeError(expression.getOperator(), "Operands must be two numbers, two strings or two lists for addition.")
+        return binaryOperations[expression.getOperator().getType()](left, right, expression.getOperator())
 
     def visitUnaryExpression(self, expression):
         right = self._evaluateExpression(expression.getRight())
-        type = expression.getOperator().getType()
-
-        if type == TokenType.MINUS:
-            self._checkNumberOperand(expression.getOperator(), right)
-            return - float(right)
-        elif type == TokenType.NOT:
-            return not self._isTruthy(right)
+        return unaryOperations[expression.getOperator().getType()](right, expression.getOperator())
 
     def visitCallExpression(self, expression):
-        caller = self._evaluateExpression(expression.getCaller())
+        #Dispatch stays inline, every extra frame here lowers the Pseudo recursion depth the tree walker can reach
+        get = expression.getCaller()
+        if isinstance(get, Expression.Get):
+            object = self._evaluateExpression(get.getObject())
 
-        arguments = []
-        for argument in expression.getArguments():
-            arguments.append(self._evaluateExpression(argument))
+            cache = self._methodCaches.get(get, None)
+            if cache == None:
+                cache = MethodCache(get.getIdentifier())
+                self._methodCaches[get] = cache
+
+            method = cache.lookUp(object)
+            if method != None:
+                arguments = self._evaluateArguments(expression)
+                if len(arguments) != method.arity():
+                    raise RuntimeError(expression.getParentheses(), "Expected {0} arguments, but got {1} arguments".format(method.arity(), len(arguments)))
+
+                return method.callMethod(self, object, arguments, expression.getParentheses())
+
+            caller = self._getProperty(object, self._propertyCache(get))
+        else:
+            caller = self._evaluateExpression(get)
+
+        arguments = self._evaluateArguments(expression)
 
         if not isinstance(caller, PseudoCallable):
             raise RuntimeError(expression.getParentheses(), "Can only call function and classes.")
@@ -147,19 +125,15 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
         return caller.call(self, arguments, expression.getParentheses())
 
     def visitGetExpression(self, expression):
-        object = self._evaluateExpression(expression.getObject())
-        if isinstance(object, PseudoInstance):
-            return object.get(expression.getIdentifier())
-
-        raise RuntimeError(expression.getIdentifier(), "(Get) Only instances have properties.")
+        return self._getProperty(self._evaluateExpression(expression.getObject()), self._propertyCache(expression))
 
     def visitThisExpression(self, expression):
         return self._lookUpVariable(expression, expression.getKeyword())
 
     def visitSuperExpression(self, expression):
-        distance = self._locals.get(expression, None)
-        superClass = self._environment.getAt(distance, "SUPER")
-        object = self._environment.getAt(distance - 1, "THIS")
+        distance = self._locals.get(expression, None)[0]
+        superClass = self._environment.getAt(distance, 0)
+        object = self._environment.getAt(distance - 1, 0)
 
         method = superClass.findMethod(object, expression.getMethod().getLexeme())
         if method == None:
@@ -169,7 +143,7 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
 
     def visitGetIndexExpression(self, expression):
         pseudoList = self._evaluateExpression(expression.getObject())
-        if not isinstance(pseudoList, PseudoList):
+        if not isinstance(pseudoList, indexableTypes):
             raise RuntimeError(expression.getBrackets(), "(Get) Only lists can be indexed.")
 
         indices = [self._evaluateExpression(index) for index in expression.getIndices()]
@@ -186,7 +160,7 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
     def visitSetIndexExpression(self, expression):
         pseudoList = self._evaluateExpression(expression.getObject())
 
-        if not isinstance(pseudoList, PseudoList):
+        if not isinstance(pseudoList, indexableTypes):
             raise RuntimeError(expression.getBrackets(), "(Set) Only lists can be indexed.")
 
         indices = [self._evaluateExpression(index) for index in expression.getIndices()]
@@ -214,7 +188,11 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
         if superClass != None:
             self._environment = self._environment.getEnclosing()
 
-        self._environment.assign(statement.getIdentifier(), pseudoClass)
+        location = self._locals.get(statement, None)
+        if location != None:
+            self._environment.assignAt(location[0], location[1], pseudoClass)
+        else:
+            self.globals.assign(statement.getIdentifier(), pseudoClass)
 
     def visitFunctionStatement(self, statement):
         function = PseudoFunction(statement, self._environment, False)
@@ -225,7 +203,7 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
         if statement.getValue() != None:
             value = self._evaluateExpression(statement.getValue())
 
-        raise Return(value)
+        return Return(value)
 
     def visitExpressionStatement(self, statement):
         self._evaluateExpression(statement.getExpression())
@@ -241,29 +219,63 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
         if not isinstance(statement.getCondition(), Expression.Logical):
             raise RuntimeError(statement.getCondition(), "Expect logical expression as operator")
 
+        scopeTypes = self._scopeTypes[statement]
         if self._isTruthy(self._evaluateExpression(statement.getCondition())):
-            self.executeBody(statement.getThenBranch(), Environment(self._environment))
+            return self._executeScope(statement.getThenBranch(), scopeTypes[0])
         elif statement.getElseBranch() != None:
-            self.executeBody(statement.getElseBranch(), Environment(self._environment))
+            return self._executeScope(statement.getElseBranch(), scopeTypes[1])
 
     def visitWhileStatement(self, statement):
-        while self._isTruthy(self._evaluateExpression(statement.getCondition())):
-            self.executeBody(statement.getBody(), Environment(self._environment))
+        condition = statement.getCondition()
+        return self._executeLoop(lambda: self._isTruthy(self._evaluateExpression(condition)), statement.getBody(), self._scopeTypes[statement][0])
 
     def visitForStatement(self, statement):
         self._executeStatement(statement.getInitializer()) #statement
-        while self._isTruthy(self._evaluateExpression(statement.getCondition())):
-            self.executeBody(statement.getBody(), Environment(self._environment))
+
+        identifier = statement.getInitializer().getIdentifier()
+        direction = statement.getDirection()
+        bound = loopBound(self._evaluateExpression(statement.getBound()), direction)
+        step = loopStep(self._evaluateExpression(statement.getStep()), direction) if statement.getStep() != None else 1
+        compare = loopConditions[direction.getType()]
+        increment = loopSteps[direction.getType()]
+
+        def condition():
+            return compare(self._lookUpVariable(statement, identifier), bound, direction)
+
+        def advance():
+            self._assignVariable(statement, identifier, increment(self._lookUpVariable(statement, identifier), step, direction))
+
+        return self._executeLoop(condition, statement.getBody(), self._scopeTypes[statement][0], advance)
 
     def visitOutputStatement(self, statement):
         value = self._evaluateExpression(statement.getExpression())
-        print(self._stringify(value))
+        print(self.stringify(value))
 
     def _evaluateExpression(self, expression):
         return expression.accept(self)
 
+    def _evaluateArguments(self, expression):
+        arguments = []
+        for argument in expression.getArguments():
+            arguments.append(self._evaluateExpression(argument))
+        return arguments
+
+    def _getProperty(self, object, cache):
+        if isinstance(object, PseudoInstance):
+            return cache.get(object)
+
+        raise RuntimeError(cache.getIdentifier(), "(Get) Only instances have properties.")
+
+    def _propertyCache(self, expression):
+        cache = self._propertyCaches.get(expression, None)
+        if cache == None:
+            cache = PropertyCache(expression.getIdentifier())
+            self._propertyCaches[expression] = cache
+
+        return cache
+
     def _executeStatement(self, statement):
-        statement.accept(self)
+        return statement.accept(self)
 
     def _isTruthy(self, object):
         if object == None:
@@ -274,31 +286,55 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
 
         return True
 
-    def _isEqual(self, left, right):
-        return left == right
-
-    def _checkNumberOperand(self, operator, operand):
-        if isinstance(operand, float):
-            return
-
-        raise RuntimeError(operator, "Operand must be a number.")
-
-    def _checkNumberOperands(self, operator, left, right):
-        if isinstance(left, float) and isinstance(right, float):
-            return
-
-        raise RuntimeError(operator, "Operands must a number.")
+    def _executeScope(self, statements, scopeType):
+        if scopeType == ScopeType.NONE:
+            for statement in statements:
+                completion = self._executeStatement(statement)
+                if completion != None:
+                    return completion
+            return None
+
+        return self.executeBody(statements, Environment(self._environment))
+
+    def _executeLoop(self, condition, body, scopeType, advance=None):
+        if scopeType == ScopeType.NONE:
+            while condition():
+                for statement in body:
+                    completion = self._executeStatement(statement)
+                    if completion != None:
+                        return completion
+                if advance != None:
+                    advance()
+        elif scopeType == ScopeType.SHARED:
+            environment = Environment(self._environment)
+            values = environment.getValues()
+            while condition():
+                values.clear()
+                completion = self.executeBody(body, environment)
+                if completion != None:
+                    return completion
+                if advance != None:
+                    advance()
+        else:
+            while condition():
+                completion = self.executeBody(body, Environment(self._environment))
+                if completion != None:
+                    return completion
+                if advance != None:
+                    advance()
 
     def executeBody(self, statements, environment):
         previous = self._environment
+        self._environment = environment
         try:
-            self._environment = environment
             for statement in statements:
-                self._executeStatement(statement)
+                completion = self._executeStatement(statement)
+                if completion != None:
+                    return completion
         finally:
             self._environment = previous
 
-    def _stringify(self, object):
+    def stringify(self, object):
         if object == None:
             return "NULL"
 
@@ -315,15 +351,42 @@ class Interpreter(ExpressionVisitor, StatementVisitor):
 
         return str(object)
 
-    def resolve(self, expression, depth):
-        self._locals[expression] = depth
+    def resolve(self, expression, depth, slot):
+        self._locals[expression] = (depth, slot)
+
+    def resolveAll(self, locals, scopeTypes):
+        self._locals.update(locals)
+        self._scopeTypes.update(scopeTypes)
+
+    def getLocation(self, expression):
+        return self._locals.get(expression, None)
+
+    def resolveScopes(self, statement, scopeTypes):
+        self._scopeTypes[statement] = scopeTypes
+
+    def getScopeTypes(self, statement):
+        return self._scopeTypes[statement]
+
+    def copyResolution(self, original, replacement):
+        if original in self._locals:
+            self._locals[replacement] = self._locals[original]
+
+        if original in self._scopeTypes:
+            self._scopeTypes[replacement] = self._scopeTypes[original]
 
     def _lookUpVariable(self, expression, identifier):
-        distance = self._locals.get(expression, None)
-        if distance != None:
-            return self._environment.getAt(distance, identifier.getLexeme())
+        location = self._locals.get(expression, None)
+        if location != None:
+            return self._environment.getAt(location[0], location[1])
         else:
             return self.globals.get(identifier)
 
+    def _assignVariable(self, expression, identifier, value):
+        location = self._locals.get(expression, None)
+        if location != None:
+            self._environment.assignAt(location[0], location[1], value)
+        else:
+            self.globals.assign(identifier, value)
+
     def _error(self, error):
         self._errors.append(error)
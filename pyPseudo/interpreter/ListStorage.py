@@ -0,0 +1,56 @@
+from weakref import ref as WeakReference
+
+class ListStorage:
+    __slots__ = ("_values", "_hasNested", "_views", "_limit")
+
+    def __init__(self, values, hasNested):
+        self._values = values
+        self._hasNested = hasNested
+        self._views = []
+        self._limit = 8
+
+    def getValues(self):
+        return self._values
+
+    def hasNested(self):
+        return self._hasNested
+
+    def markNested(self):
+        self._hasNested = True
+
+    def attach(self, view):
+        self._views.append(WeakReference(view))
+
+        #Views that are only read never reach isExclusive, so dead references are also dropped whenever the list doubles
+        if len(self._views) >= self._limit:
+            self._views = [reference for reference in self._views if reference() is not None]
+            self._limit = max(2 * len(self._views), 8)
+
+    def detach(self, view):
+        self._views = [reference for reference in self._views if reference() is not view]
+
+    def compact(self, count):
+        #Drops the first count values, which no live view can see, and rebases every view onto what is left
+        del self._values[ : count]
+        for reference in self._views:
+            view = reference()
+            if view is not None:
+                view.rebase(count)
+
+    def isExclusive(self, view, start, end):
+        #True when no other live view can see any position in [start, end)
+        live = []
+        exclusive = True
+        for reference in self._views:
+            other = reference()
+            if other is None:
+                continue
+
+            live.append(reference)
+            if other is not view:
+                otherStart, otherEnd = other.getSpan()
+                if otherStart < end and start < otherEnd:
+                    exclusive = False
+
+        self._views = live
+        return exclusive
@@ -0,0 +1,16 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+
+def isNumber(object):
+    return type(object) is int or type(object) is float
+
+def divide(left, right):
+    return float(left) / float(right)
+
+def checkIndex(brackets, index, length):
+    if type(index) is not int and (not isNumber(index) or not index == int(index)):
+        raise RuntimeError(brackets, "Index not integer '{0}'.".format(index))
+
+    if index < 0 or index > length - 1:
+        raise RuntimeError(brackets, "Index not in range. length: '{0}', Index: '{1}'.".format(length, index))
+
+    return int(index)
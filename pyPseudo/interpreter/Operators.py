@@ -0,0 +1,121 @@
+import operator as Operator
+from array import array as Array
+from itertools import repeat as Repeat
+
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.lexer.TokenType import TokenType
+
+from pyPseudo.interpreter.PseudoList import PseudoList
+from pyPseudo.interpreter.PseudoArray import PseudoArray
+from pyPseudo.interpreter.PseudoMap import PseudoMap
+from pyPseudo.interpreter.Rope import Rope, concatenateStrings
+from pyPseudo.interpreter.Number import isNumber, divide
+
+numberTypes = [int, float]
+
+def numericVariants(operation):
+    return {(left, right): operation for left in numberTypes for right in numberTypes}
+
+def concatenate(left, right):
+    return PseudoList(left.getValues() + right.getValues())
+
+def elementwise(operation, message):
+    def apply(left, right, operator):
+        if type(left) is PseudoArray:
+            if type(right) is PseudoArray:
+                if left.getShape() != right.getShape():
+                    raise RuntimeError(operator, "Arrays must have the same shape.")
+                return PseudoArray(Array("d", map(operation, left.getValues(), right.getValues())), left.getShape())
+
+            if isNumber(right):
+                return PseudoArray(Array("d", map(operation, left.getValues(), Repeat(right))), left.getShape())
+
+        elif type(right) is PseudoArray and isNumber(left):
+            return PseudoArray(Array("d", map(operation, Repeat(left), right.getValues())), right.getShape())
+
+        raise RuntimeError(operator, message)
+    return apply
+
+def numericOperation(operation, arrayOperation=None):
+    variants = numericVariants(operation)
+    fallback = elementwise(arrayOperation, "Operands must a number.") if arrayOperation != None else None
+
+    def apply(left, right, operator):
+        variant = variants.get((type(left), type(right)), None)
+        if variant == None:
+            if fallback != None:
+                return fallback(left, right, operator)
+            raise RuntimeError(operator, "Operands must a number.")
+        return variant(left, right)
+    return apply
+
+additions = numericVariants(Operator.add)
+for left in [str, Rope]:
+    for right in [str, Rope]:
+        additions[(left, right)] = concatenateStrings
+additions[(PseudoList, PseudoList)] = concatenate
+
+addArrays = elementwise(Operator.add, "Operands must be two numbers, two strings or two lists for addition.")
+
+def add(left, right, operator):
+    variant = additions.get((type(left), type(right)), None)
+    if variant == None:
+        return addArrays(left, right, operator)
+    return variant(left, right)
+
+def equal(left, right, operator):
+    return left == right
+
+def notEqual(left, right, operator):
+    return not left == right
+
+def negate(value, operator):
+    if isNumber(value):
+        return - value
+    if type(value) is PseudoArray:
+        return PseudoArray(Array("d", map(Operator.neg, value.getValues())), value.getShape())
+    raise RuntimeError(operator, "Operand must be a number.")
+
+def logicalNot(value, operator):
+    return value is None or value is False
+
+binaryOperations = {
+    TokenType.GREATER: numericOperation(Operator.gt),
+    TokenType.GREATER_EQUAL: numericOperation(Operator.ge),
+    TokenType.LESS: numericOperation(Operator.lt),
+    TokenType.LESS_EQUAL: numericOperation(Operator.le),
+    TokenType.MINUS: numericOperation(Operator.sub, Operator.sub),
+    TokenType.SLASH: numericOperation(divide, Operator.truediv),
+    TokenType.STAR: numericOperation(Operator.mul, Operator.mul),
+    TokenType.PLUS: add,
+    TokenType.EQUAL: equal,
+    TokenType.NOT_EQUAL: notEqual
+}
+
+unaryOperations = {
+    TokenType.MINUS: negate,
+    TokenType.NOT: logicalNot
+}
+
+indexableTypes = (PseudoList, PseudoArray, PseudoMap)
+
+def loopBound(value, direction):
+    if isNumber(value):
+        return value
+    raise RuntimeError(direction, "FOR loop bounds must be numbers.")
+
+def loopStep(value, direction):
+    if loopBound(value, direction) > 0:
+        return value
+    raise RuntimeError(direction, "FOR loop step must be positive.")
+
+loopConditions = {
+    TokenType.TO: binaryOperations[TokenType.LESS_EQUAL],
+    TokenType.DOWNTO: binaryOperations[TokenType.GREATER_EQUAL]
+}
+
+loopSteps = {
+    TokenType.TO: add,
+    TokenType.DOWNTO: binaryOperations[TokenType.MINUS]
+}
@@ -0,0 +1,73 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.interpreter.Number import isNumber, checkIndex
+
+class PseudoArray:
+    __slots__ = ("_values", "_shape", "_strides")
+
+    def __init__(self, values, shape=None):
+        self._values = values
+        self._shape = shape if shape != None else (len(values),)
+
+        strides = []
+        stride = 1
+        for length in reversed(self._shape):
+            strides.insert(0, stride)
+            stride *= length
+        self._strides = tuple(strides)
+
+    def getValues(self):
+        return self._values
+
+    def getShape(self):
+        return self._shape
+
+    def __len__(self):
+        return self._shape[0]
+
+    def copy(self):
+        return PseudoArray(self._values[ : ], self._shape)
+
+    def index(self, brackets, indices):
+        return self._values[self._offset(brackets, indices)]
+
+    def set(self, brackets, indices, value):
+        offset = self._offset(brackets, indices)
+        if not isNumber(value):
+            raise RuntimeError(brackets, "Array elements must be numbers.")
+
+        self._values[offset] = value
+
+    def _offset(self, brackets, indices):
+        shape = self._shape
+        if len(indices) != len(shape):
+            raise RuntimeError(brackets, "Expected {0} indices, but got {1} indices.".format(len(shape), len(indices)))
+
+        if len(shape) == 1:
+            index = indices[0]
+            if type(index) is int and 0 <= index < shape[0]:
+                return index
+            return checkIndex(brackets, index, shape[0])
+
+        if len(shape) == 2:
+            row, column = indices
+            if not (type(row) is int and 0 <= row < shape[0]):
+                row = checkIndex(brackets, row, shape[0])
+            if not (type(column) is int and 0 <= column < shape[1]):
+                column = checkIndex(brackets, column, shape[1])
+            return row * shape[1] + column
+
+        offset = 0
+        for index, length, stride in zip(indices, shape, self._strides):
+            offset += checkIndex(brackets, index, length) * stride
+        return offset
+
+    def __str__(self):
+        return self._format(0, 0)
+
+    def _format(self, dimension, offset):
+        if dimension == len(self._shape) - 1:
+            return "{" + ", ".join([str(value) for value in self._values[offset : offset + self._shape[dimension]]]) + "}"
+
+        stride = self._strides[dimension]
+        return "{" + ", ".join([self._format(dimension + 1, offset + i * stride) for i in range(self._shape[dimension])]) + "}"
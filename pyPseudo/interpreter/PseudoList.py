@@ -1,39 +1,131 @@
-from pyPseudo.error.RuntimeError import RuntimeError
+from pyPseudo.interpreter.Number import checkIndex
+from pyPseudo.interpreter.ListStorage import ListStorage
+from pyPseudo.interpreter.PseudoArray import PseudoArray
+from pyPseudo.interpreter.PseudoMap import PseudoMap
+
+def isNested(value):
+    #Values with their own mutable storage, the results of APPEND, SLICE, REMOVE and copy() each need their own copy
+    return isinstance(value, (PseudoList, PseudoArray, PseudoMap))
 
 class PseudoList:
-    def __init__(self, values):
+    __slots__ = ("_values", "_offset", "_length", "_storage", "__weakref__")
+
+    def __init__(self, values, length=None, storage=None, offset=0):
+        if storage == None:
+            storage = ListStorage(values, any(isNested(value) for value in values))
+
         self._values = values
+        self._offset = offset
+        self._length = len(values) if length == None else length
+        self._storage = storage
+        storage.attach(self)
 
     def getValues(self):
-        return self._values
+        if self._offset == 0 and self._length == len(self._values):
+            return self._values
+        return self._values[self._offset : self._offset + self._length]
+
+    def getSpan(self):
+        return self._offset, self._offset + self._length
+
+    def rebase(self, count):
+        self._offset = max(self._offset - count, 0)
 
     def __len__(self):
-        return len(self._values)
+        return self._length
 
     def index(self, brackets, indices):
-        index = indices.pop(0)
-
-        self._checkIndex(brackets, index)
+        index = self._checkIndex(brackets, indices.pop(0))
 
-        value = self._values[int(index)]
+        value = self._values[self._offset + index]
         return value.index(brackets, indices) if len(indices) > 0 else value
 
     def set(self, brackets, indices, value):
-        index = indices.pop(0)
-        self._checkIndex(brackets, index)
+        index = self._checkIndex(brackets, indices.pop(0))
 
         if len(indices) > 0:
-            self._values[int(index)].set(brackets, indices, value)
+            self._values[self._offset + index].set(brackets, indices, value)
         else:
-            self._values[int(index)] = value
+            position = self._offset + index
+            if not self._storage.isExclusive(self, position, position + 1):
+                self._detach()
+                position = index
+            self._values[position] = value
+            if isNested(value):
+                self._storage.markNested()
 
+    def append(self, value):
+        storage = self._storage
+        if not storage.hasNested():
+            self._compact()
 
-    def _checkIndex(self, brackets, index):
-        if not isinstance(index, float) or not index == int(index):
-            raise RuntimeError(brackets, "Index not integer '{0}'.".format(index))
+        end = self._offset + self._length
+        if not storage.hasNested() and end <= len(self._values) and storage.isExclusive(self, end, len(self._values) + 1):
+            del self._values[end : ]
+            self._values.append(value)
+            if isNested(value):
+                storage.markNested()
+            return PseudoList(self._values, self._length + 1, storage, self._offset)
+
+        values = self._copyValues(0, self._length)
+        values.append(value)
+        return PseudoList(values)
+
+    def remove(self, brackets, index):
+        index = self._checkIndex(brackets, index)
+
+        if not self._storage.hasNested():
+            if index == self._length - 1:
+                return PseudoList(self._values, index, self._storage, self._offset)
+            if index == 0:
+                self._compact()
+                return PseudoList(self._values, self._length - 1, self._storage, self._offset + 1)
+
+        values = self._copyValues(0, self._length)
+        del values[index]
+        return PseudoList(values)
 
-        if index < 0 or index > len(self) - 1:
-            raise RuntimeError(brackets, "Index not in range. length: '{0}', Index: '{1}'.".format(len(self), index))
+    def slice(self, brackets, start, end):
+        start = self._checkIndex(brackets, start)
+        end = self._checkIndex(brackets, end)
+
+        if not self._storage.hasNested():
+            return PseudoList(self._values, max(end - start, 0), self._storage, self._offset + start)
+
+        return PseudoList(self._copyValues(start, end))
+
+    def reverse(self):
+        values = self._copyValues(0, self._length)
+        values.reverse()
+        return PseudoList(values)
+
+    def copy(self):
+        if not self._storage.hasNested():
+            return PseudoList(self._values, self._length, self._storage, self._offset)
+
+        return PseudoList(self._copyValues(0, self._length))
+
+    def _copyValues(self, start, end):
+        values = self._values[self._offset + start : self._offset + end]
+        if self._storage.hasNested():
+            return [value.copy() if isNested(value) else value for value in values]
+        return values
+
+    def _compact(self):
+        #Once the dead prefix left by REMOVE(l, 0) is over half the storage it is released, so queues stay proportional to their live values
+        offset = self._offset
+        if offset * 2 > len(self._values) and self._storage.isExclusive(self, 0, offset):
+            self._storage.compact(offset)
+
+    def _detach(self):
+        self._storage.detach(self)
+        self._values = self._values[self._offset : self._offset + self._length]
+        self._offset = 0
+        self._storage = ListStorage(self._values, self._storage.hasNested())
+        self._storage.attach(self)
+
+    def _checkIndex(self, brackets, index):
+        return checkIndex(brackets, index, self._length)
 
     def __str__(self):
-        return "{" + ", ".join([str(value) for value in self._values]) + "}"
+        return "{" + ", ".join([str(float(value)) if type(value) is int else str(value) for value in self.getValues()]) + "}"
@@ -0,0 +1,57 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.interpreter.Number import isNumber
+from pyPseudo.interpreter.Rope import Rope
+
+class PseudoMap:
+    __slots__ = ("_values",)
+
+    def __init__(self, values=None):
+        self._values = values if values != None else {}
+
+    def getValues(self):
+        return self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    def copy(self):
+        return PseudoMap(dict(self._values))
+
+    def has(self, brackets, key):
+        return self._key(brackets, key) in self._values
+
+    def get(self, brackets, key):
+        key = self._key(brackets, key)
+        if key not in self._values:
+            raise RuntimeError(brackets, "Key not in map '{0}'.".format(self._format(key)))
+
+        return self._values[key]
+
+    def put(self, brackets, key, value):
+        self._values[self._key(brackets, key)] = value
+
+    def index(self, brackets, indices):
+        value = self.get(brackets, indices.pop(0))
+        return value.index(brackets, indices) if len(indices) > 0 else value
+
+    def set(self, brackets, indices, value):
+        if len(indices) > 1:
+            self.get(brackets, indices.pop(0)).set(brackets, indices, value)
+        else:
+            self.put(brackets, indices[0], value)
+
+    def _key(self, brackets, key):
+        if type(key) is str or isNumber(key):
+            return key
+
+        if type(key) is Rope:
+            return str(key)
+
+        raise RuntimeError(brackets, "Map keys must be numbers or strings.")
+
+    def _format(self, value):
+        return str(float(value)) if type(value) is int else str(value)
+
+    def __str__(self):
+        return "{" + ", ".join([self._format(key) + ": " + self._format(value) for key, value in self._values.items()]) + "}"
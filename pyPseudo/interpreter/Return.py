@@ -1,6 +1,6 @@
-class Return(Exception):
+class Return:
     def __init__(self, value):
         self._value = value
 
     def getValue(self):
-        return self._value
\ No newline at end of file
+        return self._value
@@ -0,0 +1,51 @@
+ropeThreshold = 256
+
+class Rope:
+    __slots__ = ("_left", "_right", "_length", "_text")
+
+    def __init__(self, left, right):
+        self._left = left
+        self._right = right
+        self._length = len(left) + len(right)
+        self._text = None
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        if self._text == None:
+            self._text = self._flatten()
+            self._left = None
+            self._right = None
+
+        return self._text
+
+    def _flatten(self):
+        #Walk the tree iteratively, deep left-leaning ropes would overflow the Python stack
+        parts = []
+        pending = [self]
+        while len(pending) > 0:
+            node = pending.pop()
+            if type(node) is str:
+                parts.append(node)
+            elif node._text != None:
+                parts.append(node._text)
+            else:
+                pending.append(node._right)
+                pending.append(node._left)
+
+        return "".join(parts)
+
+    def __eq__(self, other):
+        if isinstance(other, (Rope, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+def concatenateStrings(left, right):
+    if type(left) is str and type(right) is str and len(left) + len(right) < ropeThreshold:
+        return left + right
+
+    return Rope(left, right)
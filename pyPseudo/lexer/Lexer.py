@@ -89,7 +89,7 @@ class Lexer:
             elif self._isAlpha(character):
                 self._identifier()
             else:
-                self._error(self._path, self._line, "Unexpected character")
+                self._error("Unexpected character")
 
     def _identifier(self):
         while not self._isAtEnd() and self._isAlphaNumeric(self._peek()):
@@ -108,7 +108,8 @@ class Lexer:
             while self._isDigit(self._peek()):
                 self._move()
 
-        literal = float(self._source[self._start : self._current])
+        text = self._source[self._start : self._current]
+        literal = float(text) if "." in text else int(text)
         self._addTokenLiteral(TokenType.NUMBER, literal)
 
     def _string(self):
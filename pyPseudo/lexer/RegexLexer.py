@@ -0,0 +1,143 @@
+import re as Regex
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.lexer.Token import Token
+from pyPseudo.lexer.TokenType import TokenType, keywords
+
+operators = {
+    "(": TokenType.LEFT_PAREN,
+    ")": TokenType.RIGHT_PAREN,
+    "[": TokenType.LEFT_SQUARE,
+    "]": TokenType.RIGHT_SQUARE,
+    "{": TokenType.LEFT_BRACE,
+    "}": TokenType.RIGHT_BRACE,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    "-": TokenType.MINUS,
+    "+": TokenType.PLUS,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "<-": TokenType.LEFT_ARROW,
+    "<=": TokenType.LESS_EQUAL,
+    "<>": TokenType.NOT_EQUAL,
+    "<": TokenType.LESS,
+    ">=": TokenType.GREATER_EQUAL,
+    ">": TokenType.GREATER,
+    "=": TokenType.EQUAL
+}
+
+NEWLINE, SPACE, COMMENT, NUMBER, IDENTIFIER, STRING, UNTERMINATED, OPERATOR, OTHER = range(1, 10)
+
+pattern = Regex.compile(
+    r"(\n)"
+    r"|([ \r\t;]+)"
+    r"|(//[^\n]*)"
+    r"|([0-9]+(?:\.[0-9]+)?)"
+    r"|([A-Za-z][A-Za-z0-9]*)"
+    r"|(\"[^\"]*\")"
+    r"|(\"[^\"]*)"
+    r"|(<-|<=|<>|>=|[()\[\]{},.\-+*/<>=])"
+    r"|(.)"
+)
+
+class RegexLexer(Lexer):
+    def scanTokens(self):
+        self._tokens = list(self._generateTokens(None))
+        return self._tokens
+
+    def _generateTokens(self, read):
+        #read supplies further lines of source, or is None when the whole source is already in memory
+        source = self._source
+        path = self._path
+        pending = self._tokens
+        match = pattern.match
+        end = len(source)
+        position = 0
+
+        while True:
+            if position >= end:
+                source = read() if read != None else ""
+                if source == "":
+                    break
+
+                self._source = source
+                end = len(source)
+                position = 0
+
+            token = match(source, position)
+            group = token.lastindex
+
+            if group == UNTERMINATED and read != None:
+                more = read()
+                if more == "":
+                    read = None
+                else:
+                    source = source[position : ] + more
+                    self._source = source
+                    end = len(source)
+                    position = 0
+                continue
+
+            start = position
+            position = token.end()
+
+            if group == NEWLINE:
+                self._line += 1
+            elif group == SPACE or group == COMMENT:
+                pass
+            elif group == IDENTIFIER or group == NUMBER:
+                if position < end and not source[position].isascii() or \
+                    group == NUMBER and position + 1 < end and source[position] == "." and not source[position + 1].isascii():
+                    position = self._scanFallback(start)
+                    while len(pending) > 0:
+                        yield pending.pop()
+                    continue
+
+                lexeme = token.group(group)
+                if group == IDENTIFIER:
+                    yield Token(keywords.get(lexeme, TokenType.IDENTIFIER), lexeme, None, path, self._line)
+                else:
+                    yield Token(TokenType.NUMBER, lexeme, float(lexeme) if "." in lexeme else int(lexeme), path, self._line)
+            elif group == OPERATOR:
+                lexeme = token.group(group)
+                yield Token(operators[lexeme], lexeme, None, path, self._line)
+            elif group == STRING:
+                lexeme = token.group(group)
+                self._line += lexeme.count("\n")
+                yield Token(TokenType.STRING, lexeme, lexeme[1 : -1], path, self._line)
+            elif group == UNTERMINATED:
+                self._line += token.group(group).count("\n")
+                self._error("Unterminated string")
+            else:
+                position = self._scanFallback(start)
+                while len(pending) > 0:
+                    yield pending.pop()
+
+        self._current = position
+        yield Token(TokenType.EOF, "", None, path, self._line)
+
+    def _scanFallback(self, start):
+        #Characters outside the ASCII table go through the character scanner so isalpha/isdigit agree exactly
+        self._start = start
+        self._current = start
+        self._scanToken()
+        return self._current
+
+def crossCheck(source, path):
+    expected, actual = Lexer(source, path), RegexLexer(source, path)
+    expectedTokens, actualTokens = expected.scanTokens(), actual.scanTokens()
+
+    for expectedToken, actualToken in zip(expectedTokens, actualTokens):
+        if tokenKey(expectedToken) != tokenKey(actualToken):
+            return "Lexers disagree at line {0}: expected {1} but got {2}".format(expectedToken.getLine(), expectedToken, actualToken)
+
+    if len(expectedTokens) != len(actualTokens):
+        return "Lexers disagree: expected {0} tokens but got {1} tokens".format(len(expectedTokens), len(actualTokens))
+
+    if [error.report() for error in expected.getErrors()] != [error.report() for error in actual.getErrors()]:
+        return "Lexers disagree on errors"
+
+    return None
+
+def tokenKey(token):
+    return token.getType(), token.getLexeme(), type(token.getLiteral()), token.getLiteral(), token.getLine()
@@ -0,0 +1,15 @@
+from pyPseudo.lexer.RegexLexer import RegexLexer
+
+class StreamingLexer(RegexLexer):
+    def __init__(self, file, path, reporter=None):
+        super().__init__("", path)
+        self._file = file
+        self._reporter = reporter
+
+    def streamTokens(self):
+        return self._generateTokens(self._file.readline)
+
+    def _error(self, message):
+        super()._error(message)
+        if self._reporter != None:
+            self._reporter(self._errors[-1])
@@ -1,4 +1,6 @@
 class Token:
+    __slots__ = ("_type", "_lexeme", "_literal", "_path", "_line")
+
     def __init__(self, type, lexeme, literal, path, line):
         self._type = type
         self._lexeme = lexeme
@@ -48,6 +48,8 @@ class TokenType(Enumerate):
 
     FOR = 37
     TO = 38
+    DOWNTO = 52
+    STEP = 53
     WHILE = 39
     DO = 40
 
@@ -95,6 +97,8 @@ keywords = {
 
     "FOR": TokenType.FOR,
     "TO": TokenType.TO,
+    "DOWNTO": TokenType.DOWNTO,
+    "STEP": TokenType.STEP,
     "WHILE": TokenType.WHILE,
     "DO": TokenType.DO,
 
@@ -0,0 +1,289 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.lexer.TokenType import TokenType
+
+from pyPseudo.parser.Expression import ExpressionVisitor
+from pyPseudo.parser.Statement import StatementVisitor
+import pyPseudo.parser.Expression as Expression
+import pyPseudo.parser.Statement as Statement
+
+from pyPseudo.interpreter.Operators import binaryOperations, unaryOperations
+from pyPseudo.interpreter.Rope import Rope
+
+from pyPseudo.resolver.ScopeType import ScopeType
+
+class Optimiser(ExpressionVisitor, StatementVisitor):
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+        self._rewrites = 0
+
+    def optimise(self, statements):
+        return self._optimiseStatements(statements)
+
+    def getRewrites(self):
+        return self._rewrites
+
+    def visitAssignExpression(self, expression):
+        value = self._optimiseExpression(expression.getValue())
+        if value is expression.getValue():
+            return expression
+
+        return self._rebuild(expression, Expression.Assign(expression.getIdentifier(), value))
+
+    def visitVariableExpression(self, expression):
+        return expression
+
+    def visitGroupingExpression(self, expression):
+        inner = self._optimiseExpression(expression.getExpression())
+        if isinstance(inner, Expression.Literal):
+            return self._rewrite(inner)
+
+        if inner is expression.getExpression():
+            return expression
+
+        return Expression.Grouping(inner)
+
+    def visitSetExpression(self, expression):
+        object = self._optimiseExpression(expression.getObject())
+        value = self._optimiseExpression(expression.getValue())
+        if object is expression.getObject() and value is expression.getValue():
+            return expression
+
+        return Expression.Set(object, expression.getIdentifier(), value)
+
+    def visitLiteralExpression(self, expression):
+        return expression
+
+    def visitLogicalExpression(self, expression):
+        left = self._optimiseExpression(expression.getLeft())
+        right = self._optimiseExpression(expression.getRight())
+
+        if isinstance(left, Expression.Literal):
+            if self._isTruthy(left.getValue()) == (expression.getOperator().getType() == TokenType.OR):
+                return self._rewrite(left)
+            return self._rewrite(right)
+
+        if left is expression.getLeft() and right is expression.getRight():
+            return expression
+
+        return Expression.Logical(left, expression.getOperator(), right)
+
+    def visitBinaryExpression(self, expression):
+        left = self._optimiseExpression(expression.getLeft())
+        right = self._optimiseExpression(expression.getRight())
+        operator = expression.getOperator()
+
+        if isinstance(left, Expression.Literal) and isinstance(right, Expression.Literal):
+            value = self._fold(binaryOperations[operator.getType()], left.getValue(), right.getValue(), operator)
+            if value != None:
+                return self._rewrite(value)
+
+        if left is expression.getLeft() and right is expression.getRight():
+            return expression
+
+        return Expression.Binary(left, operator, right)
+
+    def visitUnaryExpression(self, expression):
+        right = self._optimiseExpression(expression.getRight())
+        operator = expression.getOperator()
+
+        if isinstance(right, Expression.Literal):
+            value = self._fold(unaryOperations[operator.getType()], right.getValue(), operator)
+            if value != None:
+                return self._rewrite(value)
+
+        if right is expression.getRight():
+            return expression
+
+        return Expression.Unary(operator, right)
+
+    def visitCallExpression(self, expression):
+        caller = self._optimiseExpression(expression.getCaller())
+        arguments = self._optimiseExpressions(expression.getArguments())
+        if caller is expression.getCaller() and arguments is expression.getArguments():
+            return expression
+
+        return Expression.Call(caller, expression.getParentheses(), arguments)
+
+    def visitGetExpression(self, expression):
+        object = self._optimiseExpression(expression.getObject())
+        if object is expression.getObject():
+            return expression
+
+        return Expression.Get(object, expression.getIdentifier())
+
+    def visitThisExpression(self, expression):
+        return expression
+
+    def visitSuperExpression(self, expression):
+        return expression
+
+    def visitGetIndexExpression(self, expression):
+        object = self._optimiseExpression(expression.getObject())
+        indices = self._optimiseExpressions(expression.getIndices())
+        if object is expression.getObject() and indices is expression.getIndices():
+            return expression
+
+        return Expression.GetIndex(object, indices, expression.getBrackets())
+
+    def visitListExpression(self, expression):
+        values = self._optimiseExpressions(expression.getValues())
+        if values is expression.getValues():
+            return expression
+
+        return Expression.List(values)
+
+    def visitSetIndexExpression(self, expression):
+        object = self._optimiseExpression(expression.getObject())
+        indices = self._optimiseExpressions(expression.getIndices())
+        value = self._optimiseExpression(expression.getValue())
+        if object is expression.getObject() and indices is expression.getIndices() and value is expression.getValue():
+            return expression
+
+        return Expression.SetIndex(object, indices, expression.getBrackets(), value)
+
+    def visitClassStatement(self, statement):
+        methods = [self._optimiseFunction(method) for method in statement.getMethods()]
+        if all(method is original for method, original in zip(methods, statement.getMethods())):
+            return [statement]
+
+        return [self._rebuild(statement, Statement.Class(statement.getIdentifier(), statement.getSuperClass(), methods))]
+
+    def visitFunctionStatement(self, statement):
+        return [self._optimiseFunction(statement)]
+
+    def visitReturnStatement(self, statement):
+        if statement.getValue() == None:
+            return [statement]
+
+        value = self._optimiseExpression(statement.getValue())
+        if value is statement.getValue():
+            return [statement]
+
+        return [Statement.Return(statement.getKeyword(), value)]
+
+    def visitExpressionStatement(self, statement):
+        expression = self._optimiseExpression(statement.getExpression())
+        if expression is statement.getExpression():
+            return [statement]
+
+        return [Statement.Expression(expression)]
+
+    def visitVariableStatement(self, statement):
+        if statement.getInitializer() == None:
+            return [statement]
+
+        initializer = self._optimiseExpression(statement.getInitializer())
+        if initializer is statement.getInitializer():
+            return [statement]
+
+        return [Statement.Variable(statement.getIdentifier(), initializer)]
+
+    def visitIfStatement(self, statement):
+        if not isinstance(statement.getCondition(), Expression.Logical):
+            return [statement]
+
+        scopeTypes = self._interpreter.getScopeTypes(statement)
+        rewrites = self._rewrites
+        condition = self._optimiseExpression(statement.getCondition())
+        conditionRewrites = self._rewrites - rewrites
+        thenBranch = self._optimiseStatements(statement.getThenBranch())
+        elseBranch = self._optimiseStatements(statement.getElseBranch()) if statement.getElseBranch() != None else None
+
+        if isinstance(condition, Expression.Literal):
+            if self._isTruthy(condition.getValue()):
+                if scopeTypes[0] == ScopeType.NONE:
+                    self._rewrites += 1
+                    return thenBranch
+            elif elseBranch == None:
+                self._rewrites += 1
+                return []
+            elif scopeTypes[1] == ScopeType.NONE:
+                self._rewrites += 1
+                return elseBranch
+
+        if not isinstance(condition, Expression.Logical):
+            self._rewrites -= conditionRewrites
+            condition = statement.getCondition()
+
+        if condition is statement.getCondition() and thenBranch is statement.getThenBranch() and elseBranch is statement.getElseBranch():
+            return [statement]
+
+        return [self._rebuild(statement, Statement.If(condition, thenBranch, elseBranch))]
+
+    def visitWhileStatement(self, statement):
+        condition = self._optimiseExpression(statement.getCondition())
+        if isinstance(condition, Expression.Literal) and not self._isTruthy(condition.getValue()):
+            self._rewrites += 1
+            return []
+
+        body = self._optimiseStatements(statement.getBody())
+        if condition is statement.getCondition() and body is statement.getBody():
+            return [statement]
+
+        return [self._rebuild(statement, Statement.While(condition, body))]
+
+    def visitForStatement(self, statement):
+        initializer = self._optimiseStatements([statement.getInitializer()])[0]
+        bound = self._optimiseExpression(statement.getBound())
+        step = self._optimiseExpression(statement.getStep()) if statement.getStep() != None else None
+        body = self._optimiseStatements(statement.getBody())
+        if initializer is statement.getInitializer() and bound is statement.getBound() and step is statement.getStep() and body is statement.getBody():
+            return [statement]
+
+        return [self._rebuild(statement, Statement.For(initializer, statement.getDirection(), bound, step, body))]
+
+    def visitOutputStatement(self, statement):
+        expression = self._optimiseExpression(statement.getExpression())
+        if expression is statement.getExpression():
+            return [statement]
+
+        return [Statement.Output(expression)]
+
+    def _optimiseExpression(self, expression):
+        return expression.accept(self)
+
+    def _optimiseExpressions(self, expressions):
+        optimised = [self._optimiseExpression(expression) for expression in expressions]
+        if all(expression is original for expression, original in zip(optimised, expressions)):
+            return expressions
+
+        return optimised
+
+    def _optimiseStatements(self, statements):
+        optimised = []
+        for statement in statements:
+            optimised.extend(statement.accept(self))
+
+        if len(optimised) == len(statements) and all(statement is original for statement, original in zip(optimised, statements)):
+            return statements
+
+        return optimised
+
+    def _optimiseFunction(self, function):
+        body = self._optimiseStatements(function.getBody())
+        if body is function.getBody():
+            return function
+
+        return Statement.Function(function.getIdentifier(), function.getParameters(), body)
+
+    def _fold(self, operation, *operands):
+        try:
+            value = operation(*operands)
+        except (RuntimeError, Exception):
+            return None
+
+        if isinstance(value, Rope):
+            value = str(value)
+        return Expression.Literal(value)
+
+    def _rewrite(self, expression):
+        self._rewrites += 1
+        return expression
+
+    def _rebuild(self, original, replacement):
+        self._interpreter.copyResolution(original, replacement)
+        return replacement
+
+    def _isTruthy(self, value):
+        return value is not None and value is not False
@@ -62,11 +62,15 @@ class ExpressionVisitor(Abstract):
         pass
 
 class Expression(Abstract):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor):
         pass
 
 class Assign(Expression):
+    __slots__ = ("_identifier", "_value")
+
     def __init__(self, identifier, value):
         self._identifier = identifier
         self._value = value
@@ -84,6 +88,8 @@ class Assign(Expression):
         return "Assign(Identifier: ({0}), Value: ({1}))".format(self._identifier, self._value)
 
 class Variable(Expression):
+    __slots__ = ("_identifier",)
+
     def __init__(self, identifier):
         self._identifier = identifier
 
@@ -97,6 +103,8 @@ class Variable(Expression):
         return "Variable(Identifier: ({0}))".format(self._identifier)
 
 class Grouping(Expression):
+    __slots__ = ("_expression",)
+
     def __init__(self, expression):
         self._expression = expression
 
@@ -110,6 +118,8 @@ class Grouping(Expression):
         return "Grouping(Expression: ({0}))".format(self._expression)
 
 class Set(Expression):
+    __slots__ = ("_object", "_identifier", "_value")
+
     def __init__(self, object, identifier, value):
         self._object = object
         self._identifier = identifier
@@ -130,6 +140,8 @@ class Set(Expression):
     def __repr__(self):
         return "Set(Object: ({0}), Identifier: ({1}), Value: ({2}))".format(self._object, self._identifier, self._value)
 class Literal(Expression):
+    __slots__ = ("_value",)
+
     def __init__(self, value):
         self._value = value
 
@@ -143,6 +155,8 @@ class Literal(Expression):
         return "Literal(Value: ({0}))".format(self._value)
 
 class Logical(Expression):
+    __slots__ = ("_left", "_operator", "_right")
+
     def __init__(self, left, operator, right):
         self._left = left
         self._operator = operator
@@ -164,6 +178,8 @@ class Logical(Expression):
         return "Logical(Left: ({0}), Operator: ({1}), Right: ({2}))".format(self._left, self._operator, self._right)
 
 class Binary(Expression):
+    __slots__ = ("_left", "_operator", "_right")
+
     def __init__(self, left, operator, right):
         self._left = left
         self._operator = operator
@@ -185,6 +201,8 @@ class Binary(Expression):
         return "Binary(Left: ({0}), Operator: ({1}), Right: ({2}))".format(self._left, self._operator, self._right)
 
 class Unary(Expression):
+    __slots__ = ("_operator", "_right")
+
     def __init__(self, operator, right):
         self._operator = operator
         self._right = right
@@ -202,6 +220,8 @@ class Unary(Expression):
         return "Unary(Operator: ({0}), Right: ({1}))".format(self._operator, self._right)
 
 class Call(Expression):
+    __slots__ = ("_caller", "_parentheses", "_arguments")
+
     def __init__(self, caller, parentheses, arguments):
         self._caller = caller
         self._parentheses = parentheses
@@ -223,6 +243,8 @@ class Call(Expression):
         return "Call(Caller: ({0}), Parentheses: ({1}), Arguments: ({2}))".format(self._caller, self._parentheses, self._arguments)
 
 class Get(Expression):
+    __slots__ = ("_object", "_identifier")
+
     def __init__(self, object, identifier):
         self._object = object
         self._identifier = identifier
@@ -240,6 +262,8 @@ class Get(Expression):
         return "Get(Object: ({0}), Identifier: ({1}))".format(self._object, self._identifier)
 
 class This(Expression):
+    __slots__ = ("_keyword",)
+
     def __init__(self, keyword):
         self._keyword = keyword
 
@@ -253,6 +277,8 @@ class This(Expression):
         return "This(Keyword: ({0}))".format(self._keyword)
 
 class Super(Expression):
+    __slots__ = ("_keyword", "_method")
+
     def __init__(self, keyword, method):
         self._keyword = keyword
         self._method = method
@@ -270,6 +296,8 @@ class Super(Expression):
         return "Super(Keyword: ({0}), Method: ({1}))".format(self._keyword, self._method)
 
 class GetIndex(Expression):
+    __slots__ = ("_object", "_indices", "_brackets")
+
     def __init__(self, object, indices, brackets):
         self._object = object
         self._indices = indices
@@ -291,6 +319,8 @@ class GetIndex(Expression):
         return "GetIndex(Object: ({0}), Index: ({1}))".format(self._object, self._indices)
 
 class List(Expression):
+    __slots__ = ("_values",)
+
     def __init__(self, values):
         self._values = values
 
@@ -304,6 +334,8 @@ class List(Expression):
         return "List(Values: ({0}))".format(self._values)
 
 class SetIndex(Expression):
+    __slots__ = ("_object", "_indices", "_brackets", "_value")
+
     def __init__(self, object, indices, brackets, value):
         self._object = object
         self._indices = indices
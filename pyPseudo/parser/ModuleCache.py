@@ -0,0 +1,32 @@
+import os as OS
+
+class ModuleCache:
+    __slots__ = ("_modules", "_imports")
+
+    def __init__(self):
+        #Absolute path -> parsed statements, None while the module is still being parsed
+        self._modules = {}
+        #Import string -> the absolute path it resolved to against the working directory
+        self._imports = {}
+
+    def resolve(self, path):
+        self._imports[path] = OS.path.abspath(path)
+        return self._imports[path]
+
+    def contains(self, path):
+        return OS.path.abspath(path) in self._modules
+
+    def add(self, path, statements):
+        self._modules[OS.path.abspath(path)] = statements
+
+    def getPaths(self):
+        return list(self._modules.keys())
+
+    def getImports(self):
+        return list(self._imports.items())
+
+    def get(self, path):
+        return self._modules.get(OS.path.abspath(path))
+
+    def __len__(self):
+        return len(self._modules)
@@ -1,24 +1,50 @@
 from pyPseudo.error.ParseError import ParseError
 
 from pyPseudo.lexer.Lexer import Lexer
-from pyPseudo.lexer.Token import Token
 from pyPseudo.lexer.TokenType import TokenType
 
 from pyPseudo.Utilities import readFile
 
 import pyPseudo.parser.Expression as Expression
 import pyPseudo.parser.Statement as Statement
+from pyPseudo.parser.ModuleCache import ModuleCache
+
+LOGICAL_OR, LOGICAL_AND, EQUALITY, COMPARISON, TERM, FACTOR = range(1, 7)
+
+binaryRules = {
+    TokenType.OR: (LOGICAL_OR, Expression.Logical),
+    TokenType.AND: (LOGICAL_AND, Expression.Logical),
+    TokenType.NOT_EQUAL: (EQUALITY, Expression.Binary),
+    TokenType.EQUAL: (EQUALITY, Expression.Binary),
+    TokenType.LESS: (COMPARISON, Expression.Binary),
+    TokenType.GREATER: (COMPARISON, Expression.Binary),
+    TokenType.LESS_EQUAL: (COMPARISON, Expression.Binary),
+    TokenType.GREATER_EQUAL: (COMPARISON, Expression.Binary),
+    TokenType.PLUS: (TERM, Expression.Binary),
+    TokenType.MINUS: (TERM, Expression.Binary),
+    TokenType.SLASH: (FACTOR, Expression.Binary),
+    TokenType.STAR: (FACTOR, Expression.Binary)
+}
+
+unaryOperators = (TokenType.NOT, TokenType.MINUS)
+indexStarts = (TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING)
 
 class Parser:
-    def __init__(self, tokens):
-        self._current = 0
-        self._tokens = tokens
+    def __init__(self, tokens, reporter=None, modules=None):
+        self._reporter = reporter
+        self._modules = modules if modules != None else ModuleCache()
+        self._tokens = iter(tokens)
+        self._previousToken = None
+        self._currentToken = next(self._tokens)
         self._errors = []
 
     def parse(self):
         statements = []
         while not self._isAtEnd():
-            statements.append(self._declaration())
+            if self._match([TokenType.IMPORT]):
+                statements.extend(self._importModule())
+            else:
+                statements.append(self._declaration())
         return statements
 
     def getErrors(self):
@@ -27,7 +53,9 @@ class Parser:
     def _declaration(self):
         try:
             if self._match([TokenType.IMPORT]):
-                self._importModule()
+                self._error(self._previous(), "Can only import modules at the top level.")
+                self._consume(TokenType.STRING, "Expect file path for module.")
+                return None
 
             if self._match([TokenType.CLASS]):
                 return self._classDeclaration()
@@ -44,13 +72,31 @@ class Parser:
             return None
 
     def _importModule(self):
-        path = self._consume(TokenType.STRING, "Expect file path for module.").getLiteral()
-        #self._consume(TokenType.SEMICOLON, "Expect ';' after file path for module.")
+        try:
+            path = self._consume(TokenType.STRING, "Expect file path for module.").getLiteral()
+        except ParseError as e:
+            self._synchronise()
+            return []
+
+        #Each module is linked in once, at its first import, later imports (and import cycles) see it as already linked
+        self._modules.resolve(path)
+        if self._modules.contains(path):
+            return []
 
+        self._modules.add(path, None)
         lexer = Lexer(readFile(path), path)
-        moduleTokens = lexer.scanTokens()
-        del moduleTokens[-1]
-        self._tokens = self._tokens[ : self._current] + moduleTokens + self._tokens[self._current : ]
+        tokens = lexer.scanTokens()
+        for error in lexer.getErrors():
+            self._errors.append(error)
+            if self._reporter != None:
+                self._reporter(error)
+
+        parser = Parser(tokens, self._reporter, self._modules)
+        statements = parser.parse()
+        self._errors.extend(parser.getErrors())
+        self._modules.add(path, statements)
+
+        return statements
 
     def _classDeclaration(self):
         identifier = self._consume(TokenType.IDENTIFIER, "Expect class identifier.")
@@ -132,28 +178,21 @@ class Parser:
         else:
             raise self._error(self._peek(), "Expect a variable declaration after 'FOR'.")
 
-        self._consume(TokenType.TO, "Expect 'TO' after varable declaration.")
-        right = self._oneDimensionalArithmetic()
+        if not self._match([TokenType.TO, TokenType.DOWNTO]):
+            raise self._error(self._peek(), "Expect 'TO' or 'DOWNTO' after varable declaration.")
+        direction = self._previous()
+        bound = self._oneDimensionalArithmetic()
 
-        condition = Expression.Binary(
-            Expression.Variable(identifier),
-            Token(TokenType.LESS_EQUAL, "<=", None, "NULL", -1),
-            right
-        )
-
-        increment = Expression.Assign(identifier, Expression.Binary(
-            Expression.Variable(identifier),
-            Token(TokenType.PLUS, "+", None, "NULL", -1),
-            Expression.Literal(1.0)
-        ))
+        step = None
+        if self._match([TokenType.STEP]):
+            step = self._oneDimensionalArithmetic()
 
         self._consume(TokenType.DO, "Expect 'DO' at end of for loop initialization.")
 
         body = self._bodyDeclaration(TokenType.ENDFOR)
         self._consume(TokenType.ENDFOR, "Expect 'ENDFOR' at end of the for loop.")
-        body.append(Statement.Expression(increment))
 
-        return Statement.For(initializer, condition, body)
+        return Statement.For(initializer, direction, bound, step, body)
 
     def _ifStatement(self):
         condition = self._or()
@@ -205,8 +244,8 @@ class Parser:
     def _assignment(self):
         expression = self._or()
 
-        if self._match([TokenType.LEFT_ARROW]):
-            leftArrow = self._previous()
+        if self._currentToken.getType() == TokenType.LEFT_ARROW:
+            leftArrow = self._move()
             value = self._assignment()
             if isinstance(expression, Expression.Variable):
                 identifier = expression.getIdentifier()
@@ -220,81 +259,42 @@ class Parser:
         return expression
 
     def _or(self):
-        expression = self._and()
-        while self._match([TokenType.OR]):
-            operator = self._previous()
-            right = self._and() #check this line!
-            expression = Expression.Logical(expression, operator, right)
-
-        return expression
-
-    def _and(self):
-        expression = self._equality()
-
-        while self._match([TokenType.AND]):
-            operator = self._previous()
-            right = self._equality()
-            expression = Expression.Logical(expression, operator, right)
-
-        return expression
-
-    def _equality(self):
-        expression = self._comparison()
-
-        while self._match([TokenType.NOT_EQUAL, TokenType.EQUAL]):
-            operator = self._previous()
-            right = self._comparison()
-            expression = Expression.Binary(expression, operator, right)
-
-        return expression
-
-    def _comparison(self):
-        expression = self._oneDimensionalArithmetic()
-
-        while self._match([TokenType.LESS, TokenType.GREATER, TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL]):
-            operator = self._previous()
-            right = self._oneDimensionalArithmetic()
-            expression = Expression.Binary(expression, operator, right)
-
-        return expression
+        return self._binary(LOGICAL_OR)
 
     def _oneDimensionalArithmetic(self):
-        expression = self._twoDimensionalArithmetic()
-
-        while self._match([TokenType.PLUS, TokenType.MINUS]):
-            operator = self._previous()
-            right = self._twoDimensionalArithmetic()
-            expression = Expression.Binary(expression, operator, right)
-
-        return expression
+        return self._binary(TERM)
 
-    def _twoDimensionalArithmetic(self):
+    def _binary(self, precedence):
+        #Precedence climbing: operators of equal precedence loop here, tighter ones recurse, so chains stay flat
         expression = self._unary()
 
-        while self._match([TokenType.SLASH, TokenType.STAR]):
-            operator = self._previous()
-            right = self._unary()
-            expression = Expression.Binary(expression, operator, right)
+        while True:
+            rule = binaryRules.get(self._currentToken.getType(), None)
+            if rule == None or rule[0] < precedence:
+                return expression
 
-        return expression
+            operator = self._move()
+            right = self._binary(rule[0] + 1)
+            expression = rule[1](expression, operator, right)
 
     def _unary(self):
-        if self._match([TokenType.NOT, TokenType.MINUS]):
-            operator = self._previous()
+        if self._currentToken.getType() in unaryOperators:
+            operator = self._move()
             right = self._unary()
             return Expression.Unary(operator, right)
 
         return self._index()
 
-
-
     def _functionCall(self):
         expression = self._primary()
 
         while True:
-            if self._match([TokenType.LEFT_PAREN]):
+            type = self._currentToken.getType()
+            if type == TokenType.LEFT_PAREN:
+                self._move()
                 expression = self._finishFunctionCall(expression)
-            elif self._match([TokenType.DOT]):
+            elif type == TokenType.DOT:
+                self._move()
                 identifier = self._consume(TokenType.IDENTIFIER, "Expect property identifier after '.'.")
                 expression = Expression.Get(expression, identifier)
             else:
@@ -317,11 +317,12 @@ class Parser:
     def _index(self):
         expression = self._functionCall()
 
-        if self._match([TokenType.LEFT_SQUARE]):
+        if self._currentToken.getType() == TokenType.LEFT_SQUARE:
+            self._move()
             indices = []
             while True:
-                if not self._peek().getType() in [TokenType.IDENTIFIER, TokenType.NUMBER]:
-                    self._error(self._peek(), "Expect identifier or number for index value.")
+                if not self._peek().getType() in indexStarts:
+                    self._error(self._peek(), "Expect identifier, number or string for index value.")
 
                 indices.append(self._expression())
                 if not self._match([TokenType.COMMA]):
@@ -334,28 +335,40 @@ class Parser:
         return expression
 
     def _primary(self):
-        if self._match([TokenType.FALSE]):
+        token = self._currentToken
+        type = token.getType()
+
+        if type == TokenType.IDENTIFIER:
+            self._move()
+            return Expression.Variable(token)
+
+        if type == TokenType.NUMBER or type == TokenType.STRING:
+            self._move()
+            return Expression.Literal(token.getLiteral())
+
+        if type == TokenType.FALSE:
+            self._move()
             return Expression.Literal(False)
 
-        if self._match([TokenType.TRUE]):
+        if type == TokenType.TRUE:
+            self._move()
             return Expression.Literal(True)
 
-        if self._match([TokenType.NULL]):
+        if type == TokenType.NULL:
+            self._move()
             return Expression.Literal(None)
 
-        if self._match([TokenType.NUMBER, TokenType.STRING]):
-            return Expression.Literal(self._previous().getLiteral())
-
-        if self._match([TokenType.SUPER]):
-            keyword = self._previous()
+        if type == TokenType.SUPER:
+            keyword = self._move()
             self._consume(TokenType.DOT, "Expect '.' after 'SUPER'.")
             method = self._consume(TokenType.IDENTIFIER, "Expect super class method name.")
             return Expression.Super(keyword, method)
 
-        if self._match([TokenType.THIS]):
-            return Expression.This(self._previous())
+        if type == TokenType.THIS:
+            return Expression.This(self._move())
 
-        if self._match([TokenType.LEFT_BRACE]):
+        if type == TokenType.LEFT_BRACE:
+            self._move()
             values = []
             while True:
                 values.append(self._expression())
@@ -364,10 +377,8 @@ class Parser:
             self._consume(TokenType.RIGHT_BRACE, "Expect '}' after values.")
             return Expression.List(values)
 
-        if self._match([TokenType.IDENTIFIER]):
-            return Expression.Variable(self._previous())
-
-        if self._match([TokenType.LEFT_PAREN]):
+        if type == TokenType.LEFT_PAREN:
+            self._move()
             expression = self._expression()
             self._consume(TokenType.RIGHT_PAREN, "Expect ')' after expression.")
             return Expression.Grouping(expression)
@@ -381,6 +392,8 @@ class Parser:
 
     def _error(self, token, message):
         self._errors.append(ParseError(token, message))
+        if self._reporter != None:
+            self._reporter(self._errors[-1])
         return self._errors[-1]
 
     def _match(self, tokens):
@@ -398,14 +411,15 @@ class Parser:
 
     def _move(self):
         if not self._isAtEnd():
-            self._current += 1
+            self._previousToken = self._currentToken
+            self._currentToken = next(self._tokens)
         return self._previous()
 
     def _previous(self):
-        return self._tokens[self._current - 1]
+        return self._previousToken
 
     def _peek(self):
-        return self._tokens[self._current]
+        return self._currentToken
 
     def _isAtEnd(self):
         return self._peek().getType() == TokenType.EOF
@@ -38,11 +38,15 @@ class StatementVisitor(Abstract):
         pass
 
 class Statement(Abstract):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor):
         pass
 
 class Class(Statement):
+    __slots__ = ("_identifier", "_superClass", "_methods")
+
     def __init__(self, identifier, superClass, methods):
         self._identifier = identifier
         self._superClass = superClass
@@ -64,6 +68,8 @@ class Class(Statement):
         return "Class(Identifier: ({0}), SuperClass: ({1}), Methods: ({2}))".format(self._identifier, self._superClass, self._methods)
 
 class Function(Statement):
+    __slots__ = ("_identifier", "_parameters", "_body")
+
     def __init__(self, identifier, parameters, body):
         self._identifier = identifier
         self._parameters = parameters
@@ -85,6 +91,8 @@ class Function(Statement):
         return "Function(Identifier: ({0}), Parameters: ({1}), Body: ({2}))".format(self._identifier, self._parameters, self._body)
 
 class Return(Statement):
+    __slots__ = ("_keyword", "_value")
+
     def __init__(self, keyword, value):
         self._keyword = keyword
         self._value = value
@@ -102,6 +110,8 @@ class Return(Statement):
         return "Return(Keyword: ({0}), Value: ({1}))".format(self._keyword, self._value)
 
 class Expression(Statement):
+    __slots__ = ("_expression",)
+
     def __init__(self, expression):
         self._expression = expression
 
@@ -115,6 +125,8 @@ class Expression(Statement):
         return "Expression(Expression: ({0}))".format(self._expression)
 
 class Variable(Statement):
+    __slots__ = ("_identifier", "_initializer")
+
     def __init__(self, identifier, initializer):
         self._identifier = identifier
         self._initializer = initializer
@@ -132,6 +144,8 @@ class Variable(Statement):
         return "Variable(Identifier: ({0}), Initializer: ({1}))".format(self._identifier, self._initializer)
 
 class If(Statement):
+    __slots__ = ("_condition", "_thenBranch", "_elseBranch")
+
     def __init__(self, condition, thenBranch, elseBranch):
         self._condition = condition
         self._thenBranch = thenBranch
@@ -153,6 +167,8 @@ class If(Statement):
         return "If(Condition: ({0}), ThenBranch: ({1}), ElseBranch: ({2}))".format(self._condition, self._thenBranch, self._elseBranch)
 
 class While(Statement):
+    __slots__ = ("_condition", "_body")
+
     def __init__(self, condition, body):
         self._condition = condition
         self._body = body
@@ -170,6 +186,8 @@ class While(Statement):
         return "While(Condition: ({0}), Body: ({1}))".format(self._condition, self._body)
 
 class Output(Statement):
+    __slots__ = ("_expression",)
+
     def __init__(self, expression):
         self._expression = expression
 
@@ -183,16 +201,26 @@ class Output(Statement):
         return "Output(Expression: ({0}))".format(self._expression)
 
 class For(Statement):
-    def __init__(self, initializer, condition, body):
+    __slots__ = ("_initializer", "_direction", "_bound", "_step", "_body")
+
+    def __init__(self, initializer, direction, bound, step, body):
         self._initializer = initializer
-        self._condition = condition
+        self._direction = direction
+        self._bound = bound
+        self._step = step
         self._body = body
 
     def getInitializer(self):
         return self._initializer
 
-    def getCondition(self):
-        return self._condition
+    def getDirection(self):
+        return self._direction
+
+    def getBound(self):
+        return self._bound
+
+    def getStep(self):
+        return self._step
 
     def getBody(self):
         return self._body
@@ -201,4 +229,4 @@ class For(Statement):
         return visitor.visitForStatement(self)
 
     def __repr__(self):
-        return "For(Initializer: ({0}), Condition: ({1}), Body: ({2}))".format(self._initializer, self._condition, self._body)
+        return "For(Initializer: ({0}), Direction: ({1}), Bound: ({2}), Step: ({3}), Body: ({4}))".format(self._initializer, self._direction, self._bound, self._step, self._body)
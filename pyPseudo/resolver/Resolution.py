@@ -0,0 +1,15 @@
+class Resolution:
+    __slots__ = ("_locals", "_scopeTypes")
+
+    def __init__(self):
+        self._locals = {}
+        self._scopeTypes = {}
+
+    def resolve(self, expression, depth, slot):
+        self._locals[expression] = (depth, slot)
+
+    def resolveScopes(self, statement, scopeTypes):
+        self._scopeTypes[statement] = scopeTypes
+
+    def resolveInto(self, interpreter):
+        interpreter.resolveAll(self._locals, self._scopeTypes)
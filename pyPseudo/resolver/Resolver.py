@@ -7,11 +7,13 @@ from pyPseudo.lexer.Token import Token
 
 from pyPseudo.parser.Expression import ExpressionVisitor
 from pyPseudo.parser.Statement import StatementVisitor
+import pyPseudo.parser.Statement as Statement
 
 from pyPseudo.Utilities import Stack
 
 from pyPseudo.resolver.FunctionType import FunctionType
 from pyPseudo.resolver.ClassType import ClassType
+from pyPseudo.resolver.ScopeType import ScopeType
 
 class Resolver(ExpressionVisitor, StatementVisitor):
 
@@ -20,6 +22,7 @@ class Resolver(ExpressionVisitor, StatementVisitor):
         self._currentFunction = FunctionType.NONE
         self._currentClass = ClassType.NONE
         self._scopes = Stack()
+        self._slots = Stack()
         self._errors = []
 
 
@@ -108,6 +111,7 @@ class Resolver(ExpressionVisitor, StatementVisitor):
     def visitClassStatement(self, statement):
         self._declare(statement.getIdentifier())
         self._define(statement.getIdentifier())
+        self._resolveDeclaration(statement, statement.getIdentifier())
 
         enclosingClass = self._currentClass
         self._currentClass = ClassType.CLASS
@@ -117,9 +121,11 @@ class Resolver(ExpressionVisitor, StatementVisitor):
             self._resolveExpression(statement.getSuperClass())
             self._beginScope()
             self._scopes.peek()["SUPER"] = True
+            self._slots.peek()["SUPER"] = 0
 
         self._beginScope()
         self._scopes.peek()["THIS"] = True
+        self._slots.peek()["THIS"] = 0
 
         for method in statement.getMethods():
             declaration = FunctionType.METHOD
@@ -160,18 +166,22 @@ class Resolver(ExpressionVisitor, StatementVisitor):
 
     def visitIfStatement(self, statement):
         self._resolveExpression(statement.getCondition())
-        self._resolveBody(statement.getThenBranch())
+        scopeTypes = [self._resolveBody(statement.getThenBranch())]
         if statement.getElseBranch() != None:
-            self._resolveBody(statement.getElseBranch())
+            scopeTypes.append(self._resolveBody(statement.getElseBranch()))
+        self._interpreter.resolveScopes(statement, scopeTypes)
 
     def visitWhileStatement(self, statement):
         self._resolveExpression(statement.getCondition())
-        self._resolveBody(statement.getBody())
+        self._interpreter.resolveScopes(statement, [self._resolveBody(statement.getBody())])
 
     def visitForStatement(self, statement):
         self._resolveStatement(statement.getInitializer())
-        self._resolveExpression(statement.getCondition())
-        self._resolveBody(statement.getBody())
+        self._resolveExpression(statement.getBound())
+        if statement.getStep() != None:
+            self._resolveExpression(statement.getStep())
+        self._resolveLocal(statement, statement.getInitializer().getIdentifier())
+        self._interpreter.resolveScopes(statement, [self._resolveBody(statement.getBody())])
 
     def visitOutputStatement(self, statement):
         self._resolveExpression(statement.getExpression())
@@ -183,17 +193,41 @@ class Resolver(ExpressionVisitor, StatementVisitor):
         statement.accept(self)
 
     def _resolveBody(self, statements):
+        if not any(isinstance(statement, (Statement.Variable, Statement.Function, Statement.Class, Statement.For)) for statement in statements):
+            for statement in statements:
+                self._resolveStatement(statement)
+            return ScopeType.NONE
+
         self._beginScope()
         for statement in statements:
             self._resolveStatement(statement)
         self._endScope()
 
+        return ScopeType.FRESH if self._declaresClosure(statements) else ScopeType.SHARED
+
+    def _declaresClosure(self, statements):
+        for statement in statements:
+            if isinstance(statement, (Statement.Function, Statement.Class)):
+                return True
+
+            if isinstance(statement, Statement.If) and self._declaresClosure(statement.getThenBranch() + (statement.getElseBranch() or [])):
+                return True
+
+            if isinstance(statement, (Statement.While, Statement.For)) and self._declaresClosure(statement.getBody()):
+                return True
+
+        return False
+
     def _resolveLocal(self, expression, identifier):
-        for i in range(len(self._scopes) - 1, -1, -1): #i <- len(scopes) - 1 TO 0
+        for i in range(len(self._scopes) - 1, 0, -1): #i <- len(scopes) - 1 TO 1, scope 0 holds the globals
             if identifier.getLexeme() in self._scopes.get(i):
-                self._interpreter.resolve(expression, len(self._scopes) - 1 - i)
+                self._interpreter.resolve(expression, len(self._scopes) - 1 - i, self._slots.get(i)[identifier.getLexeme()])
                 return
 
+    def _resolveDeclaration(self, statement, identifier):
+        if len(self._scopes) > 1:
+            self._interpreter.resolve(statement, 0, self._slots.peek()[identifier.getLexeme()])
+
     def _resolveFunction(self, function, type):
         enclosingFunction = self._currentFunction
         self._currentFunction = type
@@ -220,6 +254,10 @@ class Resolver(ExpressionVisitor, StatementVisitor):
 
         scope[identifier.getLexeme()] = False
 
+        slots = self._slots.peek()
+        if identifier.getLexeme() not in slots:
+            slots[identifier.getLexeme()] = len(slots)
+
     def _define(self, identifier):
         if self._scopes.isEmpty():
             return
@@ -228,9 +266,11 @@ class Resolver(ExpressionVisitor, StatementVisitor):
 
     def _beginScope(self):
         self._scopes.push({})
+        self._slots.push({})
 
     def _endScope(self):
         self._scopes.pop()
+        self._slots.pop()
 
     def _error(self, token, message):
         self._errors.append(ResolveError(token, message))
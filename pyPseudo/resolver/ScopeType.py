@@ -0,0 +1,6 @@
+from enum import Enum as Enumerate
+
+class ScopeType(Enumerate):
+    NONE = 1
+    SHARED = 2
+    FRESH = 3
@@ -0,0 +1,38 @@
+class FunctionContext:
+    def __init__(self):
+        self._lines = []
+        self._declarations = {}
+        self._indentation = 0
+        self._loops = 0
+
+    def getLines(self):
+        return self._lines
+
+    def getDeclarations(self):
+        declarations = []
+        for kind in ["global", "nonlocal"]:
+            names = [name for name in self._declarations if self._declarations[name] == kind]
+            if len(names) > 0:
+                declarations.append("{0} {1}".format(kind, ", ".join(names)))
+        return declarations
+
+    def declare(self, name, kind):
+        self._declarations[name] = kind
+
+    def emit(self, line):
+        self._lines.append("    " * self._indentation + line)
+
+    def indent(self):
+        self._indentation += 1
+
+    def dedent(self):
+        self._indentation -= 1
+
+    def beginLoop(self):
+        self._loops += 1
+
+    def endLoop(self):
+        self._loops -= 1
+
+    def isInLoop(self):
+        return self._loops > 0
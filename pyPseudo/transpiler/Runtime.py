@@ -0,0 +1,115 @@
+from pyPseudo.callable.PseudoCallable import PseudoCallable
+from pyPseudo.callable.PseudoInstance import PseudoInstance
+from pyPseudo.callable.PseudoClass import PseudoClass
+from pyPseudo.callable.TranspiledFunction import TranspiledFunction
+
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.interpreter.PseudoList import PseudoList
+from pyPseudo.interpreter.Operators import binaryOperations, unaryOperations, loopBound, loopStep, indexableTypes
+
+from pyPseudo.lexer.TokenType import TokenType
+
+class Runtime:
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+
+    def getHelpers(self):
+        return {
+            "_type": type,
+            "_int": int,
+            "_print": print,
+            "_greater": binaryOperations[TokenType.GREATER],
+            "_greaterEqual": binaryOperations[TokenType.GREATER_EQUAL],
+            "_less": binaryOperations[TokenType.LESS],
+            "_lessEqual": binaryOperations[TokenType.LESS_EQUAL],
+            "_subtract": binaryOperations[TokenType.MINUS],
+            "_divide": binaryOperations[TokenType.SLASH],
+            "_multiply": binaryOperations[TokenType.STAR],
+            "_add": binaryOperations[TokenType.PLUS],
+            "_negate": unaryOperations[TokenType.MINUS],
+            "_loopBound": loopBound,
+            "_loopStep": loopStep,
+            "_RuntimeError": RuntimeError,
+            "_PseudoList": PseudoList,
+            "_stringify": self._interpreter.stringify,
+            "_call": self.call,
+            "_invoke": self.invoke,
+            "_function": self.function,
+            "_class": self.pseudoClass,
+            "_superClass": self.superClass,
+            "_superMethod": self.superMethod,
+            "_getProperty": self.getProperty,
+            "_instance": self.instance,
+            "_setProperty": self.setProperty,
+            "_indexable": self.indexable,
+            "_global": self.globalVariable,
+            "_assignGlobal": self.assignGlobal,
+            "_namespace": self._interpreter.globals.getValues()
+        }
+
+    def call(self, callee, arguments, parentheses):
+        if not isinstance(callee, PseudoCallable):
+            raise RuntimeError(parentheses, "Can only call function and classes.")
+
+        if len(arguments) != callee.arity():
+            raise RuntimeError(parentheses, "Expected {0} arguments, but got {1} arguments".format(callee.arity(), len(arguments)))
+
+        return callee.call(self._interpreter, arguments, parentheses)
+
+    def invoke(self, receiver, method, callee, arguments, parentheses):
+        if method == None:
+            return self.call(callee, arguments, parentheses)
+
+        if len(arguments) != method.arity():
+            raise RuntimeError(parentheses, "Expected {0} arguments, but got {1} arguments".format(method.arity(), len(arguments)))
+
+        return method.callMethod(self._interpreter, receiver, arguments, parentheses)
+
+    def function(self, function, identifier, arity, isConstructor):
+        return TranspiledFunction(function, identifier, arity, isConstructor)
+
+    def pseudoClass(self, identifier, superClass, methods):
+        return PseudoClass(identifier, superClass, methods)
+
+    def superClass(self, superClass, identifier):
+        if not isinstance(superClass, PseudoClass):
+            raise RuntimeError(identifier, "Super class must be a class.")
+
+        return superClass
+
+    def superMethod(self, superClass, object, method):
+        function = superClass.findMethod(object, method.getLexeme())
+        if function == None:
+            raise RuntimeError(method, "Undefined property '{0}'.".format(method.getLexeme()))
+
+        return function
+
+    def getProperty(self, object, cache):
+        if isinstance(object, PseudoInstance):
+            return cache.get(object)
+
+        raise RuntimeError(cache.getIdentifier(), "(Get) Only instances have properties.")
+
+    def instance(self, object, identifier):
+        if isinstance(object, PseudoInstance):
+            return object
+
+        raise RuntimeError(identifier, "(Set) Only instances have properties.")
+
+    def setProperty(self, instance, value, cache):
+        cache.set(instance, value)
+        return value
+
+    def indexable(self, object, brackets, message):
+        if isinstance(object, indexableTypes):
+            return object
+
+        raise RuntimeError(brackets, message)
+
+    def globalVariable(self, identifier):
+        return self._interpreter.globals.get(identifier)
+
+    def assignGlobal(self, identifier, value):
+        self._interpreter.globals.assign(identifier, value)
+        return value
@@ -0,0 +1,24 @@
+class Scope:
+    def __init__(self, context, isInLoop, isGlobal):
+        self._context = context
+        self._isInLoop = isInLoop
+        self._isGlobal = isGlobal
+        self._names = {}
+
+    def getContext(self):
+        return self._context
+
+    def isInLoop(self):
+        return self._isInLoop
+
+    def isGlobal(self):
+        return self._isGlobal
+
+    def contains(self, lexeme):
+        return lexeme in self._names
+
+    def define(self, lexeme, name):
+        self._names[lexeme] = name
+
+    def getName(self, lexeme):
+        return self._names.get(lexeme, lexeme) if self._isGlobal else self._names[lexeme]
@@ -0,0 +1,426 @@
+import keyword as Keyword
+
+from pyPseudo.callable.PseudoFunctions import functions
+from pyPseudo.callable.MethodCache import MethodCache
+from pyPseudo.callable.PropertyCache import PropertyCache
+
+from pyPseudo.error.TranspileError import TranspileError
+
+from pyPseudo.lexer.TokenType import TokenType
+
+from pyPseudo.parser.Expression import ExpressionVisitor
+from pyPseudo.parser.Statement import StatementVisitor
+import pyPseudo.parser.Expression as Expression
+
+from pyPseudo.transpiler.FunctionContext import FunctionContext
+from pyPseudo.transpiler.Scope import Scope
+
+numericHelpers = {
+    TokenType.GREATER: (">", "_greater"),
+    TokenType.GREATER_EQUAL: (">=", "_greaterEqual"),
+    TokenType.LESS: ("<", "_less"),
+    TokenType.LESS_EQUAL: ("<=", "_lessEqual"),
+    TokenType.MINUS: ("-", "_subtract"),
+    TokenType.STAR: ("*", "_multiply")
+}
+
+loopHelpers = {
+    TokenType.TO: ("<=", "_lessEqual"),
+    TokenType.DOWNTO: (">=", "_greaterEqual")
+}
+
+stepHelpers = {
+    TokenType.TO: ("+", "_add"),
+    TokenType.DOWNTO: ("-", "_subtract")
+}
+
+booleanOperators = [
+    TokenType.GREATER,
+    TokenType.GREATER_EQUAL,
+    TokenType.LESS,
+    TokenType.LESS_EQUAL,
+    TokenType.EQUAL,
+    TokenType.NOT_EQUAL
+]
+
+class Transpiler(ExpressionVisitor, StatementVisitor):
+    def __init__(self, interpreter):
+        self._interpreter = interpreter
+
+    def transpile(self, statements):
+        self._constants = []
+        self._counter = 0
+        self._context = FunctionContext()
+        self._scopes = [Scope(self._context, False, True)]
+        for function in functions.keys():
+            self._scopes[0].define(function, function)
+
+        for statement in statements:
+            self._transpileStatement(statement)
+
+        module = FunctionContext()
+        self._emitFunction(module, "_module", ["_k"], self._context)
+        return "\n".join(module.getLines()) + "\n", tuple(self._constants)
+
+    def visitAssignExpression(self, expression):
+        value = self._transpileExpression(expression.getValue())
+        target = self._target(expression.getIdentifier())
+
+        if target == None or not target.isidentifier():
+            return "_assignGlobal({0}, {1})".format(self._constant(expression.getIdentifier()), value)
+
+        return "({0} := {1})".format(target, value)
+
+    def visitVariableExpression(self, expression):
+        return self._lookUp(expression.getIdentifier())
+
+    def visitGroupingExpression(self, expression):
+        return "({0})".format(self._transpileExpression(expression.getExpression()))
+
+    def visitSetExpression(self, expression):
+        return "_setProperty(_instance({0}, {1}), {2}, {3})".format(
+            self._transpileExpression(expression.getObject()), self._constant(expression.getIdentifier()),
+            self._transpileExpression(expression.getValue()), self._constant(PropertyCache(expression.getIdentifier()))
+        )
+
+    def visitLiteralExpression(self, expression):
+        return repr(expression.getValue())
+
+    def visitLogicalExpression(self, expression):
+        left = self._transpileExpression(expression.getLeft())
+        right = self._transpileExpression(expression.getRight())
+        temporary = self._temporary()
+
+        if expression.getOperator().getType() == TokenType.OR:
+            return "({0} if {1} else {2})".format(temporary, self._truthy(temporary, left), right)
+
+        return "({0} if {1} else {2})".format(right, self._truthy(temporary, left), temporary)
+
+    def visitBinaryExpression(self, expression):
+        left = self._transpileExpression(expression.getLeft())
+        right = self._transpileExpression(expression.getRight())
+        operator = expression.getOperator()
+        type = operator.getType()
+
+        if type == TokenType.EQUAL:
+            return "({0} == {1})".format(left, right)
+
+        if type == TokenType.NOT_EQUAL:
+            return "(not {0} == {1})".format(left, right)
+
+        leftTemporary, rightTemporary = self._temporary(), self._temporary()
+        guard = "(_type({0} := {1}) is _int) & (_type({2} := {3}) is _int)".format(leftTemporary, left, rightTemporary, right)
+
+        if type == TokenType.PLUS:
+            return "({0} + {1} if {2} else _add({0}, {1}, {3}))".format(leftTemporary, rightTemporary, guard, self._constant(operator))
+
+        if type == TokenType.SLASH:
+            return "_divide({0}, {1}, {2})".format(left, right, self._constant(operator))
+
+        symbol, helper = numericHelpers[type]
+        return "({0} {1} {2} if {3} else {4}({0}, {2}, {5}))".format(
+            leftTemporary, symbol, rightTemporary, guard, helper, self._constant(operator)
+        )
+
+    def visitUnaryExpression(self, expression):
+        right = self._transpileExpression(expression.getRight())
+        operator = expression.getOperator()
+        temporary = self._temporary()
+
+        if operator.getType() == TokenType.MINUS:
+            return "(- {0} if _type({0} := {1}) is _int else _negate({0}, {2}))".format(temporary, right, self._constant(operator))
+
+        return "(not {0})".format(self._truthy(temporary, right))
+
+    def visitCallExpression(self, expression):
+        arguments = ", ".join(self._transpileExpression(argument) for argument in expression.getArguments())
+        caller = expression.getCaller()
+
+        if isinstance(caller, Expression.Get):
+            receiver, method = self._temporary(), self._temporary()
+            return "_invoke(({0} := {1}), ({2} := {3}.lookUp({0})), {2} or _getProperty({0}, {4}), [{5}], {6})".format(
+                receiver, self._transpileExpression(caller.getObject()), method,
+                self._constant(MethodCache(caller.getIdentifier())), self._constant(PropertyCache(caller.getIdentifier())),
+                arguments, self._constant(expression.getParentheses())
+            )
+
+        return "_call({0}, [{1}], {2})".format(
+            self._transpileExpression(caller), arguments, self._constant(expression.getParentheses())
+        )
+
+    def visitGetExpression(self, expression):
+        return "_getProperty({0}, {1})".format(self._transpileExpression(expression.getObject()), self._constant(PropertyCache(expression.getIdentifier())))
+
+    def visitThisExpression(self, expression):
+        return self._lookUp(expression.getKeyword())
+
+    def visitSuperExpression(self, expression):
+        return "_superMethod({0}, {1}, {2})".format(
+            self._scopeName("SUPER"), self._scopeName("THIS"), self._constant(expression.getMethod())
+        )
+
+    def visitGetIndexExpression(self, expression):
+        brackets = self._constant(expression.getBrackets())
+        return "_indexable({0}, {1}, \"(Get) Only lists can be indexed.\").index({1}, [{2}])".format(
+            self._transpileExpression(expression.getObject()), brackets,
+            ", ".join(self._transpileExpression(index) for index in expression.getIndices())
+        )
+
+    def visitListExpression(self, expression):
+        return "_PseudoList([{0}])".format(", ".join(self._transpileExpression(value) for value in expression.getValues()))
+
+    def visitSetIndexExpression(self, expression):
+        brackets = self._constant(expression.getBrackets())
+        return "_indexable({0}, {1}, \"(Set) Only lists can be indexed.\").set({1}, [{2}], {3})".format(
+            self._transpileExpression(expression.getObject()), brackets,
+            ", ".join(self._transpileExpression(index) for index in expression.getIndices()),
+            self._transpileExpression(expression.getValue())
+        )
+
+    def visitClassStatement(self, statement):
+        identifier = statement.getIdentifier().getLexeme()
+        target = self._declare(identifier)
+        self._emit("{0} = None".format(target))
+
+        superClass = "None"
+        if statement.getSuperClass() != None:
+            value = self._transpileExpression(statement.getSuperClass())
+            self._beginScope()
+            superClass = self._declare("SUPER")
+            self._emit("{0} = _superClass({1}, {2})".format(superClass, value, self._constant(statement.getSuperClass().getIdentifier())))
+
+        self._scopes.append(Scope(self._context, False, False))
+        this = self._declare("THIS")
+
+        methods = []
+        for method in statement.getMethods():
+            name = method.getIdentifier().getLexeme()
+            isConstructor = name == identifier
+            function = self._transpileFunction(method, [this], "return {0}".format(this) if isConstructor else None)
+            methods.append("{0}: _function({1}, {0}, {2}, {3})".format(repr(name), function, len(method.getParameters()), isConstructor))
+
+        self._endScope()
+        if statement.getSuperClass() != None:
+            self._endScope()
+
+        self._emit("{0} = _class({1}, {2}, {{{3}}})".format(target, repr(identifier), superClass, ", ".join(methods)))
+
+    def visitFunctionStatement(self, statement):
+        identifier = statement.getIdentifier().getLexeme()
+        target = self._declare(identifier)
+        function = self._transpileFunction(statement, [], None)
+        self._emit("{0} = _function({1}, {2}, {3}, False)".format(target, function, repr(identifier), len(statement.getParameters())))
+
+    def visitReturnStatement(self, statement):
+        if statement.getValue() == None:
+            self._emit("return None")
+        else:
+            self._emit("return {0}".format(self._transpileExpression(statement.getValue())))
+
+    def visitExpressionStatement(self, statement):
+        expression = statement.getExpression()
+
+        if isinstance(expression, Expression.Assign):
+            value = self._transpileExpression(expression.getValue())
+            target = self._target(expression.getIdentifier())
+            if target != None:
+                self._emit("{0} = {1}".format(target, value))
+                return
+
+            self._emit("_assignGlobal({0}, {1})".format(self._constant(expression.getIdentifier()), value))
+            return
+
+        self._emit(self._transpileExpression(expression))
+
+    def visitVariableStatement(self, statement):
+        value = "None"
+        if statement.getInitializer() != None:
+            value = self._transpileExpression(statement.getInitializer())
+
+        self._emit("{0} = {1}".format(self._declare(statement.getIdentifier().getLexeme()), value))
+
+    def visitIfStatement(self, statement):
+        if not isinstance(statement.getCondition(), Expression.Logical):
+            self._emit("raise _RuntimeError({0}, \"Expect logical expression as operator\")".format(self._constant(statement.getCondition())))
+            return
+
+        self._emit("if {0}:".format(self._condition(statement.getCondition())))
+        self._transpileBody(statement.getThenBranch(), False)
+
+        if statement.getElseBranch() != None:
+            self._emit("else:")
+            self._transpileBody(statement.getElseBranch(), False)
+
+    def visitWhileStatement(self, statement):
+        self._emit("while {0}:".format(self._condition(statement.getCondition())))
+        self._transpileBody(statement.getBody(), True)
+
+    def visitForStatement(self, statement):
+        self._transpileStatement(statement.getInitializer())
+
+        identifier = statement.getInitializer().getIdentifier()
+        direction = self._constant(statement.getDirection())
+        compare, helper = loopHelpers[statement.getDirection().getType()]
+        bound, step, integral, counter = self._temporary(), self._temporary(), self._temporary(), self._temporary()
+
+        self._emit("{0} = _loopBound({1}, {2})".format(bound, self._transpileExpression(statement.getBound()), direction))
+        if statement.getStep() != None:
+            self._emit("{0} = _loopStep({1}, {2})".format(step, self._transpileExpression(statement.getStep()), direction))
+        else:
+            self._emit("{0} = 1".format(step))
+        self._emit("{0} = (_type({1}) is _int) & (_type({2}) is _int)".format(integral, bound, step))
+
+        guard = "(_type({0} := {1}) is _int) & {2}".format(counter, self._lookUp(identifier), integral)
+        self._emit("while ({0} {1} {2} if {3} else {4}({0}, {2}, {5})):".format(
+            counter, compare, bound, guard, helper, direction
+        ))
+
+        increment, incrementHelper = stepHelpers[statement.getDirection().getType()]
+        guard = "(_type({0} := {1}) is _int) & {2}".format(counter, self._lookUp(identifier), integral)
+        advance = "{0} = ({1} {2} {3} if {4} else {5}({1}, {3}, {6}))".format(
+            self._target(identifier), counter, increment, step, guard, incrementHelper, direction
+        )
+        self._transpileBody(statement.getBody(), True, [advance])
+
+    def visitOutputStatement(self, statement):
+        self._emit("_print(_stringify({0}))".format(self._transpileExpression(statement.getExpression())))
+
+    def _transpileExpression(self, expression):
+        return expression.accept(self)
+
+    def _transpileStatement(self, statement):
+        statement.accept(self)
+
+    def _transpileBody(self, statements, isLoop, epilogue=[]):
+        context = self._context
+        if isLoop:
+            context.beginLoop()
+
+        self._beginScope()
+        context.indent()
+        for statement in statements:
+            self._transpileStatement(statement)
+        for line in epilogue:
+            self._emit(line)
+        if len(statements) == 0 and len(epilogue) == 0:
+            self._emit("pass")
+        context.dedent()
+        self._endScope()
+
+        if isLoop:
+            context.endLoop()
+
+    def _transpileFunction(self, declaration, implicitParameters, epilogue):
+        name = self._unique("_f")
+        enclosing = self._context
+        self._context = FunctionContext()
+        self._scopes.append(Scope(self._context, False, False))
+
+        parameters = implicitParameters + [self._declare(parameter.getLexeme()) for parameter in declaration.getParameters()]
+        for statement in declaration.getBody():
+            self._transpileStatement(statement)
+        if epilogue != None:
+            self._emit(epilogue)
+
+        self._endScope()
+        context = self._context
+        self._context = enclosing
+        self._emitFunction(enclosing, name, parameters, context)
+        return name
+
+    def _emitFunction(self, enclosing, name, parameters, context):
+        enclosing.emit("def {0}({1}):".format(name, ", ".join(parameters)))
+        enclosing.indent()
+        for line in context.getDeclarations() + (context.getLines() or ["pass"]):
+            enclosing.emit(line)
+        enclosing.dedent()
+
+    def _condition(self, expression):
+        code = self._transpileExpression(expression)
+        if self._isBoolean(expression):
+            return code
+        return self._truthy(self._temporary(), code)
+
+    def _isBoolean(self, expression):
+        if isinstance(expression, Expression.Binary):
+            return expression.getOperator().getType() in booleanOperators
+
+        if isinstance(expression, Expression.Unary):
+            return expression.getOperator().getType() == TokenType.NOT
+
+        return isinstance(expression, Expression.Literal) and isinstance(expression.getValue(), bool)
+
+    def _truthy(self, temporary, code):
+        return "(({0} := {1}) is not None and {0} is not False)".format(temporary, code)
+
+    def _lookUp(self, identifier):
+        if self._findScope(identifier.getLexeme()) == None:
+            return "_global({0})".format(self._constant(identifier))
+
+        return self._scopeName(identifier.getLexeme())
+
+    def _scopeName(self, lexeme):
+        scope = self._findScope(lexeme)
+        self._checkCapture(scope, lexeme)
+        return scope.getName(lexeme)
+
+    def _target(self, identifier):
+        lexeme = identifier.getLexeme()
+        scope = self._findScope(lexeme)
+        if scope == None:
+            return None
+
+        self._checkCapture(scope, lexeme)
+        name = scope.getName(lexeme)
+
+        if scope.isGlobal():
+            if name.isidentifier():
+                self._context.declare(name, "global")
+        elif scope.getContext() != self._context:
+            self._context.declare(name, "nonlocal")
+
+        return name
+
+    def _findScope(self, lexeme):
+        for scope in reversed(self._scopes):
+            if scope.contains(lexeme):
+                return scope
+
+        return None
+
+    def _checkCapture(self, scope, lexeme):
+        if scope.isInLoop() and scope.getContext() != self._context:
+            raise TranspileError("Cannot capture '{0}' from a loop body in a closure.".format(lexeme))
+
+    def _declare(self, lexeme):
+        scope = self._scopes[-1]
+        name = lexeme if scope.isGlobal() else self._unique(lexeme + "_")
+        if scope.isGlobal() and Keyword.iskeyword(lexeme):
+            #Python keywords cannot name a global, so they are reached through the namespace itself
+            name = "_namespace[{0}]".format(repr(lexeme))
+        scope.define(lexeme, name)
+
+        if scope.isGlobal() and name.isidentifier():
+            self._context.declare(name, "global")
+
+        return name
+
+    def _beginScope(self):
+        self._scopes.append(Scope(self._context, self._context.isInLoop(), False))
+
+    def _endScope(self):
+        self._scopes.pop()
+
+    def _emit(self, line):
+        self._context.emit(line)
+
+    def _constant(self, value):
+        self._constants.append(value)
+        return "_k[{0}]".format(len(self._constants) - 1)
+
+    def _temporary(self):
+        return self._unique("_t")
+
+    def _unique(self, prefix):
+        self._counter += 1
+        return "{0}{1}".format(prefix, self._counter)
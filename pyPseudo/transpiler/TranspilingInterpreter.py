@@ -0,0 +1,34 @@
+from pyPseudo.error.RuntimeError import RuntimeError
+from pyPseudo.error.TranspileError import TranspileError
+
+from pyPseudo.interpreter.Interpreter import Interpreter
+from pyPseudo.transpiler.Transpiler import Transpiler
+from pyPseudo.transpiler.Runtime import Runtime
+
+class TranspilingInterpreter(Interpreter):
+    def __init__(self):
+        super().__init__()
+        self._transpiler = Transpiler(self)
+        self._codeCache = {}
+
+        self.globals.getValues().update(Runtime(self).getHelpers())
+
+    def interpret(self, statements):
+        try:
+            source, constants = self._transpiler.transpile(statements)
+            code = self._compile(source)
+        except (TranspileError, SyntaxError):
+            super().interpret(statements)
+            return
+
+        try:
+            namespace = self.globals.getValues()
+            exec(code, namespace)
+            namespace["_module"](constants)
+        except (RuntimeError, Exception) as error:
+            self._error(error)
+
+    def _compile(self, source):
+        if source not in self._codeCache:
+            self._codeCache[source] = compile(source, "<pseudo>", "exec")
+        return self._codeCache[source]
@@ -0,0 +1,23 @@
+from pyPseudo.callable.PseudoCallable import PseudoCallable
+
+class BoundMethod(PseudoCallable):
+    __slots__ = ("_receiver", "_method")
+
+    def __init__(self, receiver, method):
+        self._receiver = receiver
+        self._method = method
+
+    def getReceiver(self):
+        return self._receiver
+
+    def getMethod(self):
+        return self._method
+
+    def arity(self):
+        return self._method.arity()
+
+    def call(self, interpreter, arguments, parentheses):
+        return interpreter.callClosure(self._method, self._receiver, arguments)
+
+    def __str__(self):
+        return str(self._method)
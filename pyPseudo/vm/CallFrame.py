@@ -0,0 +1,21 @@
+class CallFrame:
+    def __init__(self, closure, base):
+        self._closure = closure
+        self._base = base
+        self._context = (
+            closure.getFunction().getCode(),
+            closure.getFunction().getConstants(),
+            closure.getFunction().getTokens(),
+            closure.getUpvalues(),
+            base
+        )
+        self.ip = 0
+
+    def getClosure(self):
+        return self._closure
+
+    def getBase(self):
+        return self._base
+
+    def getContext(self):
+        return self._context
@@ -0,0 +1,30 @@
+from pyPseudo.callable.PseudoCallable import PseudoCallable
+from pyPseudo.vm.BoundMethod import BoundMethod
+
+class Closure(PseudoCallable):
+    __slots__ = ("_function", "_upvalues")
+
+    def __init__(self, function, upvalues):
+        self._function = function
+        self._upvalues = upvalues
+
+    def getFunction(self):
+        return self._function
+
+    def getUpvalues(self):
+        return self._upvalues
+
+    def arity(self):
+        return self._function.arity()
+
+    def call(self, interpreter, arguments, parentheses):
+        return interpreter.callClosure(self, None, arguments)
+
+    def callMethod(self, interpreter, instance, arguments, parentheses):
+        return interpreter.callClosure(self, instance, arguments)
+
+    def bind(self, instance):
+        return BoundMethod(instance, self)
+
+    def __str__(self):
+        return str(self._function)
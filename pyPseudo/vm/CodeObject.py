@@ -0,0 +1,59 @@
+class CodeObject:
+    def __init__(self, identifier, arity, isConstructor):
+        self._identifier = identifier
+        self._arity = arity
+        self._isConstructor = isConstructor
+        self._code = []
+        self._tokens = []
+        self._constants = []
+        self._constantIndices = {}
+        self._upvalueCount = 0
+
+    def getIdentifier(self):
+        return self._identifier
+
+    def arity(self):
+        return self._arity
+
+    def isConstructor(self):
+        return self._isConstructor
+
+    def getCode(self):
+        return self._code
+
+    def getTokens(self):
+        return self._tokens
+
+    def getConstants(self):
+        return self._constants
+
+    def getUpvalueCount(self):
+        return self._upvalueCount
+
+    def setUpvalueCount(self, upvalueCount):
+        self._upvalueCount = upvalueCount
+
+    def write(self, byte, token):
+        self._code.append(byte)
+        self._tokens.append(token)
+        return len(self._code) - 1
+
+    def patch(self, offset, byte):
+        self._code[offset] = byte
+
+    def addConstant(self, value):
+        #Floats are keyed by repr, 0.0 == -0.0 would otherwise share one slot
+        if type(value) is float:
+            key = (float, repr(value))
+        else:
+            key = (type(value), value) if isinstance(value, (str, int)) else (type(value), id(value))
+        if key not in self._constantIndices:
+            self._constants.append(value)
+            self._constantIndices[key] = len(self._constants) - 1
+        return self._constantIndices[key]
+
+    def __len__(self):
+        return len(self._code)
+
+    def __str__(self):
+        return "<FUNCTION  {0}>".format(self._identifier)
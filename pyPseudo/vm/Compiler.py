@@ -0,0 +1,372 @@
+from pyPseudo.callable.MethodCache import MethodCache
+from pyPseudo.callable.PropertyCache import PropertyCache
+
+from pyPseudo.lexer.TokenType import TokenType
+
+from pyPseudo.parser.Expression import ExpressionVisitor
+from pyPseudo.parser.Statement import StatementVisitor
+import pyPseudo.parser.Expression as Expression
+
+from pyPseudo.resolver.FunctionType import FunctionType
+
+from pyPseudo.vm.OpCode import OpCode
+from pyPseudo.vm.CodeObject import CodeObject
+from pyPseudo.vm.CompilerState import CompilerState
+
+binaryOperators = {
+    TokenType.GREATER: OpCode.GREATER,
+    TokenType.GREATER_EQUAL: OpCode.GREATER_EQUAL,
+    TokenType.LESS: OpCode.LESS,
+    TokenType.LESS_EQUAL: OpCode.LESS_EQUAL,
+    TokenType.EQUAL: OpCode.EQUAL,
+    TokenType.NOT_EQUAL: OpCode.NOT_EQUAL,
+    TokenType.PLUS: OpCode.ADD,
+    TokenType.MINUS: OpCode.SUBTRACT,
+    TokenType.STAR: OpCode.MULTIPLY,
+    TokenType.SLASH: OpCode.DIVIDE
+}
+
+class Compiler(ExpressionVisitor, StatementVisitor):
+    def __init__(self):
+        self._state = None
+
+    def compileProgram(self, statements):
+        self._state = CompilerState(None, CodeObject("SCRIPT", 0, False), FunctionType.NONE)
+
+        for statement in statements:
+            self._compileStatement(statement)
+        self._emit(OpCode.NULL, None)
+        self._emit(OpCode.RETURN, None)
+
+        function = self._state.getFunction()
+        self._state = None
+        return function
+
+    def visitAssignExpression(self, expression):
+        self._compileExpression(expression.getValue())
+        self._emitSet(expression.getIdentifier())
+
+    def visitVariableExpression(self, expression):
+        self._emitGet(expression.getIdentifier().getLexeme(), expression.getIdentifier())
+
+    def visitGroupingExpression(self, expression):
+        self._compileExpression(expression.getExpression())
+
+    def visitSetExpression(self, expression):
+        self._compileExpression(expression.getObject())
+        self._compileExpression(expression.getValue())
+        self._emitOperand(OpCode.SET_PROPERTY, self._constant(PropertyCache(expression.getIdentifier())), expression.getIdentifier())
+
+    def visitLiteralExpression(self, expression):
+        value = expression.getValue()
+
+        if value is None:
+            self._emit(OpCode.NULL, None)
+        elif value is True:
+            self._emit(OpCode.TRUE, None)
+        elif value is False:
+            self._emit(OpCode.FALSE, None)
+        else:
+            self._emitOperand(OpCode.CONSTANT, self._constant(value), None)
+
+    def visitLogicalExpression(self, expression):
+        self._compileExpression(expression.getLeft())
+
+        if expression.getOperator().getType() == TokenType.OR:
+            jump = self._emitJump(OpCode.JUMP_IF_TRUE, expression.getOperator())
+        else:
+            jump = self._emitJump(OpCode.JUMP_IF_FALSE, expression.getOperator())
+
+        self._emit(OpCode.POP, None)
+        self._compileExpression(expression.getRight())
+        self._patchJump(jump)
+
+    def visitBinaryExpression(self, expression):
+        self._compileExpression(expression.getLeft())
+        self._compileExpression(expression.getRight())
+        self._emit(binaryOperators[expression.getOperator().getType()], expression.getOperator())
+
+    def visitUnaryExpression(self, expression):
+        self._compileExpression(expression.getRight())
+
+        if expression.getOperator().getType() == TokenType.MINUS:
+            self._emit(OpCode.NEGATE, expression.getOperator())
+        else:
+            self._emit(OpCode.NOT, expression.getOperator())
+
+    def visitCallExpression(self, expression):
+        caller = expression.getCaller()
+
+        if isinstance(caller, Expression.Get):
+            self._compileExpression(caller.getObject())
+            self._emitOperand(OpCode.GET_METHOD, self._constant(MethodCache(caller.getIdentifier())), caller.getIdentifier())
+            call = OpCode.CALL_METHOD
+        else:
+            self._compileExpression(caller)
+            call = OpCode.CALL
+
+        for argument in expression.getArguments():
+            self._compileExpression(argument)
+        self._emitOperand(call, len(expression.getArguments()), expression.getParentheses())
+
+    def visitGetExpression(self, expression):
+        self._compileExpression(expression.getObject())
+        self._emitOperand(OpCode.GET_PROPERTY, self._constant(PropertyCache(expression.getIdentifier())), expression.getIdentifier())
+
+    def visitThisExpression(self, expression):
+        self._emitGet("THIS", expression.getKeyword())
+
+    def visitSuperExpression(self, expression):
+        self._emitGet("THIS", expression.getKeyword())
+        self._emitGet("SUPER", expression.getKeyword())
+        self._emitOperand(OpCode.GET_SUPER, self._constant(expression.getMethod()), expression.getMethod())
+
+    def visitGetIndexExpression(self, expression):
+        self._compileExpression(expression.getObject())
+        for index in expression.getIndices():
+            self._compileExpression(index)
+        self._emitOperand(OpCode.GET_INDEX, len(expression.getIndices()), expression.getBrackets())
+
+    def visitListExpression(self, expression):
+        for value in expression.getValues():
+            self._compileExpression(value)
+        self._emitOperand(OpCode.BUILD_LIST, len(expression.getValues()), None)
+
+    def visitSetIndexExpression(self, expression):
+        self._compileExpression(expression.getObject())
+        for index in expression.getIndices():
+            self._compileExpression(index)
+        self._compileExpression(expression.getValue())
+        self._emitOperand(OpCode.SET_INDEX, len(expression.getIndices()), expression.getBrackets())
+
+    def visitClassStatement(self, statement):
+        identifier = statement.getIdentifier()
+
+        self._emit(OpCode.NULL, None)
+        self._declareVariable(identifier)
+
+        superClass = statement.getSuperClass()
+        if superClass != None:
+            self._compileExpression(superClass)
+            self._emit(OpCode.CHECK_SUPERCLASS, superClass.getIdentifier())
+            self._state.beginScope()
+            self._state.addLocal("SUPER")
+
+        for method in statement.getMethods():
+            isConstructor = method.getIdentifier().getLexeme() == identifier.getLexeme()
+            self._compileFunction(method, FunctionType.CONSTRUCTOR if isConstructor else FunctionType.METHOD)
+
+        self._emitOperand(OpCode.CLASS, self._constant(identifier.getLexeme()), identifier)
+        self._write(len(statement.getMethods()))
+        self._write(1 if superClass != None else 0)
+
+        self._emitSet(identifier)
+        self._emit(OpCode.POP, None)
+
+        if superClass != None:
+            self._endScope()
+
+    def visitFunctionStatement(self, statement):
+        if self._state.getScopeDepth() > 0:
+            self._state.addLocal(statement.getIdentifier().getLexeme())
+            self._compileFunction(statement, FunctionType.FUNCTION)
+        else:
+            self._compileFunction(statement, FunctionType.FUNCTION)
+            self._emitOperand(OpCode.DEFINE_GLOBAL, self._constant(statement.getIdentifier().getLexeme()), statement.getIdentifier())
+
+    def visitReturnStatement(self, statement):
+        if statement.getValue() != None:
+            self._compileExpression(statement.getValue())
+        else:
+            self._emit(OpCode.NULL, None)
+        self._emit(OpCode.RETURN, statement.getKeyword())
+
+    def visitExpressionStatement(self, statement):
+        self._compileExpression(statement.getExpression())
+        self._emit(OpCode.POP, None)
+
+    def visitVariableStatement(self, statement):
+        if statement.getInitializer() != None:
+            self._compileExpression(statement.getInitializer())
+        else:
+            self._emit(OpCode.NULL, None)
+
+        self._declareVariable(statement.getIdentifier())
+
+    def visitIfStatement(self, statement):
+        if not isinstance(statement.getCondition(), Expression.Logical):
+            self._emitOperand(OpCode.ERROR, self._constant("Expect logical expression as operator"), statement.getCondition())
+            return
+
+        self._compileExpression(statement.getCondition())
+        elseJump = self._emitJump(OpCode.POP_JUMP_IF_FALSE, None)
+        self._compileBody(statement.getThenBranch())
+
+        if statement.getElseBranch() != None:
+            endJump = self._emitJump(OpCode.JUMP, None)
+            self._patchJump(elseJump)
+            self._compileBody(statement.getElseBranch())
+            self._patchJump(endJump)
+        else:
+            self._patchJump(elseJump)
+
+    def visitWhileStatement(self, statement):
+        start = len(self._state.getFunction())
+        self._compileExpression(statement.getCondition())
+        exitJump = self._emitJump(OpCode.POP_JUMP_IF_FALSE, None)
+        self._compileBody(statement.getBody())
+        self._emitOperand(OpCode.JUMP, start, None)
+        self._patchJump(exitJump)
+
+    def visitForStatement(self, statement):
+        self._compileStatement(statement.getInitializer())
+
+        identifier = statement.getInitializer().getIdentifier()
+        direction = statement.getDirection()
+        isAscending = direction.getType() == TokenType.TO
+
+        self._state.beginScope()
+        self._compileExpression(statement.getBound())
+        self._emit(OpCode.CHECK_NUMBER, direction)
+        self._state.addLocal("FOR BOUND")
+
+        if statement.getStep() != None:
+            self._compileExpression(statement.getStep())
+            self._emit(OpCode.CHECK_STEP, direction)
+        else:
+            self._emitOperand(OpCode.CONSTANT, self._constant(1), None)
+        self._state.addLocal("FOR STEP")
+
+        start = len(self._state.getFunction())
+        self._emitGet(identifier.getLexeme(), identifier)
+        self._emitGet("FOR BOUND", direction)
+        self._emit(OpCode.LESS_EQUAL if isAscending else OpCode.GREATER_EQUAL, direction)
+        exitJump = self._emitJump(OpCode.POP_JUMP_IF_FALSE, None)
+
+        self._compileBody(statement.getBody())
+
+        self._emitGet(identifier.getLexeme(), identifier)
+        self._emitGet("FOR STEP", direction)
+        self._emit(OpCode.ADD if isAscending else OpCode.SUBTRACT, direction)
+        self._emitSet(identifier)
+        self._emit(OpCode.POP, None)
+        self._emitOperand(OpCode.JUMP, start, None)
+        self._patchJump(exitJump)
+        self._endScope()
+
+    def visitOutputStatement(self, statement):
+        self._compileExpression(statement.getExpression())
+        self._emit(OpCode.OUTPUT, None)
+
+    def _compileExpression(self, expression):
+        expression.accept(self)
+
+    def _compileStatement(self, statement):
+        statement.accept(self)
+
+    def _compileBody(self, statements):
+        self._state.beginScope()
+        for statement in statements:
+            self._compileStatement(statement)
+        self._endScope()
+
+    def _compileFunction(self, declaration, type):
+        identifier = declaration.getIdentifier()
+        function = CodeObject(identifier.getLexeme(), len(declaration.getParameters()), type == FunctionType.CONSTRUCTOR)
+
+        self._state = CompilerState(self._state, function, type)
+        self._state.beginScope()
+        for parameter in declaration.getParameters():
+            self._state.addLocal(parameter.getLexeme())
+
+        for statement in declaration.getBody():
+            self._compileStatement(statement)
+
+        if type == FunctionType.CONSTRUCTOR:
+            self._emitOperand(OpCode.GET_LOCAL, 0, None)
+        else:
+            self._emit(OpCode.NULL, None)
+        self._emit(OpCode.RETURN, None)
+
+        upvalues = self._state.getUpvalues()
+        function.setUpvalueCount(len(upvalues))
+        self._state = self._state.getEnclosing()
+
+        self._emitOperand(OpCode.CLOSURE, self._constant(function), identifier)
+        for index, isLocal in upvalues:
+            self._write(1 if isLocal else 0)
+            self._write(index)
+
+    def _endScope(self):
+        for isCaptured in self._state.endScope():
+            self._emit(OpCode.CLOSE_UPVALUE if isCaptured else OpCode.POP, None)
+
+    def _declareVariable(self, identifier):
+        if self._state.getScopeDepth() > 0:
+            self._state.addLocal(identifier.getLexeme())
+        else:
+            self._emitOperand(OpCode.DEFINE_GLOBAL, self._constant(identifier.getLexeme()), identifier)
+
+    def _emitGet(self, name, token):
+        slot = self._state.resolveLocal(name)
+        if slot != -1:
+            self._emitOperand(OpCode.GET_LOCAL, slot, token)
+            return
+
+        upvalue = self._resolveUpvalue(self._state, name)
+        if upvalue != -1:
+            self._emitOperand(OpCode.GET_UPVALUE, upvalue, token)
+            return
+
+        self._emitOperand(OpCode.GET_GLOBAL, self._constant(name), token)
+
+    def _emitSet(self, identifier):
+        name = identifier.getLexeme()
+
+        slot = self._state.resolveLocal(name)
+        if slot != -1:
+            self._emitOperand(OpCode.SET_LOCAL, slot, identifier)
+            return
+
+        upvalue = self._resolveUpvalue(self._state, name)
+        if upvalue != -1:
+            self._emitOperand(OpCode.SET_UPVALUE, upvalue, identifier)
+            return
+
+        self._emitOperand(OpCode.SET_GLOBAL, self._constant(name), identifier)
+
+    def _resolveUpvalue(self, state, name):
+        enclosing = state.getEnclosing()
+        if enclosing == None:
+            return -1
+
+        slot = enclosing.resolveLocal(name)
+        if slot != -1:
+            enclosing.captureLocal(slot)
+            return state.addUpvalue(slot, True)
+
+        upvalue = self._resolveUpvalue(enclosing, name)
+        if upvalue != -1:
+            return state.addUpvalue(upvalue, False)
+
+        return -1
+
+    def _constant(self, value):
+        return self._state.getFunction().addConstant(value)
+
+    def _write(self, byte):
+        return self._state.getFunction().write(byte, None)
+
+    def _emit(self, opCode, token):
+        return self._state.getFunction().write(opCode.value, token)
+
+    def _emitOperand(self, opCode, operand, token):
+        offset = self._emit(opCode, token)
+        self._write(operand)
+        return offset
+
+    def _emitJump(self, opCode, token):
+        return self._emitOperand(opCode, -1, token) + 1
+
+    def _patchJump(self, offset):
+        self._state.getFunction().patch(offset, len(self._state.getFunction()))
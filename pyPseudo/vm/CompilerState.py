@@ -0,0 +1,56 @@
+from pyPseudo.resolver.FunctionType import FunctionType
+
+class CompilerState:
+    def __init__(self, enclosing, function, type):
+        self._enclosing = enclosing
+        self._function = function
+        self._type = type
+        self._locals = [["THIS" if type in [FunctionType.METHOD, FunctionType.CONSTRUCTOR] else "", 0, False]]
+        self._upvalues = []
+        self._scopeDepth = 0
+
+    def getEnclosing(self):
+        return self._enclosing
+
+    def getFunction(self):
+        return self._function
+
+    def getType(self):
+        return self._type
+
+    def getUpvalues(self):
+        return self._upvalues
+
+    def getScopeDepth(self):
+        return self._scopeDepth
+
+    def beginScope(self):
+        self._scopeDepth += 1
+
+    def endScope(self):
+        self._scopeDepth -= 1
+
+        discarded = []
+        while len(self._locals) > 0 and self._locals[-1][1] > self._scopeDepth:
+            discarded.append(self._locals.pop()[2])
+        return discarded
+
+    def addLocal(self, identifier):
+        self._locals.append([identifier, self._scopeDepth, False])
+        return len(self._locals) - 1
+
+    def resolveLocal(self, identifier):
+        for i in range(len(self._locals) - 1, -1, -1):
+            if self._locals[i][0] == identifier:
+                return i
+        return -1
+
+    def captureLocal(self, index):
+        self._locals[index][2] = True
+
+    def addUpvalue(self, index, isLocal):
+        if (index, isLocal) in self._upvalues:
+            return self._upvalues.index((index, isLocal))
+
+        self._upvalues.append((index, isLocal))
+        return len(self._upvalues) - 1
@@ -0,0 +1,76 @@
+from pyPseudo.callable.MethodCache import MethodCache
+from pyPseudo.callable.PropertyCache import PropertyCache
+
+from pyPseudo.vm.OpCode import OpCode
+from pyPseudo.vm.CodeObject import CodeObject
+
+constantOperations = [
+    OpCode.CONSTANT, OpCode.GET_GLOBAL, OpCode.DEFINE_GLOBAL, OpCode.SET_GLOBAL,
+    OpCode.GET_PROPERTY, OpCode.SET_PROPERTY, OpCode.GET_SUPER, OpCode.ERROR, OpCode.GET_METHOD
+]
+
+operandOperations = [
+    OpCode.GET_LOCAL, OpCode.SET_LOCAL, OpCode.GET_UPVALUE, OpCode.SET_UPVALUE,
+    OpCode.GET_INDEX, OpCode.SET_INDEX, OpCode.BUILD_LIST, OpCode.CALL, OpCode.CALL_METHOD
+]
+
+jumpOperations = [
+    OpCode.JUMP, OpCode.JUMP_IF_FALSE, OpCode.JUMP_IF_TRUE, OpCode.POP_JUMP_IF_FALSE
+]
+
+class Disassembler:
+    def disassemble(self, function):
+        print("== {0} ==".format(function.getIdentifier()))
+
+        offset = 0
+        line = None
+        while offset < len(function):
+            offset, line = self._disassembleInstruction(function, offset, line)
+
+        for constant in function.getConstants():
+            if isinstance(constant, CodeObject):
+                self.disassemble(constant)
+
+    def _disassembleInstruction(self, function, offset, previousLine):
+        code = function.getCode()
+        constants = function.getConstants()
+        token = function.getTokens()[offset]
+        opCode = OpCode(code[offset])
+
+        line = token.getLine() if token != None and hasattr(token, "getLine") else previousLine
+        prefix = "{0:04d} {1}".format(offset, "   |" if line == previousLine else "{0:4}".format(line))
+
+        if opCode in constantOperations:
+            print("{0} {1:<18} {2:4} '{3}'".format(prefix, opCode.name, code[offset + 1], self._constant(constants[code[offset + 1]])))
+            return offset + 2, line
+
+        if opCode in operandOperations:
+            print("{0} {1:<18} {2:4}".format(prefix, opCode.name, code[offset + 1]))
+            return offset + 2, line
+
+        if opCode in jumpOperations:
+            print("{0} {1:<18} {2:4} -> {3}".format(prefix, opCode.name, offset, code[offset + 1]))
+            return offset + 2, line
+
+        if opCode == OpCode.CLASS:
+            print("{0} {1:<18} {2:4} '{3}' {4} methods{5}".format(prefix, opCode.name, code[offset + 1], constants[code[offset + 1]], code[offset + 2], " inherits" if code[offset + 3] == 1 else ""))
+            return offset + 4, line
+
+        if opCode == OpCode.CLOSURE:
+            nested = constants[code[offset + 1]]
+            print("{0} {1:<18} {2:4} {3}".format(prefix, opCode.name, code[offset + 1], nested))
+            offset += 2
+            for i in range(nested.getUpvalueCount()):
+                print("{0:04d}    |                      {1} {2}".format(offset, "local" if code[offset] == 1 else "upvalue", code[offset + 1]))
+                offset += 2
+            return offset, line
+
+        print("{0} {1}".format(prefix, opCode.name))
+        return offset + 1, line
+
+    def _constant(self, constant):
+        if isinstance(constant, (MethodCache, PropertyCache)):
+            return constant.getIdentifier().getLexeme()
+        if hasattr(constant, "getLexeme"):
+            return constant.getLexeme()
+        return constant
@@ -0,0 +1,54 @@
+from enum import Enum as Enumerate
+
+class OpCode(Enumerate):
+    CONSTANT = 1
+    NULL = 2
+    TRUE = 3
+    FALSE = 4
+    POP = 5
+
+    GET_LOCAL = 6
+    SET_LOCAL = 7
+    GET_GLOBAL = 8
+    DEFINE_GLOBAL = 9
+    SET_GLOBAL = 10
+    GET_UPVALUE = 11
+    SET_UPVALUE = 12
+
+    GET_PROPERTY = 13
+    SET_PROPERTY = 14
+    GET_SUPER = 15
+    GET_INDEX = 16
+    SET_INDEX = 17
+    BUILD_LIST = 18
+
+    EQUAL = 19
+    NOT_EQUAL = 20
+    GREATER = 21
+    GREATER_EQUAL = 22
+    LESS = 23
+    LESS_EQUAL = 24
+    ADD = 25
+    SUBTRACT = 26
+    MULTIPLY = 27
+    DIVIDE = 28
+    NOT = 29
+    NEGATE = 30
+
+    OUTPUT = 31
+    JUMP = 32
+    JUMP_IF_FALSE = 33
+    JUMP_IF_TRUE = 34
+    POP_JUMP_IF_FALSE = 35
+
+    CALL = 36
+    CLOSURE = 37
+    CLOSE_UPVALUE = 38
+    RETURN = 39
+    CLASS = 40
+    CHECK_SUPERCLASS = 41
+    ERROR = 42
+    CHECK_NUMBER = 43
+    CHECK_STEP = 44
+    GET_METHOD = 45
+    CALL_METHOD = 46
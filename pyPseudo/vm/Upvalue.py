@@ -0,0 +1,21 @@
+class Upvalue:
+    def __init__(self, location):
+        self._location = location
+        self._value = None
+        self._isOpen = True
+
+    def getLocation(self):
+        return self._location
+
+    def get(self, stack):
+        return stack[self._location] if self._isOpen else self._value
+
+    def set(self, stack, value):
+        if self._isOpen:
+            stack[self._location] = value
+        else:
+            self._value = value
+
+    def close(self, stack):
+        self._value = stack[self._location]
+        self._isOpen = False
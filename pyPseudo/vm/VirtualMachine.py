@@ -0,0 +1,413 @@
+from pyPseudo.callable.PseudoCallable import PseudoCallable
+from pyPseudo.callable.PseudoInstance import PseudoInstance
+from pyPseudo.callable.PseudoClass import PseudoClass
+
+from pyPseudo.error.RuntimeError import RuntimeError
+
+from pyPseudo.lexer.TokenType import TokenType
+
+from pyPseudo.interpreter.Interpreter import Interpreter
+from pyPseudo.interpreter.PseudoList import PseudoList
+from pyPseudo.interpreter.Operators import binaryOperations, add, negate, loopBound, loopStep, indexableTypes
+
+from pyPseudo.vm.OpCode import OpCode
+from pyPseudo.vm.Compiler import Compiler
+from pyPseudo.vm.Disassembler import Disassembler
+from pyPseudo.vm.CallFrame import CallFrame
+from pyPseudo.vm.Closure import Closure
+from pyPseudo.vm.BoundMethod import BoundMethod
+from pyPseudo.vm.Upvalue import Upvalue
+
+CONSTANT = OpCode.CONSTANT.value
+NULL = OpCode.NULL.value
+TRUE = OpCode.TRUE.value
+FALSE = OpCode.FALSE.value
+POP = OpCode.POP.value
+GET_LOCAL = OpCode.GET_LOCAL.value
+SET_LOCAL = OpCode.SET_LOCAL.value
+GET_GLOBAL = OpCode.GET_GLOBAL.value
+DEFINE_GLOBAL = OpCode.DEFINE_GLOBAL.value
+SET_GLOBAL = OpCode.SET_GLOBAL.value
+GET_UPVALUE = OpCode.GET_UPVALUE.value
+SET_UPVALUE = OpCode.SET_UPVALUE.value
+GET_PROPERTY = OpCode.GET_PROPERTY.value
+SET_PROPERTY = OpCode.SET_PROPERTY.value
+GET_SUPER = OpCode.GET_SUPER.value
+GET_INDEX = OpCode.GET_INDEX.value
+SET_INDEX = OpCode.SET_INDEX.value
+BUILD_LIST = OpCode.BUILD_LIST.value
+EQUAL = OpCode.EQUAL.value
+NOT_EQUAL = OpCode.NOT_EQUAL.value
+GREATER = OpCode.GREATER.value
+GREATER_EQUAL = OpCode.GREATER_EQUAL.value
+LESS = OpCode.LESS.value
+LESS_EQUAL = OpCode.LESS_EQUAL.value
+ADD = OpCode.ADD.value
+SUBTRACT = OpCode.SUBTRACT.value
+MULTIPLY = OpCode.MULTIPLY.value
+DIVIDE = OpCode.DIVIDE.value
+NOT = OpCode.NOT.value
+NEGATE = OpCode.NEGATE.value
+OUTPUT = OpCode.OUTPUT.value
+JUMP = OpCode.JUMP.value
+JUMP_IF_FALSE = OpCode.JUMP_IF_FALSE.value
+JUMP_IF_TRUE = OpCode.JUMP_IF_TRUE.value
+POP_JUMP_IF_FALSE = OpCode.POP_JUMP_IF_FALSE.value
+CALL = OpCode.CALL.value
+CLOSURE = OpCode.CLOSURE.value
+CLOSE_UPVALUE = OpCode.CLOSE_UPVALUE.value
+RETURN = OpCode.RETURN.value
+CLASS = OpCode.CLASS.value
+CHECK_SUPERCLASS = OpCode.CHECK_SUPERCLASS.value
+ERROR = OpCode.ERROR.value
+CHECK_NUMBER = OpCode.CHECK_NUMBER.value
+CHECK_STEP = OpCode.CHECK_STEP.value
+GET_METHOD = OpCode.GET_METHOD.value
+CALL_METHOD = OpCode.CALL_METHOD.value
+
+FRAMES_MAX = 4096
+
+subtract = binaryOperations[TokenType.MINUS]
+multiply = binaryOperations[TokenType.STAR]
+divide = binaryOperations[TokenType.SLASH]
+less = binaryOperations[TokenType.LESS]
+lessEqual = binaryOperations[TokenType.LESS_EQUAL]
+greater = binaryOperations[TokenType.GREATER]
+greaterEqual = binaryOperations[TokenType.GREATER_EQUAL]
+
+class VirtualMachine(Interpreter):
+    def __init__(self, disassemble = False):
+        super().__init__()
+        self._compiler = Compiler()
+        self._disassemble = disassemble
+        self._stack = []
+        self._frames = []
+        self._openUpvalues = {}
+
+    def interpret(self, statements):
+        try:
+            function = self._compiler.compileProgram(statements)
+            if self._disassemble:
+                Disassembler().disassemble(function)
+
+            self._stack = []
+            self._frames = []
+            self._openUpvalues = {}
+            self.callClosure(Closure(function, []), None, [])
+        except (RuntimeError, Exception) as error:
+            self._error(error)
+
+    def callClosure(self, closure, receiver, arguments):
+        base = len(self._stack)
+        self._stack.append(receiver if receiver is not None else closure)
+        self._stack.extend(arguments)
+        self._frames.append(CallFrame(closure, base))
+        return self._run(len(self._frames) - 1)
+
+    def _run(self, exitDepth):
+        stack = self._stack
+        frames = self._frames
+        globals = self.globals.getValues()
+
+        frame = frames[-1]
+        code, constants, tokens, upvalues, base = frame.getContext()
+        ip = frame.ip
+
+        while True:
+            op = code[ip]
+            ip += 1
+
+            if op == GET_LOCAL:
+                stack.append(stack[base + code[ip]])
+                ip += 1
+            elif op == CONSTANT:
+                stack.append(constants[code[ip]])
+                ip += 1
+            elif op == SET_LOCAL:
+                stack[base + code[ip]] = stack[-1]
+                ip += 1
+            elif op == POP:
+                stack.pop()
+            elif op == GET_GLOBAL:
+                name = constants[code[ip]]
+                if name not in globals:
+                    raise RuntimeError(tokens[ip - 1], "Undefined vairable '{0}'.".format(name))
+                stack.append(globals[name])
+                ip += 1
+            elif op == POP_JUMP_IF_FALSE:
+                value = stack.pop()
+                if value is None or value is False:
+                    ip = code[ip]
+                else:
+                    ip += 1
+            elif op == JUMP:
+                ip = code[ip]
+            elif op == ADD:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left + right
+                else:
+                    stack[-1] = add(left, right, tokens[ip - 1])
+            elif op == SUBTRACT:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left - right
+                else:
+                    stack[-1] = subtract(left, right, tokens[ip - 1])
+            elif op == LESS:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left < right
+                else:
+                    stack[-1] = less(left, right, tokens[ip - 1])
+            elif op == LESS_EQUAL:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left <= right
+                else:
+                    stack[-1] = lessEqual(left, right, tokens[ip - 1])
+            elif op == GREATER:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left > right
+                else:
+                    stack[-1] = greater(left, right, tokens[ip - 1])
+            elif op == GREATER_EQUAL:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left >= right
+                else:
+                    stack[-1] = greaterEqual(left, right, tokens[ip - 1])
+            elif op == MULTIPLY:
+                right = stack.pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = left * right
+                else:
+                    stack[-1] = multiply(left, right, tokens[ip - 1])
+            elif op == DIVIDE:
+                right = stack.pop()
+                left = stack[-1]
+                stack[-1] = divide(left, right, tokens[ip - 1])
+            elif op == EQUAL:
+                right = stack.pop()
+                stack[-1] = stack[-1] == right
+            elif op == NOT_EQUAL:
+                right = stack.pop()
+                stack[-1] = not stack[-1] == right
+            elif op == GET_UPVALUE:
+                stack.append(upvalues[code[ip]].get(stack))
+                ip += 1
+            elif op == SET_UPVALUE:
+                upvalues[code[ip]].set(stack, stack[-1])
+                ip += 1
+            elif op == JUMP_IF_FALSE:
+                value = stack[-1]
+                if value is None or value is False:
+                    ip = code[ip]
+                else:
+                    ip += 1
+            elif op == JUMP_IF_TRUE:
+                value = stack[-1]
+                if value is None or value is False:
+                    ip += 1
+                else:
+                    ip = code[ip]
+            elif op == CALL or op == CALL_METHOD:
+                argumentCount = code[ip]
+                ip += 1
+                calleeSlot = len(stack) - argumentCount - 1
+
+                if op == CALL_METHOD:
+                    method = stack.pop(calleeSlot)
+                    calleeSlot -= 1
+                    callee = method if method is not None else stack[calleeSlot]
+                else:
+                    callee = stack[calleeSlot]
+
+                if type(callee) is BoundMethod:
+                    stack[calleeSlot] = callee.getReceiver()
+                    callee = callee.getMethod()
+                elif type(callee) is PseudoClass:
+                    stack[calleeSlot] = PseudoInstance(callee)
+                    if callee.getConstructor() == None:
+                        if argumentCount != 0:
+                            self._arityError(tokens[ip - 2], 0, argumentCount)
+                        del stack[calleeSlot + 1 : ]
+                        continue
+                    callee = callee.getConstructor()
+
+                if type(callee) is Closure:
+                    if argumentCount != callee.arity():
+                        self._arityError(tokens[ip - 2], callee.arity(), argumentCount)
+                    if len(frames) >= FRAMES_MAX:
+                        raise RuntimeError(tokens[ip - 2], "Stack overflow.")
+
+                    frame.ip = ip
+                    frame = CallFrame(callee, calleeSlot)
+                    frames.append(frame)
+                    code, constants, tokens, upvalues, base = frame.getContext()
+                    ip = 0
+                    continue
+
+                if not isinstance(callee, PseudoCallable):
+                    raise RuntimeError(tokens[ip - 2], "Can only call function and classes.")
+                if argumentCount != callee.arity():
+                    self._arityError(tokens[ip - 2], callee.arity(), argumentCount)
+
+                arguments = stack[calleeSlot + 1 : ]
+                del stack[calleeSlot : ]
+                stack.append(callee.call(self, arguments, tokens[ip - 2]))
+            elif op == RETURN:
+                result = stack.pop()
+                if len(self._openUpvalues) > 0:
+                    self._closeUpvalues(base)
+                if frame.getClosure().getFunction().isConstructor():
+                    result = stack[base]
+
+                del stack[base : ]
+                frames.pop()
+                if len(frames) == exitDepth:
+                    return result
+
+                stack.append(result)
+                frame = frames[-1]
+                code, constants, tokens, upvalues, base = frame.getContext()
+                ip = frame.ip
+            elif op == NULL:
+                stack.append(None)
+            elif op == TRUE:
+                stack.append(True)
+            elif op == FALSE:
+                stack.append(False)
+            elif op == NOT:
+                value = stack[-1]
+                stack[-1] = value is None or value is False
+            elif op == NEGATE:
+                stack[-1] = negate(stack[-1], tokens[ip - 1])
+            elif op == OUTPUT:
+                print(self.stringify(stack.pop()))
+            elif op == DEFINE_GLOBAL:
+                globals[constants[code[ip]]] = stack.pop()
+                ip += 1
+            elif op == SET_GLOBAL:
+                name = constants[code[ip]]
+                if name not in globals:
+                    raise RuntimeError(tokens[ip - 1], "Undefined vairable '{0}'.".format(name))
+                globals[name] = stack[-1]
+                ip += 1
+            elif op == GET_PROPERTY:
+                cache = constants[code[ip]]
+                object = stack[-1]
+                if not isinstance(object, PseudoInstance):
+                    raise RuntimeError(cache.getIdentifier(), "(Get) Only instances have properties.")
+                stack[-1] = cache.get(object)
+                ip += 1
+            elif op == GET_METHOD:
+                cache = constants[code[ip]]
+                object = stack[-1]
+                method = cache.lookUp(object)
+                if method is None:
+                    if not isinstance(object, PseudoInstance):
+                        raise RuntimeError(cache.getIdentifier(), "(Get) Only instances have properties.")
+                    stack[-1] = object.get(cache.getIdentifier())
+                stack.append(method)
+                ip += 1
+            elif op == SET_PROPERTY:
+                cache = constants[code[ip]]
+                value = stack.pop()
+                object = stack[-1]
+                if not isinstance(object, PseudoInstance):
+                    raise RuntimeError(cache.getIdentifier(), "(Set) Only instances have properties.")
+                cache.set(object, value)
+                stack[-1] = value
+                ip += 1
+            elif op == GET_SUPER:
+                identifier = constants[code[ip]]
+                superClass = stack.pop()
+                method = superClass.findMethod(stack[-1], identifier.getLexeme())
+                if method == None:
+                    raise RuntimeError(identifier, "Undefined property '{0}'.".format(identifier.getLexeme()))
+                stack[-1] = method
+                ip += 1
+            elif op == GET_INDEX:
+                count = code[ip]
+                indices = stack[len(stack) - count : ]
+                del stack[len(stack) - count : ]
+                pseudoList = stack[-1]
+                if not isinstance(pseudoList, indexableTypes):
+                    raise RuntimeError(tokens[ip - 1], "(Get) Only lists can be indexed.")
+                stack[-1] = pseudoList.index(tokens[ip - 1], indices)
+                ip += 1
+            elif op == SET_INDEX:
+                count = code[ip]
+                value = stack.pop()
+                indices = stack[len(stack) - count : ]
+                del stack[len(stack) - count : ]
+                pseudoList = stack[-1]
+                if not isinstance(pseudoList, indexableTypes):
+                    raise RuntimeError(tokens[ip - 1], "(Set) Only lists can be indexed.")
+                pseudoList.set(tokens[ip - 1], indices, value)
+                stack[-1] = None
+                ip += 1
+            elif op == BUILD_LIST:
+                count = code[ip]
+                values = stack[len(stack) - count : ]
+                del stack[len(stack) - count : ]
+                stack.append(PseudoList(values))
+                ip += 1
+            elif op == CLOSURE:
+                function = constants[code[ip]]
+                ip += 1
+                captured = []
+                for i in range(function.getUpvalueCount()):
+                    if code[ip] == 1:
+                        captured.append(self._captureUpvalue(base + code[ip + 1]))
+                    else:
+                        captured.append(upvalues[code[ip + 1]])
+                    ip += 2
+                stack.append(Closure(function, captured))
+            elif op == CLOSE_UPVALUE:
+                self._closeUpvalues(len(stack) - 1)
+                stack.pop()
+            elif op == CLASS:
+                identifier = constants[code[ip]]
+                count = code[ip + 1]
+                hasSuperClass = code[ip + 2] == 1
+                ip += 3
+
+                methods = {}
+                for method in stack[len(stack) - count : ]:
+                    methods[method.getFunction().getIdentifier()] = method
+                del stack[len(stack) - count : ]
+
+                stack.append(PseudoClass(identifier, stack[-1] if hasSuperClass else None, methods))
+            elif op == CHECK_SUPERCLASS:
+                if not isinstance(stack[-1], PseudoClass):
+                    raise RuntimeError(tokens[ip - 1], "Super class must be a class.")
+            elif op == ERROR:
+                raise RuntimeError(tokens[ip - 1], constants[code[ip]])
+            elif op == CHECK_NUMBER:
+                loopBound(stack[-1], tokens[ip - 1])
+            elif op == CHECK_STEP:
+                loopStep(stack[-1], tokens[ip - 1])
+
+    def _captureUpvalue(self, location):
+        upvalue = self._openUpvalues.get(location, None)
+        if upvalue == None:
+            upvalue = Upvalue(location)
+            self._openUpvalues[location] = upvalue
+        return upvalue
+
+    def _closeUpvalues(self, location):
+        for index in [index for index in self._openUpvalues if index >= location]:
+            self._openUpvalues.pop(index).close(self._stack)
+
+    def _arityError(self, parentheses, arity, argumentCount):
+        raise RuntimeError(parentheses, "Expected {0} arguments, but got {1} arguments".format(arity, argumentCount))
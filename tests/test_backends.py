@@ -0,0 +1,195 @@
+import io as IO
+import unittest as UnitTest
+from contextlib import redirect_stdout as redirectOutput
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.parser.Parser import Parser
+from pyPseudo.resolver.Resolver import Resolver
+from pyPseudo.interpreter.Interpreter import Interpreter
+from pyPseudo.compiler.ClosureInterpreter import ClosureInterpreter
+from pyPseudo.transpiler.TranspilingInterpreter import TranspilingInterpreter
+from pyPseudo.vm.VirtualMachine import VirtualMachine
+
+backends = [Interpreter, ClosureInterpreter, TranspilingInterpreter, VirtualMachine]
+
+def run(source, backend):
+    interpreter = backend()
+    statements = Parser(Lexer(source, "TEST").scanTokens()).parse()
+    Resolver(interpreter).resolveSource(statements)
+
+    output = IO.StringIO()
+    with redirectOutput(output):
+        interpreter.interpret(statements)
+        for error in interpreter.getErrors():
+            print(error.report() if hasattr(error, "report") else "Python Error: {0}".format(error))
+
+    return output.getvalue().splitlines()
+
+class BackendTest(UnitTest.TestCase):
+    def assertBackendsAgree(self, source, expected):
+        for backend in backends:
+            with self.subTest(backend=backend.__name__):
+                self.assertEqual(run(source, backend), expected)
+
+    def testNumberDisplay(self):
+        self.assertBackendsAgree(
+            "OUTPUT 1 + 2\nOUTPUT 7 / 2\nOUTPUT 6 / 3\nOUTPUT 1.5 * 2\nOUTPUT 0.1 + 0.2\nOUTPUT 0 * -1\nOUTPUT 0 * -1.0\nOUTPUT {1, 2.5}\n",
+            ["3", "3.5", "2", "3", "0.30000000000000004", "0", "-0", "{1.0, 2.5}"]
+        )
+
+    def testCountedLoops(self):
+        self.assertBackendsAgree(
+            "FOR VAR i <- 1 TO 3 DO\n    OUTPUT i\nENDFOR\n"
+            "FOR VAR i <- 3 DOWNTO 1 DO\n    OUTPUT i\nENDFOR\n"
+            "FOR VAR i <- 0 TO 1 STEP 0.5 DO\n    OUTPUT i\nENDFOR\n"
+            "FOR VAR i <- 10 DOWNTO 0 STEP 4 DO\n    OUTPUT i\nENDFOR\n",
+            ["1", "2", "3", "3", "2", "1", "0", "0.5", "1", "10", "6", "2"]
+        )
+
+    def testZeroStepIsReported(self):
+        source = "FOR VAR i <- 1 TO 3 STEP 0 DO\n    OUTPUT i\nENDFOR\n"
+        expected = run(source, Interpreter)
+        self.assertEqual(len(expected), 1)
+        self.assertIn("FOR loop step must be positive.", expected[0])
+        self.assertBackendsAgree(source, expected)
+
+    def testClosuresInLoopBodies(self):
+        self.assertBackendsAgree(
+            "VAR functions <- {0}\n"
+            "FOR VAR i <- 1 TO 3 DO\n"
+            "    VAR captured <- i * 10\n"
+            "    FUNCTION get()\n"
+            "        RETURN captured + i\n"
+            "    ENDFUNCTION\n"
+            "    functions <- APPEND(functions, get)\n"
+            "ENDFOR\n"
+            "FOR VAR j <- 1 TO 3 DO\n"
+            "    VAR get <- functions[j]\n"
+            "    OUTPUT get()\n"
+            "ENDFOR\n",
+            ["14", "24", "34"]
+        )
+
+    def testIntegerFastPaths(self):
+        self.assertBackendsAgree(
+            "VAR big <- 1\n"
+            "FOR VAR i <- 1 TO 70 DO\n"
+            "    big <- big * 2\n"
+            "ENDFOR\n"
+            "OUTPUT big\n"
+            "OUTPUT big + 0.5 > big\n"
+            "OUTPUT 3 + 0.5\n"
+            "OUTPUT 3 - 1.0\n"
+            "OUTPUT 1 / 3 * 3\n"
+            "OUTPUT 2 < 2.5\n"
+            "OUTPUT -(2 * 3)\n"
+            "OUTPUT -(1.5)\n",
+            ["1180591620717411303424", "FALSE", "3.5", "2", "1", "TRUE", "-6", "-1.5"]
+        )
+
+    def testSharedLoopEnvironments(self):
+        self.assertBackendsAgree(
+            "VAR total <- 0\n"
+            "FOR VAR i <- 1 TO 3 DO\n"
+            "    VAR row <- i\n"
+            "    FOR VAR j <- 1 TO i DO\n"
+            "        VAR cell <- row * j\n"
+            "        total <- total + cell\n"
+            "    ENDFOR\n"
+            "    VAR seen\n"
+            "    OUTPUT seen\n"
+            "    seen <- row\n"
+            "ENDFOR\n"
+            "OUTPUT total\n"
+            "FOR VAR k <- 1 TO 3 DO\n"
+            "    OUTPUT k\n"
+            "    k <- k + 0.5\n"
+            "ENDFOR\n",
+            ["NULL", "NULL", "NULL", "25", "1", "2.5"]
+        )
+
+    def testSuper(self):
+        self.assertBackendsAgree(
+            "CLASS Base\n"
+            "    FUNCTION Base(v)\n"
+            "        THIS.v <- v\n"
+            "    ENDFUNCTION\n"
+            "    FUNCTION get()\n"
+            "        RETURN THIS.v\n"
+            "    ENDFUNCTION\n"
+            "ENDCLASS\n"
+            "CLASS Child INHERITS Base\n"
+            "    FUNCTION Child(v)\n"
+            "        SUPER.Base(v * 2)\n"
+            "    ENDFUNCTION\n"
+            "    FUNCTION get()\n"
+            "        RETURN SUPER.get() + 1\n"
+            "    ENDFUNCTION\n"
+            "ENDCLASS\n"
+            "OUTPUT Child(4).get()\n"
+            "OUTPUT Base(4).get()\n",
+            ["9", "4"]
+        )
+
+    def testPropertyAndMethodCaches(self):
+        self.assertBackendsAgree(
+            "CLASS A\n"
+            "    FUNCTION A()\n"
+            "        THIS.x <- 1\n"
+            "    ENDFUNCTION\n"
+            "    FUNCTION name()\n"
+            "        RETURN \"A\"\n"
+            "    ENDFUNCTION\n"
+            "ENDCLASS\n"
+            "CLASS B INHERITS A\n"
+            "    FUNCTION B()\n"
+            "        THIS.x <- 2\n"
+            "    ENDFUNCTION\n"
+            "    FUNCTION name()\n"
+            "        RETURN \"B\"\n"
+            "    ENDFUNCTION\n"
+            "ENDCLASS\n"
+            "FUNCTION describe(object)\n"
+            "    RETURN object.name() + \" \" + STR(object.x)\n"
+            "ENDFUNCTION\n"
+            "VAR a <- A()\n"
+            "VAR objects <- {a, B(), a, B()}\n"
+            "FOR VAR i <- 0 TO 3 DO\n"
+            "    OUTPUT describe(objects[i])\n"
+            "ENDFOR\n"
+            "FUNCTION other()\n"
+            "    RETURN \"field\"\n"
+            "ENDFUNCTION\n"
+            "a.name <- other\n"
+            "OUTPUT describe(a)\n",
+            ["A 1", "B 2", "A 1", "B 2", "field 1"]
+        )
+
+    def testReportedErrors(self):
+        for source in [
+            "OUTPUT 1\nOUTPUT 1 + \"a\"\nOUTPUT 2\n",
+            "FUNCTION f(a)\n    RETURN a\nENDFUNCTION\nOUTPUT f(1, 2)\n",
+            "VAR l <- {1, 2}\nOUTPUT l[2]\n",
+            "VAR x <- 1\nOUTPUT x()\n",
+            "CLASS A\nENDCLASS\nOUTPUT A().missing\n",
+            "FOR VAR i <- 1 TO \"a\" DO\nENDFOR\n"
+        ]:
+            with self.subTest(source=source):
+                expected = run(source, Interpreter)
+                self.assertGreater(len(expected), 0)
+                self.assertBackendsAgree(source, expected)
+
+    def testTranspilerFallback(self):
+        self.assertBackendsAgree(
+            "FOR VAR i <- 1 TO 2 DO\n"
+            "    VAR local <- i\n"
+            "    FUNCTION get()\n"
+            "        RETURN local\n"
+            "    ENDFUNCTION\n"
+            "    OUTPUT get()\n"
+            "ENDFOR\n",
+            ["1", "2"]
+        )
+
+if __name__ == "__main__":
+    UnitTest.main()
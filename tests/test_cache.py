@@ -0,0 +1,77 @@
+import os as OS
+import tempfile as TempFile
+import unittest as UnitTest
+from unittest import mock as Mock
+
+import pyPseudo.cache.ProgramCache as ProgramCacheModule
+from pyPseudo.cache.ProgramCache import ProgramCache
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.parser.Parser import Parser
+from pyPseudo.parser.ModuleCache import ModuleCache
+from pyPseudo.resolver.Resolver import Resolver
+from pyPseudo.resolver.Resolution import Resolution
+
+def write(path, source):
+    with open(path, "w") as file:
+        file.write(source)
+
+def store(path, source):
+    modules = ModuleCache()
+    modules.add(path, None)
+    statements = Parser(Lexer(source, path).scanTokens(), None, modules).parse()
+
+    resolution = Resolution()
+    Resolver(resolution).resolveSource(statements)
+
+    return ProgramCache(path).store(source, modules, statements, resolution)
+
+class ProgramCacheTest(UnitTest.TestCase):
+    def setUp(self):
+        self._directory = TempFile.TemporaryDirectory()
+        self._workingDirectory = OS.getcwd()
+        OS.chdir(self._directory.name)
+
+        self._module = OS.path.join(self._directory.name, "module.pseudo")
+        write(self._module, "FUNCTION helper(x)\n    RETURN x * 2\nENDFUNCTION\n")
+
+        self._path = OS.path.join(self._directory.name, "main.pseudo")
+        self._source = "IMPORT \"module.pseudo\"\nOUTPUT helper(21)\n"
+        write(self._path, self._source)
+        self.assertTrue(store(self._path, self._source))
+
+    def tearDown(self):
+        OS.chdir(self._workingDirectory)
+        self._directory.cleanup()
+
+    def testLoadsUnchangedProgram(self):
+        program = ProgramCache(self._path).load(self._source)
+        self.assertNotEqual(program, None)
+
+        statements, resolution = program
+        self.assertEqual(len(statements), 2)
+
+    def testRejectsChangedProgram(self):
+        self.assertEqual(ProgramCache(self._path).load(self._source + "OUTPUT 1\n"), None)
+
+    def testRejectsChangedModule(self):
+        write(self._module, "FUNCTION helper(x)\n    RETURN x * 3\nENDFUNCTION\n")
+        self.assertEqual(ProgramCache(self._path).load(self._source), None)
+
+    def testRejectsImportsResolvingElsewhere(self):
+        elsewhere = OS.path.join(self._directory.name, "elsewhere")
+        OS.mkdir(elsewhere)
+        write(OS.path.join(elsewhere, "module.pseudo"), "FUNCTION helper(x)\n    RETURN x\nENDFUNCTION\n")
+
+        OS.chdir(elsewhere)
+        self.assertEqual(ProgramCache(self._path).load(self._source), None)
+
+    def testRejectsDifferentKey(self):
+        with Mock.patch.object(ProgramCacheModule, "_version", "other"):
+            self.assertEqual(ProgramCache(self._path).load(self._source), None)
+
+    def testMissingEntry(self):
+        self.assertEqual(ProgramCache(self._module).load("OUTPUT 1\n"), None)
+
+if __name__ == "__main__":
+    UnitTest.main()
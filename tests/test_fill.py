@@ -0,0 +1,32 @@
+import io as IO
+import unittest as UnitTest
+from contextlib import redirect_stdout as redirectOutput
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.parser.Parser import Parser
+from pyPseudo.resolver.Resolver import Resolver
+from pyPseudo.interpreter.Interpreter import Interpreter
+
+def run(source):
+    interpreter = Interpreter()
+    statements = Parser(Lexer(source, "TEST").scanTokens()).parse()
+    Resolver(interpreter).resolveSource(statements)
+
+    output = IO.StringIO()
+    with redirectOutput(output):
+        interpreter.interpret(statements)
+
+    return output.getvalue().splitlines()
+
+class FillTest(UnitTest.TestCase):
+    def testListRowsAreIndependent(self):
+        self.assertEqual(run("VAR rows <- FILL(2, {1, 2})\nrows[0, 1] <- 9\nOUTPUT rows\n"), ["{{1.0, 9.0}, {1.0, 2.0}}"])
+
+    def testArrayRowsAreIndependent(self):
+        self.assertEqual(run("VAR rows <- FILL(3, ARRAY(2, 0))\nrows[1, 0] <- 5\nOUTPUT rows\n"), ["{{0.0, 0.0}, {5.0, 0.0}, {0.0, 0.0}}"])
+
+    def testMapRowsAreIndependent(self):
+        self.assertEqual(run("VAR rows <- FILL(2, MAP())\nVAR row <- PUT(rows[0], \"a\", 1)\nOUTPUT rows\n"), ["{{a: 1.0}, {}}"])
+
+if __name__ == "__main__":
+    UnitTest.main()
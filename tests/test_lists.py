@@ -0,0 +1,116 @@
+import io as IO
+import unittest as UnitTest
+from contextlib import redirect_stdout as redirectOutput
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.parser.Parser import Parser
+from pyPseudo.resolver.Resolver import Resolver
+from pyPseudo.interpreter.Interpreter import Interpreter
+from pyPseudo.interpreter.PseudoList import PseudoList
+
+def run(source):
+    interpreter = Interpreter()
+    statements = Parser(Lexer(source, "TEST").scanTokens()).parse()
+    Resolver(interpreter).resolveSource(statements)
+
+    output = IO.StringIO()
+    with redirectOutput(output):
+        interpreter.interpret(statements)
+
+    return output.getvalue().splitlines()
+
+class NestedValueTest(UnitTest.TestCase):
+    def testAppendCopiesNestedArrays(self):
+        source = "\n".join([
+            "VAR a <- ARRAY(3, 0)",
+            "VAR l <- {a, 1}",
+            "VAR l2 <- APPEND(l, 2)",
+            "VAR b <- l2[0]",
+            "b[0] <- 5",
+            "OUTPUT l[0]",
+            "OUTPUT l2[0]"
+        ])
+        self.assertEqual(run(source), ["{0.0, 0.0, 0.0}", "{5.0, 0.0, 0.0}"])
+
+    def testAppendCopiesNestedMaps(self):
+        source = "\n".join([
+            "VAR k <- {MAP()}",
+            "VAR k2 <- APPEND(k, 1)",
+            "VAR m <- PUT(k2[0], \"x\", 1)",
+            "OUTPUT HAS(k[0], \"x\")",
+            "OUTPUT HAS(k2[0], \"x\")"
+        ])
+        self.assertEqual(run(source), ["FALSE", "TRUE"])
+
+class ListStorageTest(UnitTest.TestCase):
+    def testAppendWithLiveAlias(self):
+        source = "\n".join([
+            "VAR l <- {1, 2}",
+            "VAR alias <- l",
+            "l <- APPEND(l, 3)",
+            "alias <- APPEND(alias, 4)",
+            "VAR other <- APPEND(l, 5)",
+            "l <- APPEND(l, 6)",
+            "OUTPUT l",
+            "OUTPUT alias",
+            "OUTPUT other"
+        ])
+        self.assertEqual(run(source), ["{1.0, 2.0, 3.0, 6.0}", "{1.0, 2.0, 4.0}", "{1.0, 2.0, 3.0, 5.0}"])
+
+    def testWriteThroughSlice(self):
+        source = "\n".join([
+            "VAR l <- {1, 2, 3, 4}",
+            "VAR s <- SLICE(l, 1, 3)",
+            "s[0] <- 9",
+            "l[2] <- 8",
+            "s <- APPEND(s, 7)",
+            "OUTPUT l",
+            "OUTPUT s"
+        ])
+        self.assertEqual(run(source), ["{1.0, 2.0, 8.0, 4.0}", "{9.0, 3.0, 7.0}"])
+
+    def testRemoveFirstAsQueue(self):
+        source = "\n".join([
+            "VAR q <- {0}",
+            "VAR total <- 0",
+            "FOR VAR i <- 1 TO 100 DO",
+            "    q <- APPEND(q, i)",
+            "    total <- total + q[0]",
+            "    q <- REMOVE(q, 0)",
+            "ENDFOR",
+            "OUTPUT total",
+            "OUTPUT q"
+        ])
+        self.assertEqual(run(source), ["4950", "{100.0}"])
+
+    def testQueueStorageStaysSmall(self):
+        queue = PseudoList([0])
+        for value in range(1, 1000):
+            queue = queue.append(value).remove(None, 0)
+
+        self.assertEqual(queue.getValues(), [999])
+        self.assertLess(len(queue._storage.getValues()), 8)
+
+    def testNestedLists(self):
+        source = "\n".join([
+            "VAR grid <- {{1, 2}, {3, 4}, {6}}",
+            "VAR more <- APPEND(grid, {5})",
+            "more[0, 0] <- 9",
+            "VAR rest <- REMOVE(grid, 1)",
+            "rest[0, 1] <- 8",
+            "VAR part <- SLICE(grid, 1, 2)",
+            "part[0, 0] <- 7",
+            "OUTPUT grid",
+            "OUTPUT more",
+            "OUTPUT rest",
+            "OUTPUT part"
+        ])
+        self.assertEqual(run(source), [
+            "{{1.0, 2.0}, {3.0, 4.0}, {6.0}}",
+            "{{9.0, 2.0}, {3.0, 4.0}, {6.0}, {5.0}}",
+            "{{1.0, 8.0}, {6.0}}",
+            "{{7.0, 4.0}}"
+        ])
+
+if __name__ == "__main__":
+    UnitTest.main()
@@ -0,0 +1,72 @@
+import io as IO
+import unittest as UnitTest
+from contextlib import redirect_stdout as redirectOutput
+
+from pyPseudo.error.TranspileError import TranspileError
+
+from pyPseudo.lexer.Lexer import Lexer
+from pyPseudo.parser.Parser import Parser
+from pyPseudo.resolver.Resolver import Resolver
+from pyPseudo.transpiler.Transpiler import Transpiler
+from pyPseudo.transpiler.TranspilingInterpreter import TranspilingInterpreter
+
+def parse(source, interpreter):
+    statements = Parser(Lexer(source, "TEST").scanTokens()).parse()
+    Resolver(interpreter).resolveSource(statements)
+    return statements
+
+def transpile(source):
+    interpreter = TranspilingInterpreter()
+    code, constants = Transpiler(interpreter).transpile(parse(source, interpreter))
+    return code
+
+def run(source):
+    interpreter = TranspilingInterpreter()
+    statements = parse(source, interpreter)
+
+    output = IO.StringIO()
+    with redirectOutput(output):
+        interpreter.interpret(statements)
+        for error in interpreter.getErrors():
+            print(error.report() if hasattr(error, "report") else "Python Error: {0}".format(error))
+
+    return output.getvalue().splitlines()
+
+class TranspilerTest(UnitTest.TestCase):
+    def testIntegerGuards(self):
+        source = "FUNCTION add(a, b)\n    RETURN a + b\nENDFUNCTION\nOUTPUT add(1, 2)\nOUTPUT add(1, 0.5)\nOUTPUT add(\"a\", \"b\")\nOUTPUT add(1, \"b\")\n"
+        self.assertIn("is _int", transpile(source))
+        self.assertEqual(run(source)[ : 3], ["3", "1.5", "ab"])
+        self.assertIn("Operands must be two numbers", run(source)[3])
+
+    def testGuardEvaluatesOperandsOnce(self):
+        source = "VAR count <- 0\nFUNCTION next()\n    count <- count + 1\n    RETURN count\nENDFUNCTION\nOUTPUT next() + next()\nOUTPUT count\n"
+        self.assertEqual(run(source), ["3", "2"])
+
+    def testLoopBodyCaptureFallsBack(self):
+        source = "FOR VAR i <- 1 TO 2 DO\n    VAR local <- i\n    FUNCTION get()\n        RETURN local\n    ENDFUNCTION\n    OUTPUT get()\nENDFOR\n"
+        with self.assertRaises(TranspileError):
+            transpile(source)
+        self.assertEqual(run(source), ["1", "2"])
+
+    def testKeywordAndBuiltinNames(self):
+        source = (
+            "VAR lambda <- 1\n"
+            "VAR print <- 2\n"
+            "VAR len <- 3\n"
+            "FUNCTION class(def)\n"
+            "    VAR None <- def\n"
+            "    lambda <- lambda + None\n"
+            "    RETURN lambda\n"
+            "ENDFUNCTION\n"
+            "OUTPUT class(5)\n"
+            "OUTPUT (lambda <- lambda + 1) + print + len\n"
+            "FOR VAR True <- 1 TO 2 DO\n"
+            "    OUTPUT True\n"
+            "ENDFOR\n"
+        )
+        compile(transpile(source), "<pseudo>", "exec")
+        self.assertEqual(run(source), ["6", "12", "1", "2"])
+
+if __name__ == "__main__":
+    UnitTest.main()